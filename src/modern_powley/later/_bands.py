@@ -0,0 +1,106 @@
+"""Compiled lookup over one-dimensional bands with per-endpoint inclusivity.
+
+The distinct finite endpoints split the real line into alternating open
+intervals and single points. Which bands contain each of those pieces is
+settled once when the index is built, so a lookup is a bisection into the
+endpoints followed by a table read.
+"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+
+
+class Band(Protocol):
+    lower: float | None
+    upper: float | None
+
+    def includes(self, value: float) -> bool: ...
+
+
+@dataclass(frozen=True)
+class BandIndex:
+    """Band positions containing each endpoint-delimited piece of the line.
+
+    ``pieces[2 * i]`` lies below ``endpoints[i]`` (above the previous one) and
+    ``pieces[2 * i + 1]`` is ``endpoints[i]`` itself; the last piece lies
+    above every endpoint.
+    """
+
+    endpoints: tuple[float, ...]
+    pieces: tuple[tuple[int, ...], ...]
+    membership: np.ndarray
+
+    def piece(self, value: float) -> int:
+        position = bisect_left(self.endpoints, value)
+        if position < len(self.endpoints) and self.endpoints[position] == value:
+            return 2 * position + 1
+        return 2 * position
+
+    def positions(self, value: float) -> tuple[int, ...]:
+        """Return the positions of every band containing ``value``."""
+        return self.pieces[self.piece(value)]
+
+    def piece_batch(self, values: object) -> np.ndarray:
+        grid = np.asarray(self.endpoints, dtype=np.float64)
+        array = np.asarray(values, dtype=np.float64)
+        position = np.searchsorted(grid, array, side="left")
+        exact = np.zeros(array.shape, dtype=bool)
+        inside = position < grid.size
+        exact[inside] = grid[position[inside]] == array[inside]
+        return 2 * position + exact
+
+    def membership_batch(self, values: object) -> np.ndarray:
+        """Boolean band membership with bands on a new trailing axis."""
+        return self.membership[self.piece_batch(values)]
+
+    def is_partition(self) -> bool:
+        return all(len(positions) == 1 for positions in self.pieces)
+
+
+def compile_bands(bands: Sequence[Band]) -> BandIndex:
+    """Compile bands, resolving membership of every piece by their own ``includes``."""
+    endpoints = tuple(sorted({float(bound) for band in bands for bound in (band.lower, band.upper) if bound is not None}))
+    samples: list[float] = []
+    for position, endpoint in enumerate(endpoints):
+        below = endpoint - 1.0 if position == 0 else (endpoints[position - 1] + endpoint) / 2.0
+        samples += [below, endpoint]
+    samples.append(endpoints[-1] + 1.0 if endpoints else 0.0)
+    pieces = tuple(tuple(position for position, band in enumerate(bands) if band.includes(sample)) for sample in samples)
+    membership = np.zeros((len(pieces), len(bands)), dtype=bool)
+    for piece, positions in enumerate(pieces):
+        membership[piece, list(positions)] = True
+    membership.setflags(write=False)
+    return BandIndex(endpoints, pieces, membership)
+
+
+@dataclass(frozen=True)
+class PartitionIndex:
+    """A band index proven at build time to assign every value exactly one band."""
+
+    bands: BandIndex
+    band_of_piece: np.ndarray
+
+    def position(self, value: float) -> int:
+        return int(self.band_of_piece[self.bands.piece(value)])
+
+    def position_batch(self, values: object) -> np.ndarray:
+        return self.band_of_piece[self.bands.piece_batch(values)]
+
+
+def compile_partition(bands: Sequence[Band], message: str) -> PartitionIndex:
+    """Compile bands that must form a total non-overlapping partition.
+
+    Raises ``RuntimeError`` with ``message`` when any piece of the line is
+    covered by zero or several bands.
+    """
+
+    index = compile_bands(bands)
+    if not index.is_partition():
+        raise RuntimeError(message)
+    band_of_piece = np.array([positions[0] for positions in index.pieces], dtype=np.int64)
+    band_of_piece.setflags(write=False)
+    return PartitionIndex(index, band_of_piece)
@@ -0,0 +1,73 @@
+"""Shared per-row failure bookkeeping for the array replays of later sources."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+OVERFLOW_MESSAGE = "numerical result out of range"
+ZERO_DIVISION_MESSAGE = "float division by zero"
+
+
+class RowFailures:
+    """First-failure bookkeeping that follows the scalar raise order per row.
+
+    Intermediate values and masks keep the smallest shape their inputs
+    broadcast to, so a term that does not depend on a swept axis is computed
+    once; ``finish`` and ``error_masks`` expand to the full result shape.
+    """
+
+    def __init__(self, shape: tuple[int, ...]) -> None:
+        self.shape = shape
+        self.failed = np.zeros((), dtype=bool)
+        self.errors: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def broadcast(cls, *columns: object):
+        return cls(np.broadcast_shapes(*(np.shape(column) for column in columns)))
+
+    def flag(self, message: str, mask: np.ndarray) -> None:
+        new = np.logical_and(mask, ~self.failed)
+        if new.any():
+            previous = self.errors.get(message)
+            self.errors[message] = new if previous is None else previous | new
+            self.failed = self.failed | new
+
+    def column(self, values: object) -> np.ndarray:
+        return np.asarray(values, dtype=np.float64)
+
+    def power(self, base: np.ndarray, exponent: float) -> np.ndarray:
+        # float_power evaluates through libm pow, as Python float ** does; NumPy's SIMD
+        # power may differ in the last bit. Every caller validates the base as positive
+        # first, so other operands belong to failed rows.
+        base = np.asarray(base, dtype=np.float64)
+        values = np.float_power(np.where(np.isfinite(base) & (base > 0), base, 1.0), exponent)
+        self.flag(OVERFLOW_MESSAGE, np.isinf(values))
+        return values
+
+    def finish(self, values: np.ndarray, fill: float = np.nan) -> np.ndarray:
+        return np.where(self.failed, fill, np.broadcast_to(values, self.shape))
+
+    def error_masks(self) -> dict[str, np.ndarray]:
+        return {message: np.broadcast_to(mask, self.shape).copy() for message, mask in self.errors.items()}
+
+
+def failure_reasons(errors: dict[str, np.ndarray], shape: tuple[int, ...]) -> np.ndarray:
+    """Return one reason string per row; accepted rows hold an empty string."""
+
+    reasons = np.full(shape, "", dtype=object)
+    for message, mask in errors.items():
+        reasons[mask] = message
+    return reasons
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    values: np.ndarray
+    errors: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def invalid(self) -> np.ndarray:
+        mask = np.zeros(np.shape(self.values), dtype=bool)
+        for rows in self.errors.values():
+            mask |= rows
+        return mask
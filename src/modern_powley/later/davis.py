@@ -6,13 +6,17 @@ not loading recommendations.
 """
 
 import csv
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from functools import lru_cache
 from math import isfinite, sqrt
 from pathlib import Path
 
 from modern_powley.provenance.validation import MissingProvenanceError
 
+from ._bands import compile_bands
+
 SOURCE_ID = "SRC-DAVIS-1981"
 TABLE4_SOURCE_ID = "SRC-DAVIS-1981-TABLE4"
 TABLE4_SOURCE_CLASSIFICATION = "normalized_historical_transcription"
@@ -30,6 +34,8 @@ DAVIS_RELATIVE_QUICKNESS = {
     "IMR 4831": 95,
 }
 TABLE4_PATH = Path(__file__).resolve().parents[3] / "data/reference/davis_1981_table4.csv"
+# Bump whenever load_table4 validation changes so stale binary caches are rebuilt.
+TABLE4_VALIDATOR_VERSION = 1
 
 
 def _finite(value: float, name: str) -> float:
@@ -263,29 +269,37 @@ class Table4:
     confidence: str
     mass_ratios: tuple[float, ...]
     rows: tuple[Table4Row, ...]
+    expansion_ratios: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "expansion_ratios", tuple(row.expansion_ratio for row in self.rows))
 
 
 @lru_cache(maxsize=1)
 def load_table4() -> Table4:
     """Load the bounded, medium-confidence normalized Davis Table 4 transcription."""
+    with TABLE4_PATH.open(newline="", encoding="utf-8") as handle:
+        return _parse_table4(handle)
+
+
+def _parse_table4(lines: Iterable[str]) -> Table4:
     mass_ratios = (0.20, 0.30, 0.40, 0.50, 0.60, 0.70, 0.80, 0.90, 1.00)
     value_columns = tuple(f"mass_ratio_{value:.2f}".replace(".", "_") for value in mass_ratios)
-    with TABLE4_PATH.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        expected_fieldnames = (
-            "table_id",
-            "source_id",
-            "authority_source_id",
-            "source_location",
-            "source_classification",
-            "verification_status",
-            "confidence",
-            "expansion_ratio",
-            *value_columns,
-        )
-        if tuple(reader.fieldnames or ()) != expected_fieldnames:
-            raise ValueError("Davis Table 4 column grid or metadata schema is inconsistent")
-        source_rows = list(reader)
+    reader = csv.DictReader(lines)
+    expected_fieldnames = (
+        "table_id",
+        "source_id",
+        "authority_source_id",
+        "source_location",
+        "source_classification",
+        "verification_status",
+        "confidence",
+        "expansion_ratio",
+        *value_columns,
+    )
+    if tuple(reader.fieldnames or ()) != expected_fieldnames:
+        raise ValueError("Davis Table 4 column grid or metadata schema is inconsistent")
+    source_rows = list(reader)
     if len(source_rows) != 34:
         raise ValueError("Davis Table 4 must contain exactly 34 expansion-ratio rows")
 
@@ -338,14 +352,13 @@ def load_table4() -> Table4:
 def _bracket(value: float, grid: tuple[float, ...], name: str) -> tuple[int, int, float]:
     if value < grid[0] or value > grid[-1]:
         raise ValueError(f"{name} is outside Davis Table 4")
-    for index, grid_value in enumerate(grid):
-        if abs(value - grid_value) < 1e-12:
-            return index, index, 0.0
-        if value < grid_value:
-            lower_index = index - 1
-            fraction = (value - grid[lower_index]) / (grid_value - grid[lower_index])
-            return lower_index, index, fraction
-    return len(grid) - 1, len(grid) - 1, 0.0
+    index = bisect_left(grid, value)
+    for candidate in (index - 1, index):
+        if 0 <= candidate < len(grid) and abs(value - grid[candidate]) < 1e-12:
+            return candidate, candidate, 0.0
+    lower_index = index - 1
+    fraction = (value - grid[lower_index]) / (grid[index] - grid[lower_index])
+    return lower_index, index, fraction
 
 
 def pressure_terms(
@@ -406,9 +419,8 @@ def lookup_table4_f2(mass_ratio_value: float, expansion_ratio_value: float) -> f
     mass_ratio_number = _positive(mass_ratio_value, "mass_ratio")
     ratio = _positive(expansion_ratio_value, "expansion_ratio")
     table = load_table4()
-    expansion_ratios = tuple(row.expansion_ratio for row in table.rows)
     a0, a1, a_fraction = _bracket(mass_ratio_number, table.mass_ratios, "mass_ratio")
-    r0, r1, r_fraction = _bracket(ratio, expansion_ratios, "expansion_ratio")
+    r0, r1, r_fraction = _bracket(ratio, table.expansion_ratios, "expansion_ratio")
 
     lower_at_a0 = table.rows[r0].f2_values[a0]
     lower_at_a1 = table.rows[r0].f2_values[a1]
@@ -476,7 +488,10 @@ TRANSCRIBED_BANDS = (
 )
 
 
+TRANSCRIBED_BAND_INDEX = compile_bands(TRANSCRIBED_BANDS)
+
+
 def matching_transcribed_bands(index: float) -> tuple[TranscribedBand, ...]:
     """Return every secondary Table 3 band matching an unresolved endpoint."""
     value = _positive(index, "index")
-    return tuple(band for band in TRANSCRIBED_BANDS if band.includes(value))
+    return tuple(TRANSCRIBED_BANDS[position] for position in TRANSCRIBED_BAND_INDEX.positions(value))
@@ -0,0 +1,257 @@
+"""Columnar replay of the Davis 1981 formulation chain.
+
+Each computed column reproduces the scalar function of the same name in
+``modern_powley.later.davis`` bit for bit. A row that the scalar chain would
+reject keeps the exact first ``ValueError`` message as its failure reason and
+holds NaN in every computed column; other rows are unaffected.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+from ._batch import BatchResult, RowFailures, failure_reasons
+from .davis import DAVIS_RELATIVE_QUICKNESS, WATER_GRAINS_PER_CUBIC_INCH, Table4, load_table4
+
+REQUIRED_COLUMNS = (
+    "case_length_inches",
+    "bullet_length_inches",
+    "cartridge_oal_inches",
+    "gross_case_capacity_water_grains",
+    "bullet_diameter_inches",
+    "bullet_weight_grains",
+    "barrel_length_from_bolt_face_inches",
+    "powder_designation",
+)
+BOAT_TAIL_COLUMNS = ("boat_tail_height_inches", "boat_tail_small_diameter_inches")
+VELOCITY_COLUMNS = (
+    "seating_depth_inches",
+    "flat_base_displacement_water_grains",
+    "boat_tail_correction_water_grains",
+    "loaded_powder_space_capacity_water_grains",
+    "bullet_travel_inches",
+    "powder_chamber_volume_cubic_inches",
+    "effective_bore_volume_cubic_inches",
+    "expansion_ratio",
+    "initial_charge_weight_grains",
+    "mass_ratio",
+    "sectional_density",
+    "powder_selection_index",
+    "velocity_fraction_m",
+    "velocity_fraction_n",
+    "effective_moving_weight_grains",
+    "muzzle_velocity_fps",
+)
+PRESSURE_COLUMNS = ("table4_f2", "k1", "k2", "k3", "historical_crusher_pressure")
+_REDUCED_DENSITY_POWDERS = ("IMR 4198", "IMR 4227")
+
+
+class _Rows(RowFailures):
+    """Davis validation messages on top of the shared row bookkeeping."""
+
+    def finite(self, values: np.ndarray, name: str) -> np.ndarray:
+        self.flag(f"{name} must be finite", ~np.isfinite(values))
+        return values
+
+    def positive(self, values: np.ndarray, name: str) -> np.ndarray:
+        self.finite(values, name)
+        self.flag(f"{name} must be positive", values <= 0)
+        return values
+
+    def nonnegative(self, values: np.ndarray, name: str) -> np.ndarray:
+        self.finite(values, name)
+        self.flag(f"{name} must be nonnegative", values < 0)
+        return values
+
+
+@dataclass(frozen=True)
+class DavisBatch:
+    """Every Davis intermediate as an aligned column plus per-row failures."""
+
+    columns: dict[str, np.ndarray]
+    errors: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def invalid(self) -> np.ndarray:
+        return np.isnan(self.columns["muzzle_velocity_fps"])
+
+    @property
+    def reasons(self) -> np.ndarray:
+        return failure_reasons(self.errors, self.invalid.shape)
+
+    def to_frame(self):
+        """Return the columns and failure reasons as a pandas DataFrame."""
+        import pandas as pd
+
+        return pd.DataFrame({**self.columns, "failure_reason": self.reasons})
+
+
+def _input(table: Mapping[str, object], name: str) -> object:
+    if name not in table:
+        raise ValueError(f"Davis batch input is missing column {name}")
+    return table[name]
+
+
+@dataclass(frozen=True)
+class CompiledTable4:
+    """Contiguous Table 4 axes with the A-axis cell differences precomputed.
+
+    ``f2_steps[r, a]`` is ``f2[r, a + 1] - f2[r, a]`` (zero in the last column),
+    the same subtraction ``lookup_table4_f2`` performs, so interpolated values
+    are identical to the scalar lookup.
+    """
+
+    table: Table4
+    mass_ratios: np.ndarray
+    expansion_ratios: np.ndarray
+    f2: np.ndarray
+    f2_steps: np.ndarray
+
+
+@lru_cache(maxsize=1)
+def _compile_table4(table: Table4) -> CompiledTable4:
+    f2 = np.array([row.f2_values for row in table.rows], dtype=np.float64)
+    steps = np.zeros_like(f2)
+    steps[:, :-1] = f2[:, 1:] - f2[:, :-1]
+    arrays = (np.array(table.mass_ratios, dtype=np.float64), np.array(table.expansion_ratios, dtype=np.float64), f2, steps)
+    for array in arrays:
+        array.setflags(write=False)
+    return CompiledTable4(table, *arrays)
+
+
+def compiled_table4() -> CompiledTable4:
+    """Return the compiled form of the currently loaded Davis Table 4."""
+    return _compile_table4(load_table4())
+
+
+def _bracket(rows: _Rows, values: np.ndarray, grid: np.ndarray, name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rows.flag(f"{name} is outside Davis Table 4", (values < grid[0]) | (values > grid[-1]))
+    value = np.where((values >= grid[0]) & (values <= grid[-1]), values, grid[0])
+    index = np.minimum(np.searchsorted(grid, value, side="left"), len(grid) - 1)
+    previous = np.maximum(index - 1, 0)
+    exact_previous = (index > 0) & (np.abs(value - grid[previous]) < 1e-12)
+    exact_current = np.abs(value - grid[index]) < 1e-12
+    exact = exact_previous | exact_current
+    lower = np.where(exact_previous, previous, np.where(exact_current, index, previous))
+    upper = np.where(exact, lower, index)
+    fraction = np.where(exact, 0.0, (value - grid[lower]) / (grid[upper] - grid[lower]))
+    return lower, upper, fraction
+
+
+def _table4_f2(rows: _Rows, mass_ratio: np.ndarray, ratio: np.ndarray, compiled: CompiledTable4) -> np.ndarray:
+    rows.positive(mass_ratio, "mass_ratio")
+    rows.positive(ratio, "expansion_ratio")
+    a0, _, a_fraction = _bracket(rows, mass_ratio, compiled.mass_ratios, "mass_ratio")
+    r0, r1, r_fraction = _bracket(rows, ratio, compiled.expansion_ratios, "expansion_ratio")
+    lower = compiled.f2[r0, a0] + a_fraction * compiled.f2_steps[r0, a0]
+    upper = compiled.f2[r1, a0] + a_fraction * compiled.f2_steps[r1, a0]
+    return np.where(r0 == r1, lower, lower + r_fraction * (upper - lower))
+
+
+def lookup_table4_f2_batch(mass_ratio_value: object, expansion_ratio_value: object, *, table4: CompiledTable4 | None = None) -> BatchResult:
+    """Vectorized ``lookup_table4_f2`` over arrays of (A, R) pairs."""
+    rows = _Rows.broadcast(mass_ratio_value, expansion_ratio_value)
+    with np.errstate(all="ignore"):
+        values = _table4_f2(rows, rows.column(mass_ratio_value), rows.column(expansion_ratio_value), table4 or compiled_table4())
+    return BatchResult(rows.finish(values), rows.error_masks())
+
+
+def run_davis_batch(table: Mapping[str, object], *, table4_lookup: bool = False, table4: CompiledTable4 | None = None) -> DavisBatch:
+    """Compute Davis S through V, and optionally K1-K3 and pressure, per row.
+
+    ``table`` is any column mapping, including a pandas DataFrame. Rows with
+    both boat-tail columns missing or NaN are flat-based (K = 0). Pressure
+    columns need F2: either a ``table4_f2`` column of source-backed values or
+    ``table4_lookup=True`` for the repository's Table 4 interpolation.
+    Without either, only the velocity chain is computed. ``table4`` may
+    supply an already compiled table, such as a memory-mapped cache.
+    """
+
+    names = [*REQUIRED_COLUMNS, *(name for name in (*BOAT_TAIL_COLUMNS, "table4_f2") if name in table)]
+    designation = np.asarray(_input(table, "powder_designation"), dtype=object)
+    numeric = {name: _input(table, name) for name in names if name != "powder_designation"}
+    rows = _Rows.broadcast(designation, *numeric.values())
+    case, bullet_length, oal, gross, diameter, bullet, barrel = (
+        rows.column(numeric[name]) for name in REQUIRED_COLUMNS if name != "powder_designation"
+    )
+    nan = np.float64(np.nan)
+    height = rows.column(numeric.get("boat_tail_height_inches", nan))
+    tail_diameter = rows.column(numeric.get("boat_tail_small_diameter_inches", nan))
+    boat_tail = ~(np.isnan(height) & np.isnan(tail_diameter))
+    columns: dict[str, np.ndarray] = {}
+    with np.errstate(all="ignore"):
+        rows.positive(case, "case_length_inches")
+        rows.positive(bullet_length, "bullet_length_inches")
+        rows.positive(oal, "cartridge_oal_inches")
+        depth = rows.positive(case + bullet_length - oal, "seating_depth_inches")
+
+        rows.positive(diameter, "bullet_diameter_inches")
+        diameter_squared = rows.power(diameter, 2.0)
+        displacement = 198.0 * depth * diameter_squared
+
+        tailed = _Rows(rows.shape)
+        tailed.failed = rows.failed | ~boat_tail
+        tailed.positive(height, "boat_tail_height_inches")
+        tailed.positive(tail_diameter, "boat_tail_small_diameter_inches")
+        tailed.flag("boat_tail_height_inches must not exceed seating_depth_inches", height > depth)
+        tailed.flag("boat_tail_small_diameter_inches must not exceed bullet_diameter_inches", tail_diameter > diameter)
+        for message, mask in tailed.errors.items():
+            rows.flag(message, mask)
+        correction = np.where(
+            boat_tail,
+            66.0 * height * (2.0 * diameter_squared - diameter * tail_diameter - rows.power(tail_diameter, 2.0)),
+            0.0,
+        )
+
+        rows.positive(gross, "gross_case_capacity_water_grains")
+        rows.nonnegative(displacement, "flat_base_displacement_water_grains")
+        rows.nonnegative(correction, "boat_tail_correction_water_grains")
+        capacity = rows.positive(gross - displacement + correction, "loaded_powder_space_capacity_water_grains")
+
+        rows.positive(barrel, "barrel_length_from_bolt_face_inches")
+        travel = rows.positive(barrel + depth - case, "bullet_travel_inches")
+        chamber = capacity / WATER_GRAINS_PER_CUBIC_INCH
+        bore = 0.773 * travel * diameter_squared
+        rows.positive(bore, "effective_bore_volume_cubic_inches")
+        rows.positive(chamber, "powder_chamber_volume_cubic_inches")
+        ratio = (bore + chamber) / chamber
+
+        known = np.isin(designation, list(DAVIS_RELATIVE_QUICKNESS))
+        rows.flag("powder_designation must be one of the evidenced Davis IMR powders", ~known)
+        charge = np.where(np.isin(designation, _REDUCED_DENSITY_POWDERS), 0.80, 0.86) * capacity
+
+        rows.positive(charge, "charge_weight_grains")
+        rows.positive(bullet, "bullet_weight_grains")
+        mass_ratio = charge / bullet
+        sectional_density = bullet / (7000.0 * diameter_squared)
+        rows.positive(sectional_density, "sectional_density")
+        rows.positive(mass_ratio, "mass_ratio")
+        selection_index = 20.0 + 12.0 / (sectional_density * np.sqrt(mass_ratio))
+
+        rows.positive(ratio, "expansion_ratio")
+        rows.flag("expansion_ratio must be greater than 1", ratio <= 1.0)
+        m_value = 1.0 / rows.power(ratio, 0.25)
+        rows.positive(m_value, "velocity_fraction_m")
+        rows.flag("velocity_fraction_m must be less than 1", m_value >= 1.0)
+        n_value = 1.0 - m_value
+        moving_weight = bullet + charge / 3.0
+        rows.nonnegative(n_value, "velocity_fraction_n")
+        rows.flag("velocity_fraction_n must be less than 1", n_value >= 1.0)
+        rows.positive(moving_weight, "effective_moving_weight_grains")
+        velocity = 8000.0 * np.sqrt(charge * n_value / moving_weight)
+
+        for name, values in zip(VELOCITY_COLUMNS, (depth, displacement, correction, capacity, travel, chamber, bore, ratio, charge, mass_ratio, sectional_density, selection_index, m_value, n_value, moving_weight, velocity), strict=True):
+            columns[name] = values
+
+        if "table4_f2" in numeric or table4_lookup:
+            f2 = rows.column(numeric["table4_f2"]) if "table4_f2" in numeric else _table4_f2(rows, mass_ratio, ratio, table4 or compiled_table4())
+            rows.positive(f2, "table4_f2")
+            rows.positive(velocity, "muzzle_velocity_fps")
+            k1 = 0.0142 * charge * f2 * rows.power(velocity, 2.0)
+            k2 = 0.53 * (bullet / charge) + 0.26
+            k3 = capacity * (ratio - 1.0)
+            for name, values in zip(PRESSURE_COLUMNS, (f2, k1, k2, k3, k1 * k2 / k3), strict=True):
+                columns[name] = values
+    return DavisBatch({name: rows.finish(values) for name, values in columns.items()}, rows.error_masks())
@@ -6,6 +6,8 @@ This module reproduces SRC-KWK-EMULATOR. It is not the original Powley method.
 from dataclasses import dataclass
 from math import floor, isfinite, sqrt
 
+from ._bands import compile_partition
+
 SOURCE_ID = "SRC-KWK-EMULATOR"
 
 
@@ -119,12 +121,14 @@ POWDER_BANDS = (
 )
 
 
+POWDER_BAND_INDEX = compile_partition(
+    POWDER_BANDS,
+    "archived emulator powder bands are not a total non-overlapping partition",
+)
+
+
 def select_powder_band(index: float) -> PowderBand:
-    value = _positive(index, "index")
-    matches = [band for band in POWDER_BANDS if band.includes(value)]
-    if len(matches) != 1:
-        raise RuntimeError("archived emulator powder bands are not a total non-overlapping partition")
-    return matches[0]
+    return POWDER_BANDS[POWDER_BAND_INDEX.position(_positive(index, "index"))]
 
 
 @dataclass(frozen=True)
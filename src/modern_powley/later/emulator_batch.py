@@ -0,0 +1,430 @@
+"""Array-in/array-out replay of the archived kwk.us emulator arithmetic.
+
+Every function mirrors the scalar function of the same stem in
+``modern_powley.later.emulator`` and reproduces its results bit for bit. Rows
+that the scalar path would reject are reported in per-row error masks keyed by
+the exact message of the first ``ValueError`` (or ``ZeroDivisionError``) the
+scalar chain would raise.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ._batch import ZERO_DIVISION_MESSAGE, BatchResult, RowFailures
+from .emulator import POWDER_BAND_INDEX
+
+
+class _Rows(RowFailures):
+    """Emulator validation messages on top of the shared row bookkeeping."""
+
+    def positive(self, values: np.ndarray, name: str) -> np.ndarray:
+        self.flag(f"{name} must be finite and greater than zero", ~np.isfinite(values) | (values <= 0))
+        return values
+
+    def nonnegative(self, values: np.ndarray, name: str) -> np.ndarray:
+        self.flag(f"{name} must be finite and nonnegative", ~np.isfinite(values) | (values < 0))
+        return values
+
+
+_rows = _Rows.broadcast
+
+
+def _result(rows: _Rows, values: np.ndarray) -> BatchResult:
+    return BatchResult(rows.finish(values), rows.error_masks())
+
+
+def _sectional_density(rows: _Rows, bullet_weight: np.ndarray, diameter: np.ndarray) -> np.ndarray:
+    rows.positive(bullet_weight, "bullet_weight_grains")
+    rows.positive(diameter, "bullet_diameter_inches")
+    squared = rows.power(diameter, 2.0)
+    rows.flag(ZERO_DIVISION_MESSAGE, squared == 0)
+    return bullet_weight / 7000.0 / squared
+
+
+def sectional_density_batch(bullet_weight_grains: object, bullet_diameter_inches: object) -> BatchResult:
+    rows = _rows(bullet_weight_grains, bullet_diameter_inches)
+    with np.errstate(all="ignore"):
+        values = _sectional_density(rows, rows.column(bullet_weight_grains), rows.column(bullet_diameter_inches))
+    return _result(rows, values)
+
+
+def estimated_spitzer_bullet_length_inches_batch(sectional_density_value: object) -> BatchResult:
+    rows = _rows(sectional_density_value)
+    with np.errstate(all="ignore"):
+        values = 0.20 + 3.67 * rows.positive(rows.column(sectional_density_value), "sectional_density")
+    return _result(rows, values)
+
+
+def estimated_round_nose_bullet_length_inches_batch(sectional_density_value: object) -> BatchResult:
+    rows = _rows(sectional_density_value)
+    with np.errstate(all="ignore"):
+        values = 0.08 + 3.67 * rows.positive(rows.column(sectional_density_value), "sectional_density")
+    return _result(rows, values)
+
+
+def _seating_depth(rows: _Rows, case_length: np.ndarray, bullet_length: np.ndarray, cartridge_length: np.ndarray) -> np.ndarray:
+    rows.positive(case_length, "case_length_inches")
+    rows.positive(bullet_length, "bullet_length_inches")
+    rows.positive(cartridge_length, "cartridge_length_inches")
+    depth = case_length + bullet_length - cartridge_length
+    rows.flag("emulator seating depth is negative", depth < 0)
+    return depth
+
+
+def seating_depth_inches_batch(case_length_inches: object, bullet_length_inches: object, cartridge_length_inches: object) -> BatchResult:
+    rows = _rows(case_length_inches, bullet_length_inches, cartridge_length_inches)
+    with np.errstate(all="ignore"):
+        values = _seating_depth(rows, rows.column(case_length_inches), rows.column(bullet_length_inches), rows.column(cartridge_length_inches))
+    return _result(rows, values)
+
+
+def _bullet_travel(rows: _Rows, barrel_length: np.ndarray, case_length: np.ndarray, depth: np.ndarray) -> np.ndarray:
+    rows.nonnegative(depth, "seating_depth")
+    rows.positive(barrel_length, "barrel_length_inches")
+    rows.positive(case_length, "case_length_inches")
+    travel = barrel_length - case_length + depth
+    rows.flag("emulator bullet travel must be positive", ~np.isfinite(travel) | (travel <= 0))
+    return travel
+
+
+def bullet_travel_inches_batch(barrel_length_inches: object, case_length_inches: object, seating_depth: object) -> BatchResult:
+    rows = _rows(barrel_length_inches, case_length_inches, seating_depth)
+    with np.errstate(all="ignore"):
+        values = _bullet_travel(rows, rows.column(barrel_length_inches), rows.column(case_length_inches), rows.column(seating_depth))
+    return _result(rows, values)
+
+
+def _bore_area(rows: _Rows, diameter: np.ndarray) -> np.ndarray:
+    rows.positive(diameter, "bullet_diameter_inches")
+    return 0.773 * rows.power(diameter, 2.0)
+
+
+def approximate_bore_area_square_inches_batch(bullet_diameter_inches: object) -> BatchResult:
+    rows = _rows(bullet_diameter_inches)
+    with np.errstate(all="ignore"):
+        values = _bore_area(rows, rows.column(bullet_diameter_inches))
+    return _result(rows, values)
+
+
+def _total_expansion_ratio(rows: _Rows, net_capacity: np.ndarray, diameter: np.ndarray, travel: np.ndarray) -> np.ndarray:
+    net_volume = rows.positive(net_capacity, "net_capacity_water_grains") / 252.4
+    bore_area = _bore_area(rows, diameter)
+    bore_volume = bore_area * rows.positive(travel, "travel_inches")
+    return (bore_volume + net_volume) / net_volume
+
+
+def total_expansion_ratio_from_geometry_batch(net_capacity_water_grains: object, bullet_diameter_inches: object, travel_inches: object) -> BatchResult:
+    rows = _rows(net_capacity_water_grains, bullet_diameter_inches, travel_inches)
+    with np.errstate(all="ignore"):
+        values = _total_expansion_ratio(rows, rows.column(net_capacity_water_grains), rows.column(bullet_diameter_inches), rows.column(travel_inches))
+    return _result(rows, values)
+
+
+def _net_capacity(rows: _Rows, gross_capacity: np.ndarray, depth: np.ndarray, diameter: np.ndarray) -> np.ndarray:
+    rows.positive(gross_capacity, "gross_capacity_water_grains")
+    rows.nonnegative(depth, "seating_depth_inches")
+    rows.positive(diameter, "bullet_diameter_inches")
+    net = gross_capacity - 198.0 * depth * rows.power(diameter, 2.0)
+    rows.flag("emulator geometry leaves no volume under the bullet", net <= 0)
+    return net
+
+
+def net_capacity_from_gross_batch(gross_capacity_water_grains: object, seating_depth_inches: object, bullet_diameter_inches: object) -> BatchResult:
+    rows = _rows(gross_capacity_water_grains, seating_depth_inches, bullet_diameter_inches)
+    with np.errstate(all="ignore"):
+        values = _net_capacity(rows, rows.column(gross_capacity_water_grains), rows.column(seating_depth_inches), rows.column(bullet_diameter_inches))
+    return _result(rows, values)
+
+
+def _powder_index(rows: _Rows, sectional_density_value: np.ndarray, mass_ratio: np.ndarray) -> np.ndarray:
+    rows.positive(sectional_density_value, "sectional_density")
+    rows.positive(mass_ratio, "mass_ratio")
+    return 20.0 + 12.0 / (sectional_density_value * np.sqrt(mass_ratio))
+
+
+def powder_index_batch(sectional_density_value: object, mass_ratio_value: object) -> BatchResult:
+    rows = _rows(sectional_density_value, mass_ratio_value)
+    with np.errstate(all="ignore"):
+        values = _powder_index(rows, rows.column(sectional_density_value), rows.column(mass_ratio_value))
+    return _result(rows, values)
+
+
+def _powder_band_index(rows: _Rows, index: np.ndarray) -> np.ndarray:
+    rows.positive(index, "index")
+    return POWDER_BAND_INDEX.position_batch(index)
+
+
+def powder_band_index_batch(index: object) -> BatchResult:
+    """Return positions in ``POWDER_BANDS``; rejected rows hold -1."""
+
+    rows = _rows(index)
+    values = _powder_band_index(rows, rows.column(index))
+    return BatchResult(rows.finish(values, -1), rows.error_masks())
+
+
+@dataclass(frozen=True)
+class LoadBatch:
+    charge_weight_grains: np.ndarray
+    mass_ratio: np.ndarray
+    powder_index: np.ndarray
+    band_index: np.ndarray
+    errors: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def invalid(self) -> np.ndarray:
+        return self.band_index < 0
+
+
+def _load(rows: _Rows, net_capacity: np.ndarray, bullet_weight: np.ndarray, diameter: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    rows.positive(net_capacity, "net_capacity_water_grains")
+    sd = _sectional_density(rows, bullet_weight, diameter)
+    charge = 0.86 * net_capacity
+    ratio = charge / bullet_weight
+    index = _powder_index(rows, sd, ratio)
+    lighter = index > 145.0
+    charge = np.where(lighter, 0.80 * net_capacity, charge)
+    ratio = np.where(lighter, charge / bullet_weight, ratio)
+    return charge, ratio, index, _powder_band_index(rows, index)
+
+
+def load_from_net_capacity_batch(net_capacity_water_grains: object, bullet_weight_grains: object, bullet_diameter_inches: object) -> LoadBatch:
+    rows = _rows(net_capacity_water_grains, bullet_weight_grains, bullet_diameter_inches)
+    with np.errstate(all="ignore"):
+        charge, ratio, index, band = _load(rows, rows.column(net_capacity_water_grains), rows.column(bullet_weight_grains), rows.column(bullet_diameter_inches))
+    return LoadBatch(rows.finish(charge), rows.finish(ratio), rows.finish(index), rows.finish(band, -1), rows.error_masks())
+
+
+LOAD_RECORD_DTYPE = np.dtype(
+    [
+        ("charge_weight_grains", np.float64),
+        ("mass_ratio", np.float64),
+        ("powder_index", np.float64),
+        ("band_index", np.int64),
+    ]
+)
+
+
+def load_from_net_capacity_into(
+    out: np.ndarray,
+    net_capacity_water_grains: object,
+    bullet_weight_grains: object,
+    bullet_diameter_inches: object,
+) -> dict[str, np.ndarray]:
+    """Fill a preallocated ``LOAD_RECORD_DTYPE`` array in place; return error masks.
+
+    Each field is written by ufuncs directly into ``out``, and only rows whose
+    powder index exceeds 145 are rewritten at the 0.80 density, so no Python
+    object is created per row. Values match ``load_from_net_capacity`` bit for
+    bit; rejected rows hold NaN and band index -1.
+    """
+
+    if out.dtype != LOAD_RECORD_DTYPE:
+        raise ValueError("out must have LOAD_RECORD_DTYPE")
+    rows = _rows(net_capacity_water_grains, bullet_weight_grains, bullet_diameter_inches)
+    if out.shape != rows.shape:
+        raise ValueError(f"out shape {out.shape} does not match input shape {rows.shape}")
+    net, bullet, diameter = (np.broadcast_to(rows.column(value), rows.shape) for value in (net_capacity_water_grains, bullet_weight_grains, bullet_diameter_inches))
+    charge, ratio, index, band = (out[name] for name in LOAD_RECORD_DTYPE.names)
+    with np.errstate(all="ignore"):
+        rows.positive(net, "net_capacity_water_grains")
+        rows.positive(bullet, "bullet_weight_grains")
+        rows.positive(diameter, "bullet_diameter_inches")
+        sd = rows.power(diameter, 2.0)
+        rows.flag(ZERO_DIVISION_MESSAGE, sd == 0)
+        np.divide(bullet / 7000.0, sd, out=sd)
+        np.multiply(0.86, net, out=charge)
+        np.divide(charge, bullet, out=ratio)
+        rows.positive(sd, "sectional_density")
+        rows.positive(ratio, "mass_ratio")
+        np.sqrt(ratio, out=index)
+        np.multiply(sd, index, out=index)
+        np.divide(12.0, index, out=index)
+        np.add(20.0, index, out=index)
+        lighter = index > 145.0
+        np.multiply(0.80, net, out=charge, where=lighter)
+        np.divide(charge, bullet, out=ratio, where=lighter)
+        rows.positive(index, "index")
+        band[...] = POWDER_BAND_INDEX.position_batch(index)
+    failed = np.broadcast_to(rows.failed, rows.shape)
+    for field_values in (charge, ratio, index):
+        field_values[failed] = np.nan
+    band[failed] = -1
+    return rows.error_masks()
+
+
+def javascript_round_to_increment_batch(value: object, increment: object) -> BatchResult:
+    rows = _rows(value, increment)
+    with np.errstate(all="ignore"):
+        number = rows.positive(rows.column(value), "value")
+        step = rows.positive(rows.column(increment), "increment")
+        values = np.floor(number / step + 0.5) * step
+    return _result(rows, values)
+
+
+def _velocity(rows: _Rows, charge: np.ndarray, bullet_weight: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+    rows.positive(charge, "charge_weight_grains")
+    rows.positive(bullet_weight, "bullet_weight_grains")
+    rows.positive(ratio, "total_expansion_ratio")
+    rows.flag("total_expansion_ratio must be greater than one", ratio <= 1)
+    return 8000.0 * np.sqrt(charge * (1.0 - rows.power(ratio, -0.25)) / (bullet_weight + charge / 3.0))
+
+
+def velocity_fps_batch(charge_weight_grains: object, bullet_weight_grains: object, total_expansion_ratio: object) -> BatchResult:
+    rows = _rows(charge_weight_grains, bullet_weight_grains, total_expansion_ratio)
+    with np.errstate(all="ignore"):
+        values = _velocity(rows, rows.column(charge_weight_grains), rows.column(bullet_weight_grains), rows.column(total_expansion_ratio))
+    return _result(rows, values)
+
+
+def _miller_f2(rows: _Rows, mass_ratio: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+    rows.positive(mass_ratio, "mass_ratio")
+    rows.positive(ratio, "total_expansion_ratio")
+    return 0.024075 * (9.3 - mass_ratio) * (1.071 + ratio - 0.009736 * rows.power(ratio, 2.0))
+
+
+def miller_f2_batch(mass_ratio_value: object, total_expansion_ratio: object) -> BatchResult:
+    rows = _rows(mass_ratio_value, total_expansion_ratio)
+    with np.errstate(all="ignore"):
+        values = _miller_f2(rows, rows.column(mass_ratio_value), rows.column(total_expansion_ratio))
+    return _result(rows, values)
+
+
+def _pressure_cup(rows: _Rows, velocity: np.ndarray, density: np.ndarray, ratio: np.ndarray, mass_ratio: np.ndarray) -> np.ndarray:
+    rows.positive(velocity, "velocity_fps")
+    rows.positive(density, "loading_density")
+    rows.positive(ratio, "total_expansion_ratio")
+    rows.positive(mass_ratio, "mass_ratio")
+    rows.flag("total_expansion_ratio must be greater than one", ratio <= 1)
+    k2 = 0.53 / mass_ratio + 0.26
+    f2 = _miller_f2(rows, mass_ratio, ratio)
+    return 134.7 * rows.power(velocity / 100.0, 2.0) * density / (ratio - 1.0) * k2 * f2
+
+
+def pressure_cup_batch(velocity_fps_value: object, loading_density: object, total_expansion_ratio: object, mass_ratio_value: object) -> BatchResult:
+    rows = _rows(velocity_fps_value, loading_density, total_expansion_ratio, mass_ratio_value)
+    with np.errstate(all="ignore"):
+        values = _pressure_cup(rows, rows.column(velocity_fps_value), rows.column(loading_density), rows.column(total_expansion_ratio), rows.column(mass_ratio_value))
+    return _result(rows, values)
+
+
+def _claimed_psi(rows: _Rows, cup: np.ndarray) -> np.ndarray:
+    rows.positive(cup, "cup")
+    return cup * (1.0 + rows.power(cup, 2.2) / 1.2e11)
+
+
+def cup_to_claimed_psi_batch(cup: object) -> BatchResult:
+    rows = _rows(cup)
+    with np.errstate(all="ignore"):
+        values = _claimed_psi(rows, rows.column(cup))
+    return _result(rows, values)
+
+
+def velocity_for_target_cup_batch(target_cup: object, total_expansion_ratio: object, mass_ratio_value: object) -> BatchResult:
+    rows = _rows(target_cup, total_expansion_ratio, mass_ratio_value)
+    with np.errstate(all="ignore"):
+        cup = rows.positive(rows.column(target_cup), "target_cup")
+        ratio = rows.positive(rows.column(total_expansion_ratio), "total_expansion_ratio")
+        mass_ratio = rows.positive(rows.column(mass_ratio_value), "mass_ratio")
+        rows.flag("total_expansion_ratio must be greater than one", ratio <= 1)
+        k2 = 0.53 / mass_ratio + 0.26
+        f2 = _miller_f2(rows, mass_ratio, ratio)
+        rows.flag(ZERO_DIVISION_MESSAGE, f2 == 0)
+        radicand = cup / k2 / f2 * (ratio - 1.0) / 0.86 / 134.7
+        rows.flag("math domain error", radicand < 0)
+        values = 100.0 * np.sqrt(radicand)
+    return _result(rows, values)
+
+
+def _kinetic_energy(rows: _Rows, bullet_weight: np.ndarray, velocity: np.ndarray) -> np.ndarray:
+    rows.positive(bullet_weight, "bullet_weight_grains")
+    rows.positive(velocity, "velocity_fps")
+    return 0.5 * bullet_weight / 7000.0 / 32.2 * rows.power(velocity, 2.0)
+
+
+def kinetic_energy_foot_pounds_batch(bullet_weight_grains: object, velocity_fps_value: object) -> BatchResult:
+    rows = _rows(bullet_weight_grains, velocity_fps_value)
+    with np.errstate(all="ignore"):
+        values = _kinetic_energy(rows, rows.column(bullet_weight_grains), rows.column(velocity_fps_value))
+    return _result(rows, values)
+
+
+def efficiency_percent_batch(bullet_weight_grains: object, velocity_fps_value: object, charge_weight_grains: object) -> BatchResult:
+    rows = _rows(bullet_weight_grains, velocity_fps_value, charge_weight_grains)
+    with np.errstate(all="ignore"):
+        energy = _kinetic_energy(rows, rows.column(bullet_weight_grains), rows.column(velocity_fps_value))
+        values = 100.0 * energy / (rows.positive(rows.column(charge_weight_grains), "charge_weight_grains") * 185.0)
+    return _result(rows, values)
+
+
+@dataclass(frozen=True)
+class EmulatorChainBatch:
+    seating_depth_inches: np.ndarray
+    net_capacity_water_grains: np.ndarray
+    travel_inches: np.ndarray
+    total_expansion_ratio: np.ndarray
+    charge_weight_grains: np.ndarray
+    mass_ratio: np.ndarray
+    powder_index: np.ndarray
+    band_index: np.ndarray
+    velocity_fps: np.ndarray
+    loading_density: np.ndarray
+    pressure_cup: np.ndarray
+    claimed_psi: np.ndarray
+    errors: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def invalid(self) -> np.ndarray:
+        return self.band_index < 0
+
+
+def emulator_chain_batch(
+    gross_capacity_water_grains: object,
+    case_length_inches: object,
+    bullet_length_inches: object,
+    cartridge_length_inches: object,
+    barrel_length_inches: object,
+    bullet_weight_grains: object,
+    bullet_diameter_inches: object,
+) -> EmulatorChainBatch:
+    """Run the emulator geometry, load, velocity, and pressure chain in bulk.
+
+    Loading density is the emulator's ``LD = I / W``: charge over net capacity.
+    """
+
+    inputs = (
+        gross_capacity_water_grains,
+        case_length_inches,
+        bullet_length_inches,
+        cartridge_length_inches,
+        barrel_length_inches,
+        bullet_weight_grains,
+        bullet_diameter_inches,
+    )
+    rows = _rows(*inputs)
+    gross, case, bullet_length, cartridge, barrel, bullet, diameter = (rows.column(value) for value in inputs)
+    with np.errstate(all="ignore"):
+        depth = _seating_depth(rows, case, bullet_length, cartridge)
+        net = _net_capacity(rows, gross, depth, diameter)
+        travel = _bullet_travel(rows, barrel, case, depth)
+        ratio = _total_expansion_ratio(rows, net, diameter, travel)
+        charge, mass_ratio, index, band = _load(rows, net, bullet, diameter)
+        velocity = _velocity(rows, charge, bullet, ratio)
+        density = charge / net
+        cup = _pressure_cup(rows, velocity, density, ratio, mass_ratio)
+        psi = _claimed_psi(rows, cup)
+    return EmulatorChainBatch(
+        rows.finish(depth),
+        rows.finish(net),
+        rows.finish(travel),
+        rows.finish(ratio),
+        rows.finish(charge),
+        rows.finish(mass_ratio),
+        rows.finish(index),
+        rows.finish(band, -1),
+        rows.finish(velocity),
+        rows.finish(density),
+        rows.finish(cup),
+        rows.finish(psi),
+        rows.error_masks(),
+    )
@@ -0,0 +1,149 @@
+"""Vectorized inverses of the emulator and Davis forward relations.
+
+Closed forms are used where the forward relation can be inverted exactly.
+The emulator charge for a target CUP has no closed form and is found by
+vectorized bisection on a per-element charge bracket, with convergence
+reported per element rather than raised.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ._batch import failure_reasons
+from .davis_batch import _Rows as _DavisRows
+from .emulator_batch import _rows, pressure_cup_batch, velocity_fps_batch
+
+
+@dataclass(frozen=True)
+class InverseResult:
+    """Solved inputs with per-element convergence, iteration counts, and errors."""
+
+    values: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+    errors: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def reasons(self) -> np.ndarray:
+        return failure_reasons(self.errors, self.converged.shape)
+
+
+def _closed_form(rows, values: np.ndarray) -> InverseResult:
+    values = rows.finish(values)
+    return InverseResult(values, ~np.isnan(values), np.zeros(values.shape, dtype=np.int64), rows.error_masks())
+
+
+def charge_for_target_velocity_batch(target_velocity_fps: object, bullet_weight_grains: object, total_expansion_ratio: object) -> InverseResult:
+    """Closed-form charge I with ``velocity_fps(I, G, R)`` equal to the target.
+
+    Solves ``(V/8000)^2 (G + I/3) = I (1 - R^-1/4)``. Velocities at or above
+    the infinite-charge asymptote ``8000 sqrt(3 (1 - R^-1/4))`` are rejected.
+    """
+    rows = _rows(target_velocity_fps, bullet_weight_grains, total_expansion_ratio)
+    with np.errstate(all="ignore"):
+        velocity = rows.positive(rows.column(target_velocity_fps), "target_velocity_fps")
+        bullet = rows.positive(rows.column(bullet_weight_grains), "bullet_weight_grains")
+        ratio = rows.positive(rows.column(total_expansion_ratio), "total_expansion_ratio")
+        rows.flag("total_expansion_ratio must be greater than one", ratio <= 1)
+        scaled = rows.power(velocity / 8000.0, 2.0)
+        fraction = 1.0 - rows.power(ratio, -0.25)
+        denominator = fraction - scaled / 3.0
+        rows.flag("target_velocity_fps is unattainable at this expansion ratio", denominator <= 0)
+        values = scaled * bullet / denominator
+    return _closed_form(rows, values)
+
+
+NONFINITE_CUP_MESSAGE = "emulator CUP is not finite inside the charge bracket"
+
+
+def _cup_for_charge(charge: np.ndarray, bullet: np.ndarray, ratio: np.ndarray, net: np.ndarray) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    velocity = velocity_fps_batch(charge, bullet, ratio)
+    pressure = pressure_cup_batch(velocity.values, charge / net, ratio, charge / bullet)
+    return pressure.values, {**velocity.errors, **{message: mask & ~velocity.invalid for message, mask in pressure.errors.items()}}
+
+
+def _flag_forward(rows, cup: np.ndarray, errors: dict[str, np.ndarray], mask: np.ndarray) -> None:
+    # Rows the scalar forward chain rejects keep its message; any other
+    # non-finite CUP would silently steer the bisection, so it is reported too.
+    for message, failed in errors.items():
+        rows.flag(message, mask & failed)
+    rows.flag(NONFINITE_CUP_MESSAGE, mask & ~np.isfinite(cup))
+
+
+def charge_for_target_cup_batch(
+    target_cup: object,
+    bullet_weight_grains: object,
+    total_expansion_ratio: object,
+    net_capacity_water_grains: object,
+    *,
+    lower_charge_grains: object = None,
+    upper_charge_grains: object = None,
+    xtol: float = 1e-12,
+    max_iterations: int = 200,
+) -> InverseResult:
+    """Charge I whose emulator velocity and CUP chain reaches the target CUP.
+
+    The forward chain is ``velocity_fps(I, G, R)`` then ``pressure_cup`` at
+    ``LD = I / W``, the emulator's pressure form. The default bracket runs
+    from ``1e-9 W`` to ``W`` (loading density one). Targets whose CUP is not
+    bracketed are reported rather than extrapolated, and a row whose forward
+    chain fails or yields a non-finite CUP at a bracket end or midpoint stops
+    with that failure rather than steering the bisection.
+    """
+    if xtol <= 0 or max_iterations < 1:
+        raise ValueError("xtol and max_iterations must be positive")
+    rows = _rows(target_cup, bullet_weight_grains, total_expansion_ratio, net_capacity_water_grains, lower_charge_grains if lower_charge_grains is not None else 0.0, upper_charge_grains if upper_charge_grains is not None else 0.0)
+    with np.errstate(all="ignore"):
+        cup = rows.positive(rows.column(target_cup), "target_cup")
+        bullet = rows.positive(rows.column(bullet_weight_grains), "bullet_weight_grains")
+        ratio = rows.positive(rows.column(total_expansion_ratio), "total_expansion_ratio")
+        rows.flag("total_expansion_ratio must be greater than one", ratio <= 1)
+        net = rows.positive(rows.column(net_capacity_water_grains), "net_capacity_water_grains")
+        lower = rows.positive(rows.column(1e-9 * net if lower_charge_grains is None else lower_charge_grains), "lower_charge_grains")
+        upper = rows.positive(rows.column(net if upper_charge_grains is None else upper_charge_grains), "upper_charge_grains")
+        rows.flag("lower_charge_grains must be less than upper_charge_grains", lower >= upper)
+        cup, bullet, ratio, net, lower, upper = np.broadcast_arrays(cup, bullet, ratio, net, lower, upper)
+        active = ~np.broadcast_to(rows.failed, rows.shape)
+        cup_lower, lower_errors = _cup_for_charge(lower, bullet, ratio, net)
+        cup_upper, upper_errors = _cup_for_charge(upper, bullet, ratio, net)
+        _flag_forward(rows, cup_lower, lower_errors, active)
+        _flag_forward(rows, cup_upper, upper_errors, active)
+        f_lower, f_upper = cup_lower - cup, cup_upper - cup
+        rows.flag("target_cup is outside the CUP range of the charge bracket", ~(np.sign(f_lower) * np.sign(f_upper) <= 0))
+        active = ~np.broadcast_to(rows.failed, rows.shape)
+        values = np.where(f_lower == 0, lower, np.where(f_upper == 0, upper, np.nan))
+        converged = active & ~np.isnan(values)
+        iterations = np.zeros(rows.shape, dtype=np.int64)
+        for _ in range(max_iterations):
+            running = active & ~converged
+            if not running.any():
+                break
+            middle = 0.5 * (lower + upper)
+            cup_middle, middle_errors = _cup_for_charge(middle, bullet, ratio, net)
+            _flag_forward(rows, cup_middle, middle_errors, running)
+            active &= ~np.broadcast_to(rows.failed, rows.shape)
+            running &= active
+            f_middle = cup_middle - cup
+            same_side = np.sign(f_middle) == np.sign(f_lower)
+            lower = np.where(running & same_side, middle, lower)
+            f_lower = np.where(running & same_side, f_middle, f_lower)
+            upper = np.where(running & ~same_side, middle, upper)
+            iterations += running
+            done = running & ((f_middle == 0) | (upper - lower <= xtol * np.maximum(1.0, np.abs(middle))))
+            values = np.where(done, np.where(f_middle == 0, middle, 0.5 * (lower + upper)), values)
+            converged |= done
+        rows.flag("charge search did not converge within max_iterations", active & ~converged)
+    values = rows.finish(values)
+    return InverseResult(values, ~np.isnan(values), iterations, rows.error_masks())
+
+
+def loading_density_for_target_pressure_batch(target_historical_crusher_pressure: object, initial_historical_crusher_pressure: object, initial_loading_density: object) -> InverseResult:
+    """Closed-form inverse of Davis ``P2 = P1 (LD2/LD1)^2``: ``LD2 = LD1 sqrt(P2/P1)``."""
+    rows = _DavisRows.broadcast(target_historical_crusher_pressure, initial_historical_crusher_pressure, initial_loading_density)
+    with np.errstate(all="ignore"):
+        target = rows.positive(rows.column(target_historical_crusher_pressure), "target_historical_crusher_pressure")
+        pressure = rows.positive(rows.column(initial_historical_crusher_pressure), "initial_historical_crusher_pressure")
+        density = rows.positive(rows.column(initial_loading_density), "initial_loading_density")
+        values = density * np.sqrt(target / pressure)
+    return _closed_form(rows, values)
@@ -0,0 +1,222 @@
+"""Analytic input sensitivities of the Davis and emulator chains.
+
+Derivatives are carried forward through every closed-form term by the chain
+rule, with one tangent per input stacked on a trailing axis, so a whole
+catalogue is differentiated in one vectorized pass. Values come from the
+batch replays unchanged.
+
+``charge_weight_grains`` is the partial with respect to the charge at fixed
+geometry; every other input is a total derivative through the chain,
+including the charge each chain sets from its loaded capacity. The loading
+density switches in the chains are steps and contribute no derivative.
+Davis Table 4 is piecewise bilinear; at a grid node the slope of the cell
+above the node is reported, or of the cell below at the last node.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .davis import WATER_GRAINS_PER_CUBIC_INCH
+from .davis_batch import BOAT_TAIL_COLUMNS, CompiledTable4, compiled_table4, run_davis_batch
+from .emulator_batch import emulator_chain_batch
+
+DAVIS_SENSITIVITY_INPUTS = (
+    "gross_case_capacity_water_grains",
+    "case_length_inches",
+    "bullet_length_inches",
+    "cartridge_oal_inches",
+    "barrel_length_from_bolt_face_inches",
+    "bullet_weight_grains",
+    "bullet_diameter_inches",
+    *BOAT_TAIL_COLUMNS,
+    "charge_weight_grains",
+)
+EMULATOR_SENSITIVITY_INPUTS = (
+    "gross_capacity_water_grains",
+    "case_length_inches",
+    "bullet_length_inches",
+    "cartridge_length_inches",
+    "barrel_length_inches",
+    "bullet_weight_grains",
+    "bullet_diameter_inches",
+    "charge_weight_grains",
+)
+
+
+@dataclass(frozen=True)
+class SensitivityReport:
+    """Output values and their partial derivatives with respect to each input.
+
+    ``derivatives[output][..., j]`` is the partial of ``output`` with respect
+    to ``inputs[j]``. Rows the chain rejects hold NaN throughout.
+    """
+
+    inputs: tuple[str, ...]
+    input_values: dict[str, np.ndarray]
+    outputs: dict[str, np.ndarray]
+    derivatives: dict[str, np.ndarray]
+    errors: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def partial(self, output: str, input_name: str) -> np.ndarray:
+        return self.derivatives[output][..., self.inputs.index(input_name)]
+
+    def elasticities(self, output: str) -> np.ndarray:
+        """Return ``(x / y) dy/dx`` for every input, stacked on the last axis."""
+        scale = np.stack(np.broadcast_arrays(*(self.input_values[name] for name in self.inputs)), axis=-1)
+        with np.errstate(all="ignore"):
+            return self.derivatives[output] * scale / self.outputs[output][..., None]
+
+    def to_frame(self, output: str):
+        """Return one row per catalogue row and one elasticity column per input."""
+        import pandas as pd
+
+        values = self.elasticities(output)
+        return pd.DataFrame(values.reshape(-1, len(self.inputs)), columns=list(self.inputs))
+
+
+def _basis(names: tuple[str, ...]) -> dict[str, np.ndarray]:
+    return dict(zip(names, np.eye(len(names))))
+
+
+def _table4_slopes(mass_ratio: np.ndarray, ratio: np.ndarray, compiled: CompiledTable4) -> tuple[np.ndarray, np.ndarray]:
+    grid_a = compiled.mass_ratios
+    grid_r = compiled.expansion_ratios
+    a = np.where(np.isfinite(mass_ratio), mass_ratio, grid_a[0])
+    r = np.where(np.isfinite(ratio), ratio, grid_r[0])
+    ia = np.clip(np.searchsorted(grid_a, a, side="right") - 1, 0, len(grid_a) - 2)
+    ir = np.clip(np.searchsorted(grid_r, r, side="right") - 1, 0, len(grid_r) - 2)
+    width_a = grid_a[ia + 1] - grid_a[ia]
+    width_r = grid_r[ir + 1] - grid_r[ir]
+    ta = (a - grid_a[ia]) / width_a
+    tr = (r - grid_r[ir]) / width_r
+    f2 = compiled.f2
+    f00, f01, f10, f11 = f2[ir, ia], f2[ir, ia + 1], f2[ir + 1, ia], f2[ir + 1, ia + 1]
+    by_a = ((1.0 - tr) * (f01 - f00) + tr * (f11 - f10)) / width_a
+    by_r = ((1.0 - ta) * (f10 - f00) + ta * (f11 - f01)) / width_r
+    return by_a, by_r
+
+
+def davis_sensitivity(table: Mapping[str, object], *, table4_lookup: bool = False, table4: CompiledTable4 | None = None) -> SensitivityReport:
+    """Differentiate Davis R, V, and, when computed, F2 and crusher pressure.
+
+    ``table`` takes the same columns as ``run_davis_batch``. A supplied
+    ``table4_f2`` column is a fixed source value with zero derivative; with
+    ``table4_lookup=True`` F2 is differentiated through the interpolation.
+    """
+
+    batch = run_davis_batch(table, table4_lookup=table4_lookup, table4=table4)
+    columns = batch.columns
+    shape = columns["muzzle_velocity_fps"].shape
+    nan = np.float64(np.nan)
+    read = lambda name: np.broadcast_to(np.asarray(table.get(name, nan), dtype=np.float64), shape)
+    diameter = read("bullet_diameter_inches")
+    height = read("boat_tail_height_inches")
+    tail = read("boat_tail_small_diameter_inches")
+    bullet = read("bullet_weight_grains")
+    depth, capacity, travel = columns["seating_depth_inches"], columns["loaded_powder_space_capacity_water_grains"], columns["bullet_travel_inches"]
+    chamber, bore, ratio = columns["powder_chamber_volume_cubic_inches"], columns["effective_bore_volume_cubic_inches"], columns["expansion_ratio"]
+    charge, n_value, moving = columns["initial_charge_weight_grains"], columns["velocity_fraction_n"], columns["effective_moving_weight_grains"]
+    velocity = columns["muzzle_velocity_fps"]
+    e = _basis(DAVIS_SENSITIVITY_INPUTS)
+    col = lambda values: values[..., None]
+    boat_tail = ~(np.isnan(height) & np.isnan(tail))
+    with np.errstate(all="ignore"):
+        d_depth = e["case_length_inches"] + e["bullet_length_inches"] - e["cartridge_oal_inches"]
+        d_displacement = 198.0 * (col(diameter**2) * d_depth + col(2.0 * depth * diameter) * e["bullet_diameter_inches"])
+        d_correction = 66.0 * (
+            col(2.0 * diameter**2 - diameter * tail - tail**2) * e["boat_tail_height_inches"]
+            + col(height * (4.0 * diameter - tail)) * e["bullet_diameter_inches"]
+            - col(height * (diameter + 2.0 * tail)) * e["boat_tail_small_diameter_inches"]
+        )
+        d_correction = np.where(col(boat_tail), d_correction, 0.0)
+        d_capacity = e["gross_case_capacity_water_grains"] - d_displacement + d_correction
+        d_travel = e["barrel_length_from_bolt_face_inches"] + d_depth - e["case_length_inches"]
+        d_chamber = d_capacity / WATER_GRAINS_PER_CUBIC_INCH
+        d_bore = 0.773 * (col(diameter**2) * d_travel + col(2.0 * travel * diameter) * e["bullet_diameter_inches"])
+        d_ratio = (d_bore * col(chamber) - col(bore) * d_chamber) / col(chamber**2)
+        d_charge = col(charge / capacity) * d_capacity + e["charge_weight_grains"]
+        d_n = 0.25 * col(ratio**-1.25) * d_ratio
+        d_moving = e["bullet_weight_grains"] + d_charge / 3.0
+        d_velocity = col(velocity / 2.0) * (d_charge / col(charge) + d_n / col(n_value) - d_moving / col(moving))
+        outputs = {"expansion_ratio": ratio, "muzzle_velocity_fps": velocity}
+        derivatives = {"expansion_ratio": d_ratio, "muzzle_velocity_fps": d_velocity}
+        if "historical_crusher_pressure" in columns:
+            f2, k1, k2, k3 = (columns[name] for name in ("table4_f2", "k1", "k2", "k3"))
+            if "table4_f2" in table:
+                d_f2 = np.zeros(d_ratio.shape)
+            else:
+                mass_ratio = columns["mass_ratio"]
+                by_a, by_r = _table4_slopes(mass_ratio, ratio, table4 or compiled_table4())
+                d_mass_ratio = d_charge / col(bullet) - col(charge / bullet**2) * e["bullet_weight_grains"]
+                d_f2 = col(by_a) * d_mass_ratio + col(by_r) * d_ratio
+            d_k1 = col(k1) * (d_charge / col(charge) + d_f2 / col(f2) + 2.0 * d_velocity / col(velocity))
+            d_k2 = 0.53 * (e["bullet_weight_grains"] / col(charge) - col(bullet / charge**2) * d_charge)
+            d_k3 = d_capacity * col(ratio - 1.0) + col(capacity) * d_ratio
+            pressure = columns["historical_crusher_pressure"]
+            d_pressure = col(pressure) * (d_k1 / col(k1) + d_k2 / col(k2) - d_k3 / col(k3))
+            outputs |= {"table4_f2": f2, "historical_crusher_pressure": pressure}
+            derivatives |= {"table4_f2": d_f2, "historical_crusher_pressure": d_pressure}
+    input_values = {name: read(name) for name in DAVIS_SENSITIVITY_INPUTS if name != "charge_weight_grains"}
+    input_values["charge_weight_grains"] = charge
+    derivatives = {name: np.where(col(np.isnan(outputs[name])), np.nan, values) for name, values in derivatives.items()}
+    return SensitivityReport(DAVIS_SENSITIVITY_INPUTS, input_values, outputs, derivatives, batch.errors)
+
+
+def emulator_sensitivity(
+    gross_capacity_water_grains: object,
+    case_length_inches: object,
+    bullet_length_inches: object,
+    cartridge_length_inches: object,
+    barrel_length_inches: object,
+    bullet_weight_grains: object,
+    bullet_diameter_inches: object,
+) -> SensitivityReport:
+    """Differentiate emulator R, velocity, CUP, and claimed psi."""
+    arguments = (
+        gross_capacity_water_grains,
+        case_length_inches,
+        bullet_length_inches,
+        cartridge_length_inches,
+        barrel_length_inches,
+        bullet_weight_grains,
+        bullet_diameter_inches,
+    )
+    chain = emulator_chain_batch(*arguments)
+    shape = chain.velocity_fps.shape
+    values = dict(zip(EMULATOR_SENSITIVITY_INPUTS, (np.broadcast_to(np.asarray(value, dtype=np.float64), shape) for value in arguments)))
+    bullet, diameter = values["bullet_weight_grains"], values["bullet_diameter_inches"]
+    depth, net, travel, ratio = chain.seating_depth_inches, chain.net_capacity_water_grains, chain.travel_inches, chain.total_expansion_ratio
+    charge, mass_ratio, velocity, density, cup = chain.charge_weight_grains, chain.mass_ratio, chain.velocity_fps, chain.loading_density, chain.pressure_cup
+    e = _basis(EMULATOR_SENSITIVITY_INPUTS)
+    col = lambda values: values[..., None]
+    with np.errstate(all="ignore"):
+        d_depth = e["case_length_inches"] + e["bullet_length_inches"] - e["cartridge_length_inches"]
+        d_net = e["gross_capacity_water_grains"] - 198.0 * (col(diameter**2) * d_depth + col(2.0 * depth * diameter) * e["bullet_diameter_inches"])
+        d_travel = e["barrel_length_inches"] - e["case_length_inches"] + d_depth
+        bore = 0.773 * 252.4 * diameter**2 * travel
+        d_bore = 0.773 * 252.4 * (col(diameter**2) * d_travel + col(2.0 * diameter * travel) * e["bullet_diameter_inches"])
+        d_ratio = (d_bore * col(net) - col(bore) * d_net) / col(net**2)
+        d_charge = col(density) * d_net + e["charge_weight_grains"]
+        d_mass_ratio = d_charge / col(bullet) - col(charge / bullet**2) * e["bullet_weight_grains"]
+        fraction = 1.0 - ratio**-0.25
+        moving = bullet + charge / 3.0
+        d_fraction = 0.25 * col(ratio**-1.25) * d_ratio
+        d_moving = e["bullet_weight_grains"] + d_charge / 3.0
+        d_velocity = col(velocity / 2.0) * (d_charge / col(charge) + d_fraction / col(fraction) - d_moving / col(moving))
+        d_density = d_charge / col(net) - col(charge / net**2) * d_net
+        k2 = 0.53 / mass_ratio + 0.26
+        d_k2 = -0.53 * d_mass_ratio / col(mass_ratio**2)
+        shape_term = 1.071 + ratio - 0.009736 * ratio**2
+        f2 = 0.024075 * (9.3 - mass_ratio) * shape_term
+        d_f2 = 0.024075 * (col(shape_term) * -d_mass_ratio + col((9.3 - mass_ratio) * (1.0 - 2.0 * 0.009736 * ratio)) * d_ratio)
+        d_cup = col(cup) * (
+            2.0 * d_velocity / col(velocity) + d_density / col(density) - d_ratio / col(ratio - 1.0) + d_k2 / col(k2) + d_f2 / col(f2)
+        )
+        d_psi = col(1.0 + 3.2 * cup**2.2 / 1.2e11) * d_cup
+    outputs = {"total_expansion_ratio": ratio, "velocity_fps": velocity, "pressure_cup": cup, "claimed_psi": chain.claimed_psi}
+    derivatives = {"total_expansion_ratio": d_ratio, "velocity_fps": d_velocity, "pressure_cup": d_cup, "claimed_psi": d_psi}
+    values["charge_weight_grains"] = charge
+    derivatives = {name: np.where(col(np.isnan(outputs[name])), np.nan, array) for name, array in derivatives.items()}
+    return SensitivityReport(EMULATOR_SENSITIVITY_INPUTS, values, outputs, derivatives, chain.errors)
@@ -0,0 +1,96 @@
+"""Cartesian parameter sweeps over the emulator and Davis batch replays.
+
+Each named axis occupies one dimension of the result grid, and fixed inputs
+broadcast across all of them. The batch replays keep every intermediate term
+at the shape of the inputs it depends on, so a term such as sectional density
+is evaluated once when neither bullet weight nor diameter is swept.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields
+
+import numpy as np
+
+from ._batch import failure_reasons
+from .davis_batch import CompiledTable4, DavisBatch, run_davis_batch
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Named output grids labelled by the swept axes, with failed cells masked."""
+
+    axes: dict[str, np.ndarray]
+    values: dict[str, np.ndarray]
+    errors: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(len(values) for values in self.axes.values())
+
+    @property
+    def invalid(self) -> np.ndarray:
+        mask = np.zeros(self.shape, dtype=bool)
+        for cells in self.errors.values():
+            mask |= cells
+        return mask
+
+    @property
+    def reasons(self) -> np.ndarray:
+        return failure_reasons(self.errors, self.shape)
+
+    def to_frame(self):
+        """Return one row per grid cell under a pandas MultiIndex of the axes."""
+        import pandas as pd
+
+        index = pd.MultiIndex.from_product(list(self.axes.values()), names=list(self.axes))
+        columns = {name: values.ravel() for name, values in self.values.items()}
+        return pd.DataFrame({**columns, "failure_reason": self.reasons.ravel()}, index=index)
+
+
+def _grid_inputs(axes: Mapping[str, object], fixed: Mapping[str, object]) -> tuple[dict[str, np.ndarray], dict[str, object]]:
+    overlap = set(axes) & set(fixed)
+    if overlap:
+        raise ValueError(f"sweep inputs are both swept and fixed: {', '.join(sorted(overlap))}")
+    if not axes:
+        raise ValueError("sweep requires at least one axis")
+    labels: dict[str, np.ndarray] = {}
+    inputs: dict[str, object] = dict(fixed)
+    for position, (name, values) in enumerate(axes.items()):
+        array = np.asarray(values)
+        if array.ndim != 1 or array.size == 0:
+            raise ValueError(f"sweep axis {name} must be a nonempty one-dimensional sequence")
+        labels[name] = array
+        shape = [1] * len(axes)
+        shape[position] = array.size
+        inputs[name] = array.reshape(shape)
+    for name, value in fixed.items():
+        if np.ndim(value) != 0:
+            raise ValueError(f"fixed sweep input {name} must be a scalar")
+    return labels, inputs
+
+
+def _outputs(result: object) -> dict[str, np.ndarray]:
+    if isinstance(result, DavisBatch):
+        return dict(result.columns)
+    return {item.name: getattr(result, item.name) for item in fields(result) if item.name != "errors"}
+
+
+def sweep(batch_function: Callable[..., object], axes: Mapping[str, object], fixed: Mapping[str, object] | None = None, **options: object) -> SweepResult:
+    """Evaluate an emulator ``*_batch`` function over the Cartesian product of axes.
+
+    ``axes`` and ``fixed`` are keyword arguments of ``batch_function``; for
+    example ``sweep(velocity_fps_batch, {"charge_weight_grains": charges,
+    "total_expansion_ratio": ratios}, {"bullet_weight_grains": 150.0})``.
+    """
+
+    labels, inputs = _grid_inputs(axes, fixed or {})
+    result = batch_function(**inputs, **options)
+    return SweepResult(labels, _outputs(result), dict(result.errors))
+
+
+def sweep_davis(axes: Mapping[str, object], fixed: Mapping[str, object] | None = None, *, table4_lookup: bool = False, table4: CompiledTable4 | None = None) -> SweepResult:
+    """Evaluate ``run_davis_batch`` over the Cartesian product of Davis input axes."""
+
+    labels, inputs = _grid_inputs(axes, fixed or {})
+    result = run_davis_batch(inputs, table4_lookup=table4_lookup, table4=table4)
+    return SweepResult(labels, _outputs(result), dict(result.errors))
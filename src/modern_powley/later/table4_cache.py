@@ -0,0 +1,115 @@
+"""Memory-mappable binary sidecar for the validated Davis Table 4.
+
+The sidecar is written only after the ``load_table4`` schema, provenance, and
+monotonicity validation has run over the very CSV bytes whose SHA-256 keys it,
+together with ``TABLE4_VALIDATOR_VERSION``; any mismatch, truncation, or
+payload-checksum failure falls back to full validation and rewrites it.
+"""
+
+import hashlib
+import io
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from . import davis
+from .davis_batch import CompiledTable4, _compile_table4
+
+CACHE_FORMAT_VERSION = 1
+_MAGIC = b"MPDAVT4\x00"
+_HEADER = struct.Struct("<8sII32s32sII")
+_HEADER_SIZE = 128
+
+
+def table4_csv_sha256() -> str:
+    """Return the SHA-256 of the Table 4 CSV currently configured in ``davis``."""
+    return hashlib.sha256(davis.TABLE4_PATH.read_bytes()).hexdigest()
+
+
+def table4_cache_path(cache_dir: Path, csv_sha256: str | None = None) -> Path:
+    digest = table4_csv_sha256() if csv_sha256 is None else csv_sha256
+    return Path(cache_dir) / f"davis_1981_table4-{digest[:16]}-v{davis.TABLE4_VALIDATOR_VERSION}.bin"
+
+
+def _payload(compiled: CompiledTable4) -> np.ndarray:
+    return np.concatenate((compiled.mass_ratios, compiled.expansion_ratios, compiled.f2.ravel(), compiled.f2_steps.ravel()))
+
+
+def _write(cache_dir: Path, csv_bytes: bytes) -> Path:
+    # Parse the hashed bytes themselves rather than the lru_cached load_table4,
+    # which may hold a table read before the CSV changed on disk.
+    digest = hashlib.sha256(csv_bytes).hexdigest()
+    compiled = _compile_table4(davis._parse_table4(io.StringIO(csv_bytes.decode("utf-8"), newline="")))
+    payload = _payload(compiled).tobytes()
+    rows, columns = compiled.f2.shape
+    header = _HEADER.pack(_MAGIC, CACHE_FORMAT_VERSION, davis.TABLE4_VALIDATOR_VERSION, bytes.fromhex(digest), hashlib.sha256(payload).digest(), rows, columns)
+    path = table4_cache_path(cache_dir, digest)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as stream:
+            stream.write(header.ljust(_HEADER_SIZE, b"\x00"))
+            stream.write(payload)
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def write_table4_cache(cache_dir: Path) -> Path:
+    """Validate Table 4 from CSV and atomically write its binary sidecar."""
+    return _write(cache_dir, davis.TABLE4_PATH.read_bytes())
+
+
+def _read(path: Path, digest: str) -> CompiledTable4 | None:
+    try:
+        with path.open("rb") as stream:
+            header = stream.read(_HEADER_SIZE)
+    except OSError:
+        return None
+    if len(header) != _HEADER_SIZE:
+        return None
+    magic, format_version, validator_version, csv_digest, payload_digest, rows, columns = _HEADER.unpack_from(header)
+    if (magic, format_version, validator_version, csv_digest) != (_MAGIC, CACHE_FORMAT_VERSION, davis.TABLE4_VALIDATOR_VERSION, bytes.fromhex(digest)):
+        return None
+    count = columns + rows + 2 * rows * columns
+    if path.stat().st_size != _HEADER_SIZE + 8 * count:
+        return None
+    payload = np.memmap(path, dtype="<f8", mode="r", offset=_HEADER_SIZE, shape=(count,))
+    if hashlib.sha256(payload).digest() != payload_digest:
+        return None
+    mass_ratios = payload[:columns]
+    expansion_ratios = payload[columns : columns + rows]
+    f2 = payload[columns + rows : columns + rows + rows * columns].reshape(rows, columns)
+    steps = payload[columns + rows + rows * columns :].reshape(rows, columns)
+    table = davis.Table4(
+        table_id="Davis Table 4",
+        source_id=davis.TABLE4_SOURCE_ID,
+        authority_source_id=davis.SOURCE_ID,
+        source_classification=davis.TABLE4_SOURCE_CLASSIFICATION,
+        verification_status=davis.TABLE4_VERIFICATION_STATUS,
+        confidence="medium",
+        mass_ratios=tuple(mass_ratios.tolist()),
+        rows=tuple(davis.Table4Row(ratio, tuple(values)) for ratio, values in zip(expansion_ratios.tolist(), f2.tolist())),
+    )
+    return CompiledTable4(table, mass_ratios, expansion_ratios, f2, steps)
+
+
+def load_table4_cache(cache_dir: Path) -> CompiledTable4:
+    """Memory-map the validated sidecar, rebuilding it when the key differs.
+
+    Each process-pool worker can call this once and pass the result as the
+    ``table4`` argument of the Davis batch functions.
+    """
+    csv_bytes = davis.TABLE4_PATH.read_bytes()
+    digest = hashlib.sha256(csv_bytes).hexdigest()
+    compiled = _read(table4_cache_path(cache_dir, digest), digest)
+    if compiled is None:
+        compiled = _read(_write(cache_dir, csv_bytes), digest)
+        if compiled is None:
+            raise RuntimeError("Davis Table 4 binary cache could not be read back after writing")
+    return compiled
@@ -0,0 +1,303 @@
+"""Seedable Monte Carlo propagation of declared M01 uncertainty through geometry.
+
+M01 records carry bounds, not distributions, so every sampled record needs a
+caller-declared, justified sampling distribution over its declared bounds;
+none is assumed. A record whose uncertainty is ``UNKNOWN`` is never sampled
+and leaves the propagated result unresolved.
+
+Dependence is declared, not inferred: the uncertainties of distinct records
+are assumed independent, so each record is sampled from its own stream and
+no correlation between records is modelled. Inputs that share one record
+identity share its draws and are therefore fully dependent. Records whose
+errors share a cause, such as one instrument or one calibration, should be
+expressed as one record; otherwise the propagated spread may be understated.
+
+The sample kernels evaluate the M01 geometry formula cores on arrays in SI units.
+Draws for which the scalar M01 function would raise are returned as NaN and
+counted as out of domain rather than clipped or redrawn.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+
+import numpy as np
+
+from ..modernized.geometry import (
+    circle_area_si,
+    estimate_geometric_usable_powder_space,
+    full_boat_tail_volume_si,
+    partial_boat_tail_volume_si,
+)
+from ..modernized.records import (
+    DiameterConvention,
+    FirearmRecord,
+    GrossCaseCapacity,
+    PhysicalValue,
+    PrimerPocketTreatment,
+    PrimerPocketVolume,
+    ProjectileRecord,
+)
+from ..modernized.uncertainty import UncertaintyKind
+
+DEFAULT_BATCH_SIZE = 1 << 16
+DEFAULT_PERCENTILES = (2.5, 50.0, 97.5)
+
+
+class SamplingDistribution(str, Enum):
+    """Distribution shapes a caller may declare over an M01 uncertainty bound."""
+    UNIFORM = "uniform"
+    TRIANGULAR = "triangular"
+
+
+@dataclass(frozen=True)
+class DeclaredDistribution:
+    """A caller-declared sampling distribution and the reason it applies."""
+
+    distribution: SamplingDistribution
+    justification: str
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "distribution", SamplingDistribution(self.distribution))
+        if not self.justification.strip():
+            raise ValueError("declared sampling distribution requires justification")
+
+
+@dataclass(frozen=True)
+class PropagationSummary:
+    """Percentile summary of a propagated result in SI units.
+
+    ``unknown_record_ids`` lists inputs whose uncertainty is unknown; when it
+    is nonempty nothing was sampled and every summary statistic is ``None``.
+    The statistics assume the input records' uncertainties are independent.
+    """
+
+    input_record_ids: tuple[str, ...]
+    unknown_record_ids: tuple[str, ...]
+    draws: int
+    out_of_domain_draws: int = 0
+    mean: float | None = None
+    minimum: float | None = None
+    maximum: float | None = None
+    percentiles: dict[float, float] = field(default_factory=dict)
+    samples: np.ndarray | None = None
+
+    @property
+    def resolved(self) -> bool:
+        return not self.unknown_record_ids and bool(self.percentiles)
+
+    def interval(self, lower: float = DEFAULT_PERCENTILES[0], upper: float = DEFAULT_PERCENTILES[-1]) -> tuple[float, float] | None:
+        """Return the requested percentile interval, or ``None`` if unresolved."""
+        if not self.resolved:
+            return None
+        return self.percentiles[float(lower)], self.percentiles[float(upper)]
+
+
+def uncertainty_bounds(value: PhysicalValue) -> tuple[float, float] | None:
+    """Return the declared SI bounds of a value, or ``None`` when unknown.
+
+    Symmetric uncertainty spans the magnitude either side of the value, an
+    instrument resolution spans half a resolution step either side, and a
+    bounded interval is used as recorded.
+    """
+
+    uncertainty = value.uncertainty
+    center = value.quantity.si_value
+    if uncertainty.kind is UncertaintyKind.UNKNOWN:
+        return None
+    if uncertainty.kind is UncertaintyKind.BOUNDED_INTERVAL:
+        return uncertainty.lower.si_value, uncertainty.upper.si_value
+    half_width = uncertainty.magnitude.si_value
+    if uncertainty.kind is UncertaintyKind.INSTRUMENT_RESOLUTION:
+        half_width /= 2.0
+    return center - half_width, center + half_width
+
+
+def _sampler(value: PhysicalValue, declared: DeclaredDistribution) -> Callable[[np.ndarray], np.ndarray]:
+    lower, upper = uncertainty_bounds(value)
+    width = upper - lower
+    if declared.distribution is SamplingDistribution.UNIFORM:
+        return lambda uniform: lower + width * uniform
+    mode = value.quantity.si_value
+    if not lower <= mode <= upper:
+        raise ValueError(f"value {value.record_id} lies outside its declared uncertainty bounds")
+    if width == 0:
+        return lambda uniform: np.full(uniform.shape, mode)
+    split = (mode - lower) / width
+
+    def triangular(uniform: np.ndarray) -> np.ndarray:
+        rising = lower + np.sqrt(uniform * width * (mode - lower))
+        falling = upper - np.sqrt((1.0 - uniform) * width * (upper - mode))
+        return np.where(uniform < split, rising, falling)
+
+    return triangular
+
+
+def _positive(*arrays: np.ndarray) -> np.ndarray:
+    mask = np.ones(np.broadcast_shapes(*(np.shape(array) for array in arrays)), dtype=bool)
+    for array in arrays:
+        mask &= np.isfinite(array) & (array > 0)
+    return mask
+
+
+def barrel_swept_volume_samples(diameter: np.ndarray, travel: np.ndarray) -> np.ndarray:
+    """Sampled bore area times projectile travel, in cubic metres."""
+    volume = circle_area_si(diameter) * travel
+    return np.where(_positive(diameter, travel), volume, np.nan)
+
+
+def total_expansion_ratio_samples(barrel_volume: np.ndarray, usable_powder_space_volume: np.ndarray) -> np.ndarray:
+    """Sampled (V0+Vb)/V0."""
+    ratio = 1.0 + barrel_volume / usable_powder_space_volume
+    return np.where(_positive(barrel_volume, usable_powder_space_volume), ratio, np.nan)
+
+
+def usable_powder_space_samples(
+    gross_volume: np.ndarray,
+    shank_diameter: np.ndarray,
+    seating_depth: np.ndarray,
+    boat_tail_base_diameter: np.ndarray | None = None,
+    boat_tail_length: np.ndarray | None = None,
+    primer_pocket_addition: np.ndarray | None = None,
+    primer_pocket_removal: np.ndarray | None = None,
+) -> np.ndarray:
+    """Sampled gross volume, primer-pocket corrected, less seated displacement."""
+    valid = _positive(gross_volume, shank_diameter, seating_depth)
+    adjusted = np.asarray(gross_volume, dtype=np.float64)
+    if primer_pocket_addition is not None:
+        valid &= _positive(primer_pocket_addition)
+        adjusted = adjusted + primer_pocket_addition
+    if primer_pocket_removal is not None:
+        valid &= _positive(primer_pocket_removal)
+        adjusted = adjusted - primer_pocket_removal
+    if boat_tail_length is None:
+        displacement = circle_area_si(shank_diameter) * seating_depth
+    else:
+        shank, base, height, seated = shank_diameter, boat_tail_base_diameter, boat_tail_length, seating_depth
+        valid &= _positive(base, height) & (base <= shank)
+        partial = partial_boat_tail_volume_si(shank, base, height, np.minimum(seated, height))
+        full = full_boat_tail_volume_si(shank, base, height, seated)
+        displacement = np.where(seated <= height, partial, full)
+    usable = adjusted - displacement
+    return np.where(valid & (usable > 0), usable, np.nan)
+
+
+def expansion_ratio_from_geometry_samples(diameter: np.ndarray, travel: np.ndarray, **usable_inputs: np.ndarray) -> np.ndarray:
+    """Sampled total expansion ratio from barrel and usable-space geometry."""
+    return total_expansion_ratio_samples(barrel_swept_volume_samples(diameter, travel), usable_powder_space_samples(**usable_inputs))
+
+
+def usable_powder_space_inputs(
+    gross_capacity: GrossCaseCapacity,
+    projectile: ProjectileRecord,
+    desired_primer_pocket_treatment: PrimerPocketTreatment,
+    *,
+    primer_pocket_volume: PrimerPocketVolume | None = None,
+) -> dict[str, PhysicalValue]:
+    """Map the records behind a geometric usable-space estimate to kernel inputs.
+
+    The scalar M01 estimate is evaluated first so every record-level check
+    applies unchanged before anything is sampled.
+    """
+
+    estimate_geometric_usable_powder_space(gross_capacity, projectile, desired_primer_pocket_treatment, result_id="PROPAGATION", primer_pocket_volume=primer_pocket_volume, assumptions=("uncertainty propagation",))
+    inputs = {
+        "gross_volume": gross_capacity.water_volume,
+        "shank_diameter": projectile.cylindrical_shank_diameter or projectile.diameter,
+        "seating_depth": projectile.seating_depth.value,
+    }
+    if projectile.boat_tail_length is not None:
+        inputs["boat_tail_base_diameter"] = projectile.boat_tail_base_diameter
+        inputs["boat_tail_length"] = projectile.boat_tail_length
+    source = gross_capacity.conditions.primer_pocket_treatment
+    if source is not PrimerPocketTreatment(desired_primer_pocket_treatment):
+        name = "primer_pocket_addition" if source is PrimerPocketTreatment.EXCLUDED else "primer_pocket_removal"
+        inputs[name] = primer_pocket_volume.volume
+    return inputs
+
+
+def expansion_ratio_inputs(
+    gross_capacity: GrossCaseCapacity,
+    projectile: ProjectileRecord,
+    firearm: FirearmRecord,
+    desired_primer_pocket_treatment: PrimerPocketTreatment,
+    diameter_convention: DiameterConvention,
+    *,
+    primer_pocket_volume: PrimerPocketVolume | None = None,
+) -> dict[str, PhysicalValue]:
+    """Map records to ``expansion_ratio_from_geometry_samples`` inputs."""
+    convention = DiameterConvention(diameter_convention)
+    diameter = {
+        DiameterConvention.BORE: firearm.bore_diameter,
+        DiameterConvention.GROOVE: firearm.groove_diameter,
+        DiameterConvention.PROJECTILE: projectile.diameter,
+        DiameterConvention.EXPLICIT_EFFECTIVE: firearm.effective_diameter,
+    }[convention]
+    if diameter is None:
+        raise ValueError(f"{convention.value} diameter is not recorded")
+    if firearm.projectile_travel is None:
+        raise ValueError("projectile travel is not recorded")
+    inputs = usable_powder_space_inputs(gross_capacity, projectile, desired_primer_pocket_treatment, primer_pocket_volume=primer_pocket_volume)
+    return {"diameter": diameter, "travel": firearm.projectile_travel.value, **inputs}
+
+
+def propagate(
+    kernel: Callable[..., np.ndarray],
+    inputs: Mapping[str, PhysicalValue],
+    distributions: Mapping[str, DeclaredDistribution],
+    *,
+    draws: int,
+    seed: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    percentiles: tuple[float, ...] = DEFAULT_PERCENTILES,
+    keep_samples: bool = False,
+) -> PropagationSummary:
+    """Propagate declared uncertainty through a sample kernel in batches.
+
+    ``inputs`` maps kernel keyword names to M01 values and ``distributions``
+    maps record identities to declared distributions. Each record draws from
+    its own stream spawned from ``seed``, so results for a given seed do not
+    depend on ``batch_size``. Distinct records are sampled as independent;
+    inputs sharing a record identity share its draws.
+    """
+
+    if draws < 1 or batch_size < 1:
+        raise ValueError("draws and batch_size must be positive")
+    if not all(0.0 <= float(item) <= 100.0 for item in percentiles):
+        raise ValueError("percentiles must lie between 0 and 100")
+    records: dict[str, PhysicalValue] = {}
+    for value in inputs.values():
+        if records.setdefault(value.record_id, value) != value:
+            raise ValueError(f"inputs share record_id {value.record_id} with different values")
+    record_ids = tuple(records)
+    unknown = tuple(record_id for record_id, value in records.items() if value.uncertainty.kind is UncertaintyKind.UNKNOWN)
+    if unknown:
+        return PropagationSummary(record_ids, unknown, 0)
+    missing = [record_id for record_id in record_ids if record_id not in distributions]
+    if missing:
+        raise ValueError(f"no declared sampling distribution for {', '.join(missing)}")
+    samplers = {record_id: _sampler(value, distributions[record_id]) for record_id, value in records.items()}
+    streams = dict(zip(record_ids, np.random.default_rng(seed).spawn(len(record_ids))))
+    results = np.empty(draws, dtype=np.float64)
+    for start in range(0, draws, batch_size):
+        count = min(batch_size, draws - start)
+        drawn = {record_id: samplers[record_id](streams[record_id].random(count)) for record_id in record_ids}
+        results[start:start + count] = kernel(**{name: drawn[value.record_id] for name, value in inputs.items()})
+    accepted = results[~np.isnan(results)]
+    rejected = draws - accepted.size
+    samples = results if keep_samples else None
+    if not accepted.size:
+        return PropagationSummary(record_ids, (), draws, rejected, samples=samples)
+    levels = tuple(float(item) for item in percentiles)
+    values = np.percentile(accepted, levels)
+    return PropagationSummary(
+        record_ids,
+        (),
+        draws,
+        rejected,
+        float(accepted.mean()),
+        float(accepted.min()),
+        float(accepted.max()),
+        dict(zip(levels, (float(item) for item in values))),
+        samples,
+    )
@@ -0,0 +1,202 @@
+"""Compact binary archives of tagged M01-M05 and empirical-load records.
+
+An archive stores each record's strict tagged dictionary, not a new schema.
+Every distinct string (field names, enum values, identifiers) is written once
+in a string table and every distinct object key layout once in a shape table,
+so a record body holds only small table indices, length prefixes, and raw
+IEEE-754 doubles. Decoding rebuilds the tagged dictionaries one record at a
+time and passes them through the same strict milestone decoders as JSON,
+sharing one ``EmpiricalDecodingScope`` per archive as ``iter_jsonl_records``
+does per stream, so records round-trip to equal dataclasses and re-export to
+identical canonical JSON.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .empirical_load_serialization import EmpiricalDecodingScope
+from .jsonl import TaggedRecord, tagged_record_from_dict, tagged_record_to_dict
+
+BINARY_FORMAT_VERSION = 1
+_MAGIC = b"MPREC\x00"
+_DOUBLE = struct.Struct("<d")
+
+_NULL, _FALSE, _TRUE, _INTEGER, _FLOAT, _STRING, _LIST, _OBJECT = range(8)
+
+
+def _varint(value: int, out: bytearray) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Tables:
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.shapes: dict[tuple[int, ...], int] = {}
+
+    def string(self, value: str) -> int:
+        return self.strings.setdefault(value, len(self.strings))
+
+    def encode(self, value: Any, out: bytearray) -> None:
+        kind = type(value)
+        if value is None:
+            out.append(_NULL)
+        elif kind is bool:
+            out.append(_TRUE if value else _FALSE)
+        elif kind is int:
+            out.append(_INTEGER)
+            _varint(value << 1 if value >= 0 else ((-value) << 1) - 1, out)
+        elif kind is float:
+            if not math.isfinite(value):
+                raise ValueError(f"non-finite number is prohibited: {value}")
+            out.append(_FLOAT)
+            out += _DOUBLE.pack(value)
+        elif kind is str:
+            out.append(_STRING)
+            _varint(self.string(value), out)
+        elif kind is list:
+            out.append(_LIST)
+            _varint(len(value), out)
+            for item in value:
+                self.encode(item, out)
+        elif kind is dict:
+            shape = tuple(self.string(key) for key in value)
+            out.append(_OBJECT)
+            _varint(self.shapes.setdefault(shape, len(self.shapes)), out)
+            for item in value.values():
+                self.encode(item, out)
+        else:
+            raise TypeError(f"unsupported serialized value type: {kind.__name__}")
+
+
+def dumps_binary_records(records: Iterable[TaggedRecord]) -> bytes:
+    """Encode records as one compact archive in input order."""
+    tables = _Tables()
+    bodies = []
+    for record in records:
+        body = bytearray()
+        tables.encode(tagged_record_to_dict(record), body)
+        bodies.append(body)
+    out = bytearray(_MAGIC)
+    out.append(BINARY_FORMAT_VERSION)
+    _varint(len(tables.strings), out)
+    for text in tables.strings:
+        encoded = text.encode("utf-8")
+        _varint(len(encoded), out)
+        out += encoded
+    _varint(len(tables.shapes), out)
+    for shape in tables.shapes:
+        _varint(len(shape), out)
+        for index in shape:
+            _varint(index, out)
+    _varint(len(bodies), out)
+    for body in bodies:
+        _varint(len(body), out)
+        out += body
+    return bytes(out)
+
+
+class _Reader:
+    def __init__(self, payload: bytes) -> None:
+        self.payload = memoryview(payload)
+        self.position = 0
+        self.strings: list[str] = []
+        self.shapes: list[tuple[str, ...]] = []
+
+    def varint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self.payload[self.position]
+            self.position += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def take(self, size: int) -> memoryview:
+        end = self.position + size
+        if end > len(self.payload):
+            raise IndexError("truncated archive")
+        chunk = self.payload[self.position : end]
+        self.position = end
+        return chunk
+
+    def value(self) -> Any:
+        tag = self.payload[self.position]
+        self.position += 1
+        if tag == _STRING:
+            return self.strings[self.varint()]
+        if tag == _OBJECT:
+            keys = self.shapes[self.varint()]
+            return {key: self.value() for key in keys}
+        if tag == _LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == _INTEGER:
+            encoded = self.varint()
+            return encoded >> 1 if not encoded & 1 else -((encoded + 1) >> 1)
+        if tag == _FLOAT:
+            number = _DOUBLE.unpack(self.take(_DOUBLE.size))[0]
+            if not math.isfinite(number):
+                raise ValueError(f"non-finite number is prohibited: {number}")
+            return number
+        if tag == _NULL:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        raise ValueError(f"unknown value tag: {tag}")
+
+
+def iter_binary_records(payload: bytes) -> Iterator[TaggedRecord]:
+    """Lazily decode an archive through the strict milestone decoders.
+
+    Only one record's dictionary is held at a time. Structural damage raises
+    ``ValueError("invalid binary record archive")``, at the latest once the
+    last record has been yielded; a structurally sound but invalid record
+    raises its decoder's own error.
+    """
+    if not isinstance(payload, (bytes, bytearray, memoryview)):
+        raise TypeError("binary record archive must be bytes")
+    reader = _Reader(payload)
+    try:
+        if bytes(reader.take(len(_MAGIC))) != _MAGIC:
+            raise ValueError("not a binary record archive")
+        version = reader.take(1)[0]
+        if version != BINARY_FORMAT_VERSION:
+            raise ValueError(f"unsupported binary format version: {version}")
+        reader.strings = [str(reader.take(reader.varint()), "utf-8") for _ in range(reader.varint())]
+        reader.shapes = [tuple(reader.strings[reader.varint()] for _ in range(reader.varint())) for _ in range(reader.varint())]
+        if any(len(set(shape)) != len(shape) for shape in reader.shapes):
+            raise ValueError("duplicate object key in shape table")
+        count = reader.varint()
+    except (IndexError, UnicodeDecodeError, ValueError) as error:
+        raise ValueError("invalid binary record archive") from error
+    scope = EmpiricalDecodingScope()
+    for _ in range(count):
+        try:
+            end = reader.varint() + reader.position
+            data = reader.value()
+            if reader.position != end:
+                raise ValueError("record length prefix does not match its body")
+        except (IndexError, RecursionError, ValueError) as error:
+            raise ValueError("invalid binary record archive") from error
+        with scope:
+            record = tagged_record_from_dict(data)
+        yield record
+    try:
+        if reader.position != len(reader.payload):
+            raise ValueError("trailing bytes after the last record")
+    except ValueError as error:
+        raise ValueError("invalid binary record archive") from error
+
+
+def loads_binary_records(payload: bytes) -> tuple[TaggedRecord, ...]:
+    """Decode a whole archive; errors are those of ``iter_binary_records``."""
+    return tuple(iter_binary_records(payload))
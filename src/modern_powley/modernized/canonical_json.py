@@ -0,0 +1,45 @@
+"""Canonical JSON for tagged records, byte-identical to the ``dumps_*`` functions.
+
+Every ``dumps_*`` call builds a fresh ``JSONEncoder`` and runs the encoder's
+circular-reference bookkeeping over a tree that ``to_dict`` has just created
+and that therefore cannot be cyclic. Here one encoder per indent is built once
+and reused with that bookkeeping disabled.
+
+No encoder that writes records without building their dictionaries was built:
+each record's tree still comes from its milestone ``to_dict``, which dominates
+the cost, so the saving over ``dumps_*`` is small (about 6-12% on 16k
+empirical-load records, and within run-to-run noise on a loaded machine).
+JSON Lines output is written by ``jsonl.write_jsonl_records``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+from .jsonl import TaggedRecord, tagged_record_to_dict
+
+
+@lru_cache(maxsize=None)
+def _encoder(indent: int | None) -> json.JSONEncoder:
+    return json.JSONEncoder(allow_nan=False, check_circular=False, indent=indent, sort_keys=True)
+
+
+def _checked_indent(indent: int | None) -> int | None:
+    if indent is not None and (isinstance(indent, bool) or not isinstance(indent, int) or indent < 0):
+        raise ValueError("indent must be a non-negative integer or None")
+    return indent
+
+
+def canonical_dumps(record: TaggedRecord, *, indent: int | None = 2) -> str:
+    """Encode one record exactly as its milestone ``dumps_*`` function does."""
+    return _encoder(_checked_indent(indent)).encode(tagged_record_to_dict(record))
+
+
+def iter_canonical_dumps(records: Iterable[TaggedRecord], *, indent: int | None = 2) -> Iterator[str]:
+    """Lazily encode many records, one canonical document per record."""
+    encode = _encoder(_checked_indent(indent)).encode
+    for record in records:
+        yield encode(tagged_record_to_dict(record))
+
@@ -0,0 +1,148 @@
+"""Corpus-wide pairwise property-observation comparison, blocked and parallel.
+
+Observations are grouped into blocks by (powder identity record, property
+definition), and ``compare_property_observations`` runs on every pair inside
+a block only; pairs across blocks are never compared. Each block is cut into
+tasks of consecutive left-hand observations holding about ``pairs_per_task``
+pairs, so one large block neither becomes one huge result list nor serializes
+the scan. Tasks are spread over a ``ProcessPoolExecutor`` with only a few per
+worker in flight at a time. Every worker receives the blocks once, when it
+starts, and a task names only a block index and a range of left positions.
+The resulting ``ConflictComparison`` records
+come back in a deterministic order: blocks by first appearance in the corpus,
+then pairs by corpus position.
+
+Run as ``python -m modern_powley.modernized.conflict_scan ARCHIVE.jsonl``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import IO
+
+from .jsonl import iter_jsonl_records, write_jsonl_records
+from .powder_properties import PropertyDefinition
+from .property_conflicts import ConflictComparison, NumericComparison, compare_property_observations
+from .property_observations import PowderPropertyObservation
+
+
+def observation_blocks(observations: Iterable[PowderPropertyObservation]) -> dict[tuple[str, PropertyDefinition], tuple[PowderPropertyObservation, ...]]:
+    """Group observations by identity record and exact property definition."""
+    blocks: dict[tuple[str, PropertyDefinition], list[PowderPropertyObservation]] = {}
+    for item in observations:
+        blocks.setdefault((item.powder_identity_id, item.property_definition), []).append(item)
+    return {key: tuple(items) for key, items in blocks.items()}
+
+
+_WORKER_BLOCKS: tuple[tuple[PowderPropertyObservation, ...], ...] = ()
+
+
+def _iter_pairs(block: tuple[PowderPropertyObservation, ...], start: int, stop: int, result_id_prefix: str, numeric_comparisons: frozenset[NumericComparison] | None) -> Iterator[ConflictComparison]:
+    for index in range(start, stop):
+        left = block[index]
+        for right in block[index + 1 :]:
+            comparison = compare_property_observations(left, right, result_id=f"{result_id_prefix}:{left.record_id}:{right.record_id}")
+            if numeric_comparisons is None or comparison.numeric_comparison in numeric_comparisons:
+                yield comparison
+
+
+def _install_blocks(blocks: tuple[tuple[PowderPropertyObservation, ...], ...]) -> None:
+    global _WORKER_BLOCKS
+    _WORKER_BLOCKS = blocks
+
+
+def _compare_task(block_index: int, start: int, stop: int, result_id_prefix: str, numeric_comparisons: frozenset[NumericComparison] | None) -> list[ConflictComparison]:
+    return list(_iter_pairs(_WORKER_BLOCKS[block_index], start, stop, result_id_prefix, numeric_comparisons))
+
+
+def _tasks(blocks: Sequence[tuple[PowderPropertyObservation, ...]], pairs_per_task: int) -> Iterator[tuple[int, int, int]]:
+    """Cut blocks into ``(block_index, start, stop)`` ranges of left positions."""
+    for block_index, block in enumerate(blocks):
+        start = 0
+        while start < len(block) - 1:
+            stop, pairs = start, 0
+            while stop < len(block) - 1 and (pairs == 0 or pairs + len(block) - 1 - stop <= pairs_per_task):
+                pairs += len(block) - 1 - stop
+                stop += 1
+            yield block_index, start, stop
+            start = stop
+
+
+def iter_conflict_comparisons(
+    observations: Iterable[PowderPropertyObservation],
+    *,
+    workers: int | None = None,
+    numeric_comparisons: Iterable[NumericComparison] | None = None,
+    result_id_prefix: str = "CONFLICT",
+    pairs_per_task: int = 4096,
+) -> Iterator[ConflictComparison]:
+    """Yield within-block comparisons, optionally only those with given numeric outcomes.
+
+    ``workers=1`` compares in this process, one pair at a time. Otherwise at
+    most two tasks per worker are queued ahead of the one being yielded.
+    Record IDs are ``"{result_id_prefix}:{left}:{right}"``.
+    """
+    if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int) or workers < 1):
+        raise ValueError("workers must be a positive integer")
+    if isinstance(pairs_per_task, bool) or not isinstance(pairs_per_task, int) or pairs_per_task < 1:
+        raise ValueError("pairs_per_task must be a positive integer")
+    if not result_id_prefix.strip():
+        raise ValueError("result_id_prefix is required")
+    wanted = None if numeric_comparisons is None else frozenset(NumericComparison(item) for item in numeric_comparisons)
+    blocks = tuple(block for block in observation_blocks(observations).values() if len(block) > 1)
+    if workers == 1 or not blocks:
+        for block in blocks:
+            yield from _iter_pairs(block, 0, len(block) - 1, result_id_prefix, wanted)
+        return
+    limit = 2 * (workers or os.cpu_count() or 1)
+    pending: deque[Future[list[ConflictComparison]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_install_blocks, initargs=(blocks,)) as pool:
+        for block_index, start, stop in _tasks(blocks, pairs_per_task):
+            pending.append(pool.submit(_compare_task, block_index, start, stop, result_id_prefix, wanted))
+            if len(pending) >= limit:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_conflict_comparisons(stream: IO[str], observations: Iterable[PowderPropertyObservation], **options) -> int:
+    """Stream comparisons to ``stream`` as JSON Lines and return the count.
+
+    Keyword options are those of ``iter_conflict_comparisons``.
+    """
+    return write_jsonl_records(stream, iter_conflict_comparisons(observations, **options))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare property observations pairwise within (identity, definition) blocks.")
+    parser.add_argument("archive", type=Path, help="JSON Lines archive containing property observations")
+    parser.add_argument("--output", type=Path, help="comparison JSON Lines file (default: standard output)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--numeric", action="append", choices=[item.value for item in NumericComparison], help="keep only comparisons with this numeric outcome (repeatable)")
+    arguments = parser.parse_args(argv)
+    observations = []
+    failed = False
+    with arguments.archive.open(encoding="utf-8") as stream:
+        for line in iter_jsonl_records(stream):
+            if not line.ok:
+                sys.stderr.write(f"{arguments.archive}:{line.line_number}: {line.error}\n")
+                failed = True
+            elif isinstance(line.record, PowderPropertyObservation):
+                observations.append(line.record)
+    options = {"workers": arguments.workers, "numeric_comparisons": arguments.numeric}
+    if arguments.output is None:
+        write_conflict_comparisons(sys.stdout, observations, **options)
+    else:
+        with arguments.output.open("w", encoding="utf-8") as output:
+            write_conflict_comparisons(output, observations, **options)
+    return int(failed)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
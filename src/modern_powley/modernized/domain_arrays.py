@@ -0,0 +1,242 @@
+"""Array-valued literal domain membership for dense grids of query values.
+
+``DomainBoundsTable`` stores the constraints of many applicability domains as
+columns. A query then broadcasts against it: many points against one domain,
+one point against many domains, or both at once, giving a
+``(domains, points)`` array of integer codes. Membership codes index
+``MEMBERSHIP_STATUSES`` and mean exactly what ``test_domain_membership``
+returns for the same domain and values; interval codes index
+``DIAGNOSTIC_STATUSES`` and mean what ``diagnose_observation_applicability``
+reports for a ``QueryInterval``. Boundary comparisons use the same SI values
+and inclusion rules, so no tolerance is introduced.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from .domain_diagnostics import DomainDiagnosticStatus
+from .property_domains import (
+    ApplicabilityDomain,
+    BoundKind,
+    DomainMembershipStatus,
+    DomainStatus,
+    SourceScalarDomainValue,
+)
+from .units import Dimension, Quantity, QuantityArray
+
+MEMBERSHIP_STATUSES: tuple[DomainMembershipStatus, ...] = tuple(DomainMembershipStatus)
+DIAGNOSTIC_STATUSES: tuple[DomainDiagnosticStatus, ...] = tuple(DomainDiagnosticStatus)
+
+_MEMBERSHIP = {status: code for code, status in enumerate(MEMBERSHIP_STATUSES)}
+_DIAGNOSTIC = {status: code for code, status in enumerate(DIAGNOSTIC_STATUSES)}
+_DIMENSIONS = {dimension: code for code, dimension in enumerate(Dimension)}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _RangeColumn:
+    """One variable's bounds across all domains; NaN marks an absent endpoint."""
+
+    present: np.ndarray
+    lower: np.ndarray
+    lower_exclusive: np.ndarray
+    upper: np.ndarray
+    upper_exclusive: np.ndarray
+    definitions: tuple[str | None, ...]
+
+
+def _range_column(size: int, entries: Mapping[int, tuple[float | None, BoundKind, float | None, BoundKind, str]]) -> _RangeColumn:
+    present = np.zeros(size, dtype=bool)
+    lower, upper = np.full(size, np.nan), np.full(size, np.nan)
+    lower_exclusive, upper_exclusive = np.zeros(size, dtype=bool), np.zeros(size, dtype=bool)
+    definitions: list[str | None] = [None] * size
+    for position, (low, low_kind, high, high_kind, definition) in entries.items():
+        present[position] = True
+        if low is not None:
+            lower[position], lower_exclusive[position] = low, low_kind is BoundKind.EXCLUSIVE
+        if high is not None:
+            upper[position], upper_exclusive[position] = high, high_kind is BoundKind.EXCLUSIVE
+        definitions[position] = definition
+    for array in (present, lower, upper, lower_exclusive, upper_exclusive):
+        array.setflags(write=False)
+    return _RangeColumn(present, lower, lower_exclusive, upper, upper_exclusive, tuple(definitions))
+
+
+def _outside_range(column: _RangeColumn, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    points = values[np.newaxis, :]
+    lower, upper = column.lower[:, np.newaxis], column.upper[:, np.newaxis]
+    below = (points < lower) | ((points == lower) & column.lower_exclusive[:, np.newaxis])
+    above = (points > upper) | ((points == upper) & column.upper_exclusive[:, np.newaxis])
+    return below, above
+
+
+def _si_values(value: Quantity | QuantityArray) -> np.ndarray:
+    if isinstance(value, QuantityArray):
+        return value.si_value
+    return np.array([value.si_value])
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DomainMembershipCodes:
+    """Membership codes plus the per-variable boundary outcomes behind them.
+
+    ``below_lower`` and ``above_upper`` hold, for each supplied numeric
+    variable, where a point fails the lower or upper endpoint of a domain that
+    constrains it (always ``False`` where the domain does not).
+    """
+
+    codes: np.ndarray
+    below_lower: Mapping[str, np.ndarray]
+    above_upper: Mapping[str, np.ndarray]
+
+    def status(self, domain: int, point: int) -> DomainMembershipStatus:
+        return MEMBERSHIP_STATUSES[int(self.codes[domain, point])]
+
+
+class DomainBoundsTable:
+    """Column-wise constraints of many ``ApplicabilityDomain``s, by position."""
+
+    def __init__(self, domains: Iterable[ApplicabilityDomain]) -> None:
+        self._domains = tuple(domains)
+        size = len(self._domains)
+        self._unspecified = np.array([item.status is DomainStatus.UNSPECIFIED for item in self._domains], dtype=bool)
+        numeric: dict[str, dict[int, tuple[float | None, BoundKind, float | None, BoundKind, str]]] = {}
+        source: dict[str, dict[int, tuple[float | None, BoundKind, float | None, BoundKind, str]]] = {}
+        dimensions: dict[str, np.ndarray] = {}
+        source_units: dict[str, dict[int, tuple[str, str]]] = {}
+        categories: dict[str, dict[int, tuple[frozenset[str], bool]]] = {}
+        for position, domain in enumerate(self._domains):
+            for item in domain.numeric_constraints:
+                low = None if item.lower.value is None else item.lower.value.quantity.si_value
+                high = None if item.upper.value is None else item.upper.value.quantity.si_value
+                numeric.setdefault(item.variable_id, {})[position] = (low, item.lower.kind, high, item.upper.kind, item.definition)
+                dimensions.setdefault(item.variable_id, np.full(size, -1, dtype=np.int16))[position] = _DIMENSIONS[item.dimension]
+            for item in domain.source_scalar_constraints:
+                source.setdefault(item.variable_id, {})[position] = (item.lower.value, item.lower.kind, item.upper.value, item.upper.kind, item.definition)
+                source_units.setdefault(item.variable_id, {})[position] = (item.reported_unit, item.convention)
+            for item in domain.categorical_constraints:
+                allowed = frozenset(item.allowed_values if item.case_sensitive else (value.casefold() for value in item.allowed_values))
+                categories.setdefault(item.variable_id, {})[position] = (allowed, item.case_sensitive)
+        self._numeric = {key: _range_column(size, entries) for key, entries in numeric.items()}
+        self._dimensions = dimensions
+        self._source = {key: _range_column(size, entries) for key, entries in source.items()}
+        self._source_units = source_units
+        self._categories = categories
+        self._category_present = {key: np.isin(np.arange(size), list(entries)) for key, entries in categories.items()}
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def __getitem__(self, position: int) -> ApplicabilityDomain:
+        return self._domains[position]
+
+    def _missing(self, present: Mapping[str, np.ndarray], supplied: Mapping[str, object]) -> np.ndarray:
+        missing = np.zeros(len(self._domains), dtype=bool)
+        for variable_id, mask in present.items():
+            if variable_id not in supplied:
+                missing |= mask
+        return missing
+
+    def membership_codes(
+        self,
+        *,
+        numeric_values: Mapping[str, Quantity | QuantityArray],
+        categorical_values: Mapping[str, str],
+        source_scalar_values: Mapping[str, SourceScalarDomainValue] | None = None,
+    ) -> DomainMembershipCodes:
+        """Evaluate ``test_domain_membership`` for every domain and query point.
+
+        A ``QuantityArray`` supplies one value per point and a ``Quantity`` the
+        same value for all points; arrays must share one length.
+        """
+        source_scalar_values = {} if source_scalar_values is None else source_scalar_values
+        lengths = {len(value) for value in numeric_values.values() if isinstance(value, QuantityArray)}
+        if len(lengths) > 1:
+            raise ValueError("query arrays must share one length")
+        points = lengths.pop() if lengths else 1
+        size = len(self._domains)
+        missing = self._missing({key: column.present for key, column in self._numeric.items()}, numeric_values)
+        missing |= self._missing(self._category_present, categorical_values)
+        missing |= self._missing({key: column.present for key, column in self._source.items()}, source_scalar_values)
+        incompatible = np.zeros(size, dtype=bool)
+        outside = np.zeros((size, points), dtype=bool)
+        below_lower: dict[str, np.ndarray] = {}
+        above_upper: dict[str, np.ndarray] = {}
+        for variable_id, value in numeric_values.items():
+            column = self._numeric.get(variable_id)
+            if column is None:
+                continue
+            incompatible |= column.present & (self._dimensions[variable_id] != _DIMENSIONS[value.dimension])
+            below, above = _outside_range(column, np.broadcast_to(_si_values(value), (points,)))
+            below_lower[variable_id], above_upper[variable_id] = below, above
+            outside |= below | above
+        for variable_id, supplied in categorical_values.items():
+            for position, (allowed, case_sensitive) in self._categories.get(variable_id, {}).items():
+                if (supplied if case_sensitive else supplied.casefold()) not in allowed:
+                    outside[position] = True
+        for variable_id, scalar in source_scalar_values.items():
+            column = self._source.get(variable_id)
+            if column is None:
+                continue
+            for position, literal in self._source_units[variable_id].items():
+                if literal != (scalar.reported_unit, scalar.convention):
+                    incompatible[position] = True
+            below, above = _outside_range(column, np.full(points, scalar.value))
+            outside |= below | above
+        codes = np.full((size, points), _MEMBERSHIP[DomainMembershipStatus.WITHIN_DECLARED_DOMAIN], dtype=np.int8)
+        codes[outside] = _MEMBERSHIP[DomainMembershipStatus.OUTSIDE_DECLARED_DOMAIN]
+        codes[incompatible] = _MEMBERSHIP[DomainMembershipStatus.INCOMPATIBLE_DIMENSION]
+        codes[missing] = _MEMBERSHIP[DomainMembershipStatus.INDETERMINATE_MISSING_INPUT]
+        codes[self._unspecified] = _MEMBERSHIP[DomainMembershipStatus.INDETERMINATE_UNSPECIFIED_DOMAIN]
+        return DomainMembershipCodes(codes, below_lower, above_upper)
+
+    def interval_codes(
+        self,
+        variable_id: str,
+        lower: Quantity | QuantityArray,
+        lower_kind: BoundKind,
+        upper: Quantity | QuantityArray,
+        upper_kind: BoundKind,
+        *,
+        definition: str | None = None,
+    ) -> np.ndarray:
+        """Per-constraint diagnostic codes for many query intervals on one variable.
+
+        Intervals obey the ``QueryInterval`` rules. With ``definition`` given,
+        constraints declaring another definition report a definition mismatch;
+        domains without the variable report the constraint as not applicable.
+        """
+        lower_kind, upper_kind = BoundKind(lower_kind), BoundKind(upper_kind)
+        if BoundKind.UNBOUNDED in {lower_kind, upper_kind}:
+            raise ValueError("M03 query intervals must have finite bounded endpoints")
+        if lower.dimension is not upper.dimension:
+            raise ValueError("query interval endpoints must have compatible dimensions")
+        low, high = np.broadcast_arrays(_si_values(lower), _si_values(upper))
+        if (low > high).any():
+            raise ValueError("query interval endpoints must be ordered")
+        if BoundKind.EXCLUSIVE in {lower_kind, upper_kind} and (low == high).any():
+            raise ValueError("zero-width query interval must include both endpoints")
+        size = len(self._domains)
+        codes = np.full((size, len(low)), _DIAGNOSTIC[DomainDiagnosticStatus.CONSTRAINT_NOT_APPLICABLE], dtype=np.int8)
+        column = self._numeric.get(variable_id)
+        if column is not None:
+            query_lower_exclusive, query_upper_exclusive = lower_kind is BoundKind.EXCLUSIVE, upper_kind is BoundKind.EXCLUSIVE
+            ql, qu = low[np.newaxis, :], high[np.newaxis, :]
+            bound_lower, bound_upper = column.lower[:, np.newaxis], column.upper[:, np.newaxis]
+            lower_exclusive, upper_exclusive = column.lower_exclusive[:, np.newaxis], column.upper_exclusive[:, np.newaxis]
+            below = (qu < bound_lower) | ((qu == bound_lower) & (query_upper_exclusive | lower_exclusive))
+            above = (ql > bound_upper) | ((ql == bound_upper) & (query_lower_exclusive | upper_exclusive))
+            lower_inside = np.isnan(bound_lower) | (ql > bound_lower) | ((ql == bound_lower) & ~(lower_exclusive & (not query_lower_exclusive)))
+            upper_inside = np.isnan(bound_upper) | (qu < bound_upper) | ((qu == bound_upper) & ~(upper_exclusive & (not query_upper_exclusive)))
+            rows = np.full(codes.shape, _DIAGNOSTIC[DomainDiagnosticStatus.PARTIALLY_COMPARABLE], dtype=np.int8)
+            rows[lower_inside & upper_inside] = _DIAGNOSTIC[DomainDiagnosticStatus.INSIDE_DECLARED_DOMAIN]
+            rows[below | above] = _DIAGNOSTIC[DomainDiagnosticStatus.OUTSIDE_DECLARED_DOMAIN]
+            rows[self._dimensions[variable_id] != _DIMENSIONS[lower.dimension]] = _DIAGNOSTIC[DomainDiagnosticStatus.INCOMPATIBLE_UNITS]
+            if definition is not None:
+                rows[np.array([item is not None and item != definition for item in column.definitions], dtype=bool)] = _DIAGNOSTIC[DomainDiagnosticStatus.DEFINITION_MISMATCH]
+            codes[column.present] = rows[column.present]
+        codes[self._unspecified] = _DIAGNOSTIC[DomainDiagnosticStatus.DOMAIN_UNSPECIFIED]
+        return codes
@@ -0,0 +1,250 @@
+"""Bulk lookup of applicability domains that literally contain a query.
+
+Numeric and source-scalar constraints are held per variable in a centered
+interval tree; categorical constraints in inverted indexes keyed by literal
+(or case-folded) value. The index only narrows the corpus to domains whose
+every declared constraint is met; the existing literal checks are then run on
+those candidates, so results equal a full scan.
+
+A point query visits one root-to-leaf path and touches only ranges that
+contain the point, so it costs O(log n + k) per variable for k matches. An
+interval query may also scan the ranges stored at the one node whose center
+lies inside the query interval that fail to cover it.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import replace
+
+from .domain_diagnostics import (
+    ApplicabilityEvaluation,
+    ApplicabilitySummary,
+    DomainQueryContext,
+    DomainQueryKind,
+    QueryInterval,
+    diagnose_observation_applicability,
+)
+from .property_domains import (
+    ApplicabilityDomain,
+    BoundKind,
+    DomainMembershipStatus,
+    SourceScalarDomainValue,
+    test_domain_membership,
+)
+from .property_observations import PowderPropertyObservation
+from .units import Dimension, Quantity
+
+# Endpoint keys order inclusion at equal values: a lower bound is met when its
+# key sorts before the query key, an upper bound when its key sorts after it.
+_Key = tuple[float, int]
+
+
+def _lower_key(kind: BoundKind, value: float) -> _Key:
+    return (value, 1 if kind is BoundKind.EXCLUSIVE else 0)
+
+
+def _upper_key(kind: BoundKind, value: float) -> _Key:
+    return (value, 0 if kind is BoundKind.EXCLUSIVE else 1)
+
+
+_OPEN_LOWER: _Key = (-math.inf, -1)
+_OPEN_UPPER: _Key = (math.inf, 3)
+
+
+class _Node:
+    """Ranges holding ``center``, sorted by lower and by upper key, and the rest split around it."""
+
+    __slots__ = ("center", "lower_keys", "lower_positions", "upper_keys", "upper_positions", "left", "right")
+
+    def __init__(self, ranges: list[tuple[_Key, _Key, int]]) -> None:
+        endpoints = sorted(key for lower, upper, _ in ranges for key in (lower, upper) if math.isfinite(key[0]))
+        self.center = endpoints[len(endpoints) // 2] if endpoints else (0.0, 0)
+        held = [item for item in ranges if item[0] <= self.center <= item[1]]
+        by_lower = sorted((lower, position) for lower, _, position in held)
+        by_upper = sorted((upper, position) for _, upper, position in held)
+        self.lower_keys = [key for key, _ in by_lower]
+        self.lower_positions = [position for _, position in by_lower]
+        self.upper_keys = [key for key, _ in by_upper]
+        self.upper_positions = [position for _, position in by_upper]
+        left = [item for item in ranges if item[1] < self.center]
+        right = [item for item in ranges if item[0] > self.center]
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+
+class _IntervalTree:
+    """One variable's range constraints across domains, for containment queries."""
+
+    __slots__ = ("_root", "_upper_by_position")
+
+    def __init__(self, entries: Iterable[tuple[int, _Key | None, _Key | None]]) -> None:
+        ranges = [(_OPEN_LOWER if lower is None else lower, _OPEN_UPPER if upper is None else upper, position) for position, lower, upper in entries]
+        self._upper_by_position = {position: upper for _, upper, position in ranges}
+        self._root = _Node(ranges) if ranges else None
+
+    def containing(self, low: _Key, high: _Key) -> set[int]:
+        """Positions whose lower key sorts before ``low`` and upper key after ``high``."""
+        found: set[int] = set()
+        pending = [self._root] if self._root is not None else []
+        while pending:
+            node = pending.pop()
+            if high < node.center:
+                found.update(node.lower_positions[: bisect_left(node.lower_keys, low)])
+                if node.left is not None:
+                    pending.append(node.left)
+            elif node.center < low:
+                found.update(node.upper_positions[bisect_right(node.upper_keys, high) :])
+            else:
+                found.update(position for position in node.lower_positions[: bisect_left(node.lower_keys, low)] if self._upper_by_position[position] > high)
+            if node.center < low and node.right is not None:
+                pending.append(node.right)
+        return found
+
+
+def _point_keys(value: float) -> tuple[_Key, _Key]:
+    return (value, 1), (value, 0)
+
+
+def _interval_keys(interval: QueryInterval) -> tuple[_Key, _Key]:
+    low = (interval.lower.si_value, 2 if interval.lower_kind is BoundKind.EXCLUSIVE else 1)
+    high = (interval.upper.si_value, -1 if interval.upper_kind is BoundKind.EXCLUSIVE else 0)
+    return low, high
+
+
+class ApplicabilityDomainIndex:
+    """Index many ``ApplicabilityDomain``s by position for containment lookups."""
+
+    def __init__(self, domains: Iterable[ApplicabilityDomain]) -> None:
+        self._domains = tuple(domains)
+        numeric: dict[tuple[str, Dimension], list[tuple[int, _Key | None, _Key | None]]] = {}
+        source: dict[tuple[str, str, str], list[tuple[int, _Key | None, _Key | None]]] = {}
+        self._exact: dict[str, dict[str, set[int]]] = {}
+        self._folded: dict[str, dict[str, set[int]]] = {}
+        self._constraint_counts: list[int] = []
+        for position, domain in enumerate(self._domains):
+            self._constraint_counts.append(len(domain.numeric_constraints) + len(domain.categorical_constraints) + len(domain.source_scalar_constraints))
+            for item in domain.numeric_constraints:
+                lower = None if item.lower.value is None else _lower_key(item.lower.kind, item.lower.value.quantity.si_value)
+                upper = None if item.upper.value is None else _upper_key(item.upper.kind, item.upper.value.quantity.si_value)
+                numeric.setdefault((item.variable_id, item.dimension), []).append((position, lower, upper))
+            for item in domain.source_scalar_constraints:
+                lower = None if item.lower.value is None else _lower_key(item.lower.kind, item.lower.value)
+                upper = None if item.upper.value is None else _upper_key(item.upper.kind, item.upper.value)
+                source.setdefault((item.variable_id, item.reported_unit, item.convention), []).append((position, lower, upper))
+            for item in domain.categorical_constraints:
+                postings = (self._exact if item.case_sensitive else self._folded).setdefault(item.variable_id, {})
+                for value in item.allowed_values:
+                    postings.setdefault(value if item.case_sensitive else value.casefold(), set()).add(position)
+        self._numeric = {key: _IntervalTree(entries) for key, entries in numeric.items()}
+        self._source = {key: _IntervalTree(entries) for key, entries in source.items()}
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def __getitem__(self, position: int) -> ApplicabilityDomain:
+        return self._domains[position]
+
+    def candidates(
+        self,
+        *,
+        numeric_values: Mapping[str, Quantity | QueryInterval],
+        categorical_values: Mapping[str, str],
+        source_scalar_values: Mapping[str, SourceScalarDomainValue] | None = None,
+    ) -> tuple[int, ...]:
+        """Return sorted positions of declared domains whose every constraint is met.
+
+        A ``QueryInterval`` meets a numeric constraint only when literally
+        contained in it. Unspecified domains are never returned.
+        """
+        hits: Counter[int] = Counter()
+        for variable_id, value in numeric_values.items():
+            dimension = value.lower.dimension if isinstance(value, QueryInterval) else value.dimension
+            arrays = self._numeric.get((variable_id, dimension))
+            if arrays is not None:
+                hits.update(arrays.containing(*(_interval_keys(value) if isinstance(value, QueryInterval) else _point_keys(value.si_value))))
+        for variable_id, value in categorical_values.items():
+            hits.update(self._exact.get(variable_id, {}).get(value, ()))
+            hits.update(self._folded.get(variable_id, {}).get(value.casefold(), ()))
+        for variable_id, scalar in (source_scalar_values or {}).items():
+            arrays = self._source.get((variable_id, scalar.reported_unit, scalar.convention))
+            if arrays is not None:
+                hits.update(arrays.containing(*_point_keys(scalar.value)))
+        return tuple(sorted(position for position, count in hits.items() if count == self._constraint_counts[position]))
+
+    def containing(
+        self,
+        *,
+        numeric_values: Mapping[str, Quantity],
+        categorical_values: Mapping[str, str],
+        source_scalar_values: Mapping[str, SourceScalarDomainValue] | None = None,
+    ) -> tuple[int, ...]:
+        """Positions for which ``test_domain_membership`` reports membership."""
+        return tuple(
+            position
+            for position in self.candidates(numeric_values=numeric_values, categorical_values=categorical_values, source_scalar_values=source_scalar_values)
+            if test_domain_membership(self._domains[position], numeric_values=numeric_values, categorical_values=categorical_values, source_scalar_values=source_scalar_values).status is DomainMembershipStatus.WITHIN_DECLARED_DOMAIN
+        )
+
+
+def _default_record_id(context: DomainQueryContext, observation: PowderPropertyObservation) -> str:
+    return f"{context.record_id}:{observation.record_id}"
+
+
+class ObservationDomainIndex:
+    """Index observations so one query context is diagnosed only where it may fit."""
+
+    def __init__(self, observations: Iterable[PowderPropertyObservation]) -> None:
+        self._observations = tuple(observations)
+        self._domains = ApplicabilityDomainIndex(item.applicability_domain for item in self._observations)
+        definitions: dict[str, set[int]] = {}
+        for position, item in enumerate(self._observations):
+            definitions.setdefault(item.property_definition.property_id.value, set()).add(position)
+        self._definitions = {key: frozenset(value) for key, value in definitions.items()}
+
+    def __len__(self) -> int:
+        return len(self._observations)
+
+    def candidates(self, context: DomainQueryContext) -> tuple[PowderPropertyObservation, ...]:
+        """Observations of the queried property whose declared domain may contain the query.
+
+        ``context.observation_id`` is ignored; explicitly unavailable query
+        values meet no constraint.
+        """
+        numeric: dict[str, Quantity | QueryInterval] = {}
+        categorical: dict[str, str] = {}
+        source: dict[str, SourceScalarDomainValue] = {}
+        for item in context.values:
+            if item.kind is DomainQueryKind.NUMERIC_POINT and item.numeric_point is not None:
+                numeric[item.variable_id] = item.numeric_point
+            elif item.kind is DomainQueryKind.NUMERIC_INTERVAL and item.numeric_interval is not None:
+                numeric[item.variable_id] = item.numeric_interval
+            elif item.kind in {DomainQueryKind.CATEGORICAL, DomainQueryKind.IDENTIFIER} and item.category_or_identifier is not None:
+                categorical[item.variable_id] = item.category_or_identifier
+            elif item.kind is DomainQueryKind.SOURCE_SCALAR_POINT and item.source_scalar_point is not None:
+                source[item.variable_id] = item.source_scalar_point
+        admitted = self._definitions.get(context.property_definition_id, frozenset())
+        positions = self._domains.candidates(numeric_values=numeric, categorical_values=categorical, source_scalar_values=source)
+        return tuple(self._observations[position] for position in positions if position in admitted)
+
+    def diagnose_containing(
+        self,
+        context: DomainQueryContext,
+        *,
+        record_id: Callable[[DomainQueryContext, PowderPropertyObservation], str] = _default_record_id,
+    ) -> tuple[ApplicabilityEvaluation, ...]:
+        """Run ``diagnose_observation_applicability`` on the candidates only.
+
+        Each candidate is diagnosed against ``context`` re-addressed to it, and
+        only evaluations satisfying every declared constraint are returned, in
+        corpus order.
+        """
+        results = []
+        for observation in self.candidates(context):
+            evaluation = diagnose_observation_applicability(observation, replace(context, observation_id=observation.record_id), record_id=record_id(context, observation))
+            if evaluation.summary is ApplicabilitySummary.ALL_DECLARED_CONSTRAINTS_SATISFIED:
+                results.append(evaluation)
+        return tuple(results)
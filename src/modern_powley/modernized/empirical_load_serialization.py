@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar, Token
+from functools import wraps
 from numbers import Real
 from typing import Any
 
@@ -73,10 +75,91 @@ from .units import Quantity, Unit
 
 
 _TOP_FIELDS = {"schema", "schema_version", "record_type", "envelope", "payload"}
+_INTERN_LIMIT = 4096
+_KEY_SCALARS = frozenset({str, int, type(None)})
+
+
+def _flat_items(value: Any) -> tuple[tuple[str, Any], ...] | None:
+    if type(value) is not dict:
+        return None
+    items = tuple(value.items())
+    for _, item in items:
+        if type(item) not in _KEY_SCALARS:
+            return None
+    return items
+
+
+def _cache_key(value: Any) -> tuple[tuple[str, Any], ...] | None:
+    """Exact-type key for a JSON object of scalars and flat scalar objects."""
+    if type(value) is not dict:
+        return None
+    key = []
+    for name, item in value.items():
+        if type(item) in _KEY_SCALARS:
+            key.append((name, item))
+            continue
+        nested = _flat_items(item)
+        if nested is None:
+            return None
+        key.append((name, (dict, nested)))
+    return tuple(key)
+
+
+_InternTables = dict[Callable[[Any], Any], dict[tuple[tuple[str, Any], ...], Any]]
+_INTERN_TABLES: ContextVar[_InternTables | None] = ContextVar("empirical_load_intern_tables", default=None)
+
+
+class EmpiricalDecodingScope:
+    """Intern tables shared by the empirical-load records decoded under it.
+
+    Each ``empirical_load_record_from_dict`` call shares identical small
+    substructures within its own record. Entering one scope around every
+    decode of a stream shares them across the stream as well; the tables live
+    exactly as long as the scope object and are bounded in size; once one is
+    full, further values are decoded unshared.
+    """
+
+    __slots__ = ("_tables", "_tokens")
+
+    def __init__(self) -> None:
+        self._tables: _InternTables = {}
+        self._tokens: list[Token[_InternTables | None]] = []
+
+    def __enter__(self) -> EmpiricalDecodingScope:
+        self._tokens.append(_INTERN_TABLES.set(self._tables))
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        _INTERN_TABLES.reset(self._tokens.pop())
+
+
+def _interned(decode: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Share one decoded instance among identical small JSON objects in a scope.
+
+    Only exact ``str``, ``int``, and ``None`` leaves are keyed, so ``True``
+    never aliases ``1`` and ``-0.0`` never aliases ``0.0``. Anything else, and
+    every failure, goes through ``decode`` itself and raises exactly as before.
+    """
+
+    @wraps(decode)
+    def decoder(value: Any) -> Any:
+        tables = _INTERN_TABLES.get()
+        key = None if tables is None else _cache_key(value)
+        if key is None:
+            return decode(value)
+        cache = tables.setdefault(decoder, {})
+        result = cache.get(key)
+        if result is None:
+            result = decode(value)
+            if len(cache) < _INTERN_LIMIT:
+                cache[key] = result
+        return result
+
+    return decoder
 
 
 def _object(value: Any, name: str) -> Mapping[str, Any]:
-    if not isinstance(value, Mapping):
+    if type(value) is not dict and not isinstance(value, Mapping):
         raise TypeError(f"{name} must be an object")
     return value
 
@@ -156,6 +239,7 @@ def _qualifier_to_dict(value: IdentityQualifier) -> dict[str, object]:
     return value.to_dict()
 
 
+@_interned
 def _qualifier(value: Any) -> IdentityQualifier:
     data = _object(value, "identity qualifier")
     _keys(data, {"value", "missing_state", "explanation"}, "identity qualifier")
@@ -172,6 +256,7 @@ def _locator_to_dict(value: SourceLocator) -> dict[str, object]:
     return value.to_dict()
 
 
+@_interned
 def _locator(value: Any) -> SourceLocator:
     data = _object(value, "source locator")
     _keys(data, {"source_id", "locator", "transcription_status"}, "source locator")
@@ -192,6 +277,7 @@ def _reference_to_dict(value: ExactRecordReference) -> dict[str, object]:
     }
 
 
+@_interned
 def _reference(value: Any) -> ExactRecordReference:
     data = _object(value, "exact reference")
     _keys(data, {"schema_id", "record_type", "record_id", "version", "role"}, "exact reference")
@@ -233,6 +319,7 @@ def _reference_or_missing_to_dict(value: ReferenceOrMissing) -> dict[str, object
     return {"kind": "missing", "missing": _missing_to_dict(value.missing)}
 
 
+@_interned
 def _reference_or_missing(value: Any) -> ReferenceOrMissing:
     data = _object(value, "reference-or-missing")
     kind = _string(data.get("kind"), "reference-or-missing kind")
@@ -249,6 +336,7 @@ def _precision_to_dict(value: ReportedPrecision) -> dict[str, object]:
     return {"kind": value.kind.value, "statement": value.statement, "digits": value.digits}
 
 
+@_interned
 def _precision(value: Any) -> ReportedPrecision:
     data = _object(value, "reported precision")
     _keys(data, {"kind", "statement", "digits"}, "reported precision")
@@ -268,6 +356,7 @@ def _evidence_uncertainty_to_dict(value: EvidenceUncertainty) -> dict[str, objec
     }
 
 
+@_interned
 def _evidence_uncertainty(value: Any) -> EvidenceUncertainty:
     data = _object(value, "evidence uncertainty")
     _keys(data, {"kind", "description", "reference"}, "evidence uncertainty")
@@ -371,6 +460,7 @@ def _lineage_to_dict(value: LineageLink) -> dict[str, object]:
     return {"role": value.role.value, "reference": _reference_to_dict(value.reference), "statement": value.statement}
 
 
+@_interned
 def _lineage(value: Any) -> LineageLink:
     data = _object(value, "lineage link")
     _keys(data, {"role", "reference", "statement"}, "lineage link")
@@ -400,6 +490,7 @@ def _exclusion_to_dict(value: Exclusion) -> dict[str, object]:
     return {"state": value.state.value, "reason": _qualifier_to_dict(value.reason), "authority": _qualifier_to_dict(value.authority), "review_context": value.review_context}
 
 
+@_interned
 def _exclusion(value: Any) -> Exclusion:
     data = _object(value, "exclusion")
     _keys(data, {"state", "reason", "authority", "review_context"}, "exclusion")
@@ -473,6 +564,7 @@ def _powder_to_dict(value: PowderIdentityReference) -> dict[str, object]:
     return {"reference": _reference_to_dict(value.reference), "lot": _qualifier_to_dict(value.lot)}
 
 
+@_interned
 def _powder(value: Any) -> PowderIdentityReference:
     data = _object(value, "powder reference")
     _keys(data, {"reference", "lot"}, "powder reference")
@@ -540,6 +632,7 @@ def _artifact_to_dict(value: ArtifactReference) -> dict[str, object]:
     return {"artifact_id": value.artifact_id, "retention_state": value.retention_state.value, "sha256": _qualifier_to_dict(value.sha256), "media_type": value.media_type, "custody_reference": _reference_to_dict(value.custody_reference), "custody_limitation": value.custody_limitation}
 
 
+@_interned
 def _artifact(value: Any) -> ArtifactReference:
     data = _object(value, "artifact reference")
     _keys(data, {"artifact_id", "retention_state", "sha256", "media_type", "custody_reference", "custody_limitation"}, "artifact reference")
@@ -550,6 +643,7 @@ def _window_to_dict(value: ExcludedWindow) -> dict[str, object]:
     return {"window_id": value.window_id, "source_wording": value.source_wording, "reason": value.reason}
 
 
+@_interned
 def _window(value: Any) -> ExcludedWindow:
     data = _object(value, "excluded window")
     _keys(data, {"window_id", "source_wording", "reason"}, "excluded window")
@@ -560,6 +654,7 @@ def _member_to_dict(value: OrderedMember) -> dict[str, object]:
     return {"position": value.position, "reference": _reference_to_dict(value.reference), "source_role": value.source_role}
 
 
+@_interned
 def _member(value: Any) -> OrderedMember:
     data = _object(value, "ordered member")
     _keys(data, {"position", "reference", "source_role"}, "ordered member")
@@ -619,46 +714,83 @@ def empirical_load_record_to_dict(record: EmpiricalLoadEvidenceRecord) -> dict[s
     return {"schema": EMPIRICAL_LOAD_EVIDENCE_SCHEMA_ID, "schema_version": 1, "record_type": record.envelope.record_type.value, "envelope": _envelope_to_dict(record.envelope), "payload": _payload_to_dict(record)}
 
 
-def _parse_payload(record_type: EmpiricalRecordType, envelope: RecordEnvelope, value: Any) -> EmpiricalLoadEvidenceRecord:
-    data = _object(value, f"{record_type.value} payload")
-    if record_type is EmpiricalRecordType.SOURCE_CUSTODY:
-        _keys(data, {"source_title", "originating_organization", "edition_or_revision", "locator", "acquisition_context", "retention_context", "artifacts", "custody_lineage"}, "source custody payload")
-        return SourceCustodyRecord(envelope=envelope, source_title=_string(data["source_title"], "source title"), originating_organization=_qualifier(data["originating_organization"]), edition_or_revision=_qualifier(data["edition_or_revision"]), locator=_locator(data["locator"]), acquisition_context=_string(data["acquisition_context"], "acquisition context"), retention_context=_string(data["retention_context"], "retention context"), artifacts=tuple(_artifact(item) for item in _list(data["artifacts"], "artifacts")), custody_lineage=_references(data["custody_lineage"], "custody lineage"))
-    if record_type is EmpiricalRecordType.LITERAL_LOAD_STATEMENT:
-        _keys(data, {"source_reference", "locator", "exact_source_wording", "source_declared_component_wording", "declared_values", "qualifications", "conditions", "declaration_state", "unresolved_wording", "normalized_record_references"}, "literal statement payload")
-        return LiteralLoadStatementRecord(envelope=envelope, source_reference=_reference(data["source_reference"]), locator=_locator(data["locator"]), exact_source_wording=_string(data["exact_source_wording"], "exact source wording"), source_declared_component_wording=_strings(data["source_declared_component_wording"], "component wording"), declared_values=tuple(_reported_value(item) for item in _list(data["declared_values"], "declared values")), qualifications=_strings(data["qualifications"], "qualifications"), conditions=_strings(data["conditions"], "conditions"), declaration_state=_enum(data["declaration_state"], SourceDeclarationState, "declaration state"), unresolved_wording=_qualifier(data["unresolved_wording"]), normalized_record_references=_references(data["normalized_record_references"], "normalized references"))
-    if record_type is EmpiricalRecordType.PHYSICAL_LOAD_CONFIGURATION:
-        _keys(data, {"cartridge_designation", "powder", "bullet", "case", "primer", "charge", "geometry_references", "equipment", "preparation", "conditions", "exclusion"}, "load configuration payload")
-        return PhysicalLoadConfigurationRecord(envelope=envelope, cartridge_designation=_qualifier(data["cartridge_designation"]), powder=_powder(data["powder"]), bullet=_component(data["bullet"]), case=_component(data["case"]), primer=_component(data["primer"]), charge=_quantity_or_missing(data["charge"]), geometry_references=_references(data["geometry_references"], "geometry references"), equipment=tuple(_equipment(item) for item in _list(data["equipment"], "equipment")), preparation=_strings(data["preparation"], "preparation"), conditions=_strings(data["conditions"], "conditions"), exclusion=_exclusion(data["exclusion"]))
-    if record_type is EmpiricalRecordType.SHOT_OBSERVATION:
-        _keys(data, {"load_configuration_reference", "acquisition_sequence", "acquisition_timestamp", "apparatus_references", "conditions", "pressure_observations", "pressure_missing", "velocity_observations", "velocity_missing", "trace_references", "exclusion", "underlying_test_reference"}, "shot payload")
-        pressure_missing, velocity_missing = data["pressure_missing"], data["velocity_missing"]
-        return ShotObservationRecord(envelope=envelope, load_configuration_reference=_reference(data["load_configuration_reference"]), acquisition_sequence=_integer(data["acquisition_sequence"], "acquisition sequence"), acquisition_timestamp=_qualifier(data["acquisition_timestamp"]), apparatus_references=_references(data["apparatus_references"], "apparatus references"), conditions=_strings(data["conditions"], "conditions"), pressure_observations=tuple(_pressure(item) for item in _list(data["pressure_observations"], "pressure observations")), pressure_missing=None if pressure_missing is None else _missing(pressure_missing), velocity_observations=tuple(_velocity(item) for item in _list(data["velocity_observations"], "velocity observations")), velocity_missing=None if velocity_missing is None else _missing(velocity_missing), trace_references=_references(data["trace_references"], "trace references"), exclusion=_exclusion(data["exclusion"]), underlying_test_reference=_reference_or_missing(data["underlying_test_reference"]))
-    if record_type is EmpiricalRecordType.LOAD_SERIES:
-        _keys(data, {"members", "purpose", "ordering_variable", "changed_variables", "controlled_variables", "stopping_rule", "missing_members"}, "load series payload")
-        return LoadSeriesRecord(envelope=envelope, members=tuple(_member(item) for item in _list(data["members"], "members")), purpose=_string(data["purpose"], "series purpose"), ordering_variable=_qualifier(data["ordering_variable"]), changed_variables=_strings(data["changed_variables"], "changed variables"), controlled_variables=_strings(data["controlled_variables"], "controlled variables"), stopping_rule=_qualifier(data["stopping_rule"]), missing_members=tuple(_missing(item) for item in _list(data["missing_members"], "missing members")))
-    if record_type is EmpiricalRecordType.PRESSURE_TRACE_METADATA:
-        _keys(data, {"artifact", "shot_reference", "instrument", "sensor", "channel", "sampling_rate", "time_base", "trigger_metadata", "alignment_metadata", "pressure_quantity", "pressure_location", "calibration", "artifact_state", "processing_method", "excluded_windows"}, "pressure trace payload")
-        sampling = _object(data["sampling_rate"], "sampling rate")
-        _keys(sampling, {"kind", "value"}, "sampling rate")
-        sampling_kind = _string(sampling["kind"], "sampling rate kind")
-        if sampling_kind == "reported": sampling_value = _reported_value(sampling["value"])
-        elif sampling_kind == "missing": sampling_value = _missing(sampling["value"])
-        else: raise ValueError(f"unsupported sampling rate kind: {sampling_kind!r}")
-        method = data["processing_method"]
-        return PressureTraceMetadataRecord(envelope=envelope, artifact=_artifact(data["artifact"]), shot_reference=_reference(data["shot_reference"]), instrument=_reference_or_missing(data["instrument"]), sensor=_reference_or_missing(data["sensor"]), channel=_reference_or_missing(data["channel"]), sampling_rate=sampling_value, time_base=_qualifier(data["time_base"]), trigger_metadata=_qualifier(data["trigger_metadata"]), alignment_metadata=_qualifier(data["alignment_metadata"]), pressure_quantity=_enum(data["pressure_quantity"], PressureQuantity, "pressure quantity"), pressure_location=_enum(data["pressure_location"], PressureLocation, "pressure location"), calibration=_reference_or_missing(data["calibration"]), artifact_state=_enum(data["artifact_state"], TraceArtifactState, "trace artifact state"), processing_method=None if method is None else _reference(method), excluded_windows=tuple(_window(item) for item in _list(data["excluded_windows"], "excluded windows")))
-    if record_type is EmpiricalRecordType.CHRONOGRAPH_SERIES:
-        _keys(data, {"members", "instrument", "setup", "measurement_distance", "correction_state", "correction_method", "atmospheric_context", "firearm", "barrel", "missing_measurements", "precision", "uncertainty"}, "chronograph payload")
-        method = data["correction_method"]
-        return ChronographSeriesRecord(envelope=envelope, members=tuple(_member(item) for item in _list(data["members"], "members")), instrument=_reference_or_missing(data["instrument"]), setup=_string(data["setup"], "chronograph setup"), measurement_distance=_quantity_or_missing(data["measurement_distance"]), correction_state=_enum(data["correction_state"], VelocityCorrectionState, "velocity correction state"), correction_method=None if method is None else _reference(method), atmospheric_context=_qualifier(data["atmospheric_context"]), firearm=_reference_or_missing(data["firearm"]), barrel=_reference_or_missing(data["barrel"]), missing_measurements=tuple(_missing(item) for item in _list(data["missing_measurements"], "missing measurements")), precision=_precision(data["precision"]), uncertainty=_evidence_uncertainty(data["uncertainty"]))
+def _source_custody_payload(envelope: RecordEnvelope, data: Mapping[str, Any]) -> SourceCustodyRecord:
+    _keys(data, {"source_title", "originating_organization", "edition_or_revision", "locator", "acquisition_context", "retention_context", "artifacts", "custody_lineage"}, "source custody payload")
+    return SourceCustodyRecord(envelope=envelope, source_title=_string(data["source_title"], "source title"), originating_organization=_qualifier(data["originating_organization"]), edition_or_revision=_qualifier(data["edition_or_revision"]), locator=_locator(data["locator"]), acquisition_context=_string(data["acquisition_context"], "acquisition context"), retention_context=_string(data["retention_context"], "retention context"), artifacts=tuple(_artifact(item) for item in _list(data["artifacts"], "artifacts")), custody_lineage=_references(data["custody_lineage"], "custody lineage"))
+
+
+def _literal_load_statement_payload(envelope: RecordEnvelope, data: Mapping[str, Any]) -> LiteralLoadStatementRecord:
+    _keys(data, {"source_reference", "locator", "exact_source_wording", "source_declared_component_wording", "declared_values", "qualifications", "conditions", "declaration_state", "unresolved_wording", "normalized_record_references"}, "literal statement payload")
+    return LiteralLoadStatementRecord(envelope=envelope, source_reference=_reference(data["source_reference"]), locator=_locator(data["locator"]), exact_source_wording=_string(data["exact_source_wording"], "exact source wording"), source_declared_component_wording=_strings(data["source_declared_component_wording"], "component wording"), declared_values=tuple(_reported_value(item) for item in _list(data["declared_values"], "declared values")), qualifications=_strings(data["qualifications"], "qualifications"), conditions=_strings(data["conditions"], "conditions"), declaration_state=_enum(data["declaration_state"], SourceDeclarationState, "declaration state"), unresolved_wording=_qualifier(data["unresolved_wording"]), normalized_record_references=_references(data["normalized_record_references"], "normalized references"))
+
+
+def _physical_load_configuration_payload(envelope: RecordEnvelope, data: Mapping[str, Any]) -> PhysicalLoadConfigurationRecord:
+    _keys(data, {"cartridge_designation", "powder", "bullet", "case", "primer", "charge", "geometry_references", "equipment", "preparation", "conditions", "exclusion"}, "load configuration payload")
+    return PhysicalLoadConfigurationRecord(envelope=envelope, cartridge_designation=_qualifier(data["cartridge_designation"]), powder=_powder(data["powder"]), bullet=_component(data["bullet"]), case=_component(data["case"]), primer=_component(data["primer"]), charge=_quantity_or_missing(data["charge"]), geometry_references=_references(data["geometry_references"], "geometry references"), equipment=tuple(_equipment(item) for item in _list(data["equipment"], "equipment")), preparation=_strings(data["preparation"], "preparation"), conditions=_strings(data["conditions"], "conditions"), exclusion=_exclusion(data["exclusion"]))
+
+
+def _shot_observation_payload(envelope: RecordEnvelope, data: Mapping[str, Any]) -> ShotObservationRecord:
+    _keys(data, {"load_configuration_reference", "acquisition_sequence", "acquisition_timestamp", "apparatus_references", "conditions", "pressure_observations", "pressure_missing", "velocity_observations", "velocity_missing", "trace_references", "exclusion", "underlying_test_reference"}, "shot payload")
+    pressure_missing, velocity_missing = data["pressure_missing"], data["velocity_missing"]
+    return ShotObservationRecord(envelope=envelope, load_configuration_reference=_reference(data["load_configuration_reference"]), acquisition_sequence=_integer(data["acquisition_sequence"], "acquisition sequence"), acquisition_timestamp=_qualifier(data["acquisition_timestamp"]), apparatus_references=_references(data["apparatus_references"], "apparatus references"), conditions=_strings(data["conditions"], "conditions"), pressure_observations=tuple(_pressure(item) for item in _list(data["pressure_observations"], "pressure observations")), pressure_missing=None if pressure_missing is None else _missing(pressure_missing), velocity_observations=tuple(_velocity(item) for item in _list(data["velocity_observations"], "velocity observations")), velocity_missing=None if velocity_missing is None else _missing(velocity_missing), trace_references=_references(data["trace_references"], "trace references"), exclusion=_exclusion(data["exclusion"]), underlying_test_reference=_reference_or_missing(data["underlying_test_reference"]))
+
+
+def _load_series_payload(envelope: RecordEnvelope, data: Mapping[str, Any]) -> LoadSeriesRecord:
+    _keys(data, {"members", "purpose", "ordering_variable", "changed_variables", "controlled_variables", "stopping_rule", "missing_members"}, "load series payload")
+    return LoadSeriesRecord(envelope=envelope, members=tuple(_member(item) for item in _list(data["members"], "members")), purpose=_string(data["purpose"], "series purpose"), ordering_variable=_qualifier(data["ordering_variable"]), changed_variables=_strings(data["changed_variables"], "changed variables"), controlled_variables=_strings(data["controlled_variables"], "controlled variables"), stopping_rule=_qualifier(data["stopping_rule"]), missing_members=tuple(_missing(item) for item in _list(data["missing_members"], "missing members")))
+
+
+def _pressure_trace_metadata_payload(envelope: RecordEnvelope, data: Mapping[str, Any]) -> PressureTraceMetadataRecord:
+    _keys(data, {"artifact", "shot_reference", "instrument", "sensor", "channel", "sampling_rate", "time_base", "trigger_metadata", "alignment_metadata", "pressure_quantity", "pressure_location", "calibration", "artifact_state", "processing_method", "excluded_windows"}, "pressure trace payload")
+    sampling = _object(data["sampling_rate"], "sampling rate")
+    _keys(sampling, {"kind", "value"}, "sampling rate")
+    sampling_kind = _string(sampling["kind"], "sampling rate kind")
+    if sampling_kind == "reported": sampling_value = _reported_value(sampling["value"])
+    elif sampling_kind == "missing": sampling_value = _missing(sampling["value"])
+    else: raise ValueError(f"unsupported sampling rate kind: {sampling_kind!r}")
+    method = data["processing_method"]
+    return PressureTraceMetadataRecord(envelope=envelope, artifact=_artifact(data["artifact"]), shot_reference=_reference(data["shot_reference"]), instrument=_reference_or_missing(data["instrument"]), sensor=_reference_or_missing(data["sensor"]), channel=_reference_or_missing(data["channel"]), sampling_rate=sampling_value, time_base=_qualifier(data["time_base"]), trigger_metadata=_qualifier(data["trigger_metadata"]), alignment_metadata=_qualifier(data["alignment_metadata"]), pressure_quantity=_enum(data["pressure_quantity"], PressureQuantity, "pressure quantity"), pressure_location=_enum(data["pressure_location"], PressureLocation, "pressure location"), calibration=_reference_or_missing(data["calibration"]), artifact_state=_enum(data["artifact_state"], TraceArtifactState, "trace artifact state"), processing_method=None if method is None else _reference(method), excluded_windows=tuple(_window(item) for item in _list(data["excluded_windows"], "excluded windows")))
+
+
+def _chronograph_series_payload(envelope: RecordEnvelope, data: Mapping[str, Any]) -> ChronographSeriesRecord:
+    _keys(data, {"members", "instrument", "setup", "measurement_distance", "correction_state", "correction_method", "atmospheric_context", "firearm", "barrel", "missing_measurements", "precision", "uncertainty"}, "chronograph payload")
+    method = data["correction_method"]
+    return ChronographSeriesRecord(envelope=envelope, members=tuple(_member(item) for item in _list(data["members"], "members")), instrument=_reference_or_missing(data["instrument"]), setup=_string(data["setup"], "chronograph setup"), measurement_distance=_quantity_or_missing(data["measurement_distance"]), correction_state=_enum(data["correction_state"], VelocityCorrectionState, "velocity correction state"), correction_method=None if method is None else _reference(method), atmospheric_context=_qualifier(data["atmospheric_context"]), firearm=_reference_or_missing(data["firearm"]), barrel=_reference_or_missing(data["barrel"]), missing_measurements=tuple(_missing(item) for item in _list(data["missing_measurements"], "missing measurements")), precision=_precision(data["precision"]), uncertainty=_evidence_uncertainty(data["uncertainty"]))
+
+
+def _aggregate_summary_payload(envelope: RecordEnvelope, data: Mapping[str, Any]) -> AggregateSummaryRecord:
     _keys(data, {"statistic", "statistic_definition", "calculation_origin", "calculation_method", "value", "member_references", "membership_missing", "exclusions", "source_wording", "precision", "uncertainty"}, "aggregate payload")
     method, membership = data["calculation_method"], data["membership_missing"]
     return AggregateSummaryRecord(envelope=envelope, statistic=_enum(data["statistic"], AggregateStatistic, "aggregate statistic"), statistic_definition=_string(data["statistic_definition"], "statistic definition"), calculation_origin=_enum(data["calculation_origin"], AggregateOrigin, "aggregate origin"), calculation_method=None if method is None else _reference(method), value=_aggregate_value(data["value"]), member_references=_references(data["member_references"], "aggregate members"), membership_missing=None if membership is None else _missing(membership), exclusions=_references(data["exclusions"], "aggregate exclusions"), source_wording=_string(data["source_wording"], "aggregate source wording"), precision=_precision(data["precision"]), uncertainty=_evidence_uncertainty(data["uncertainty"]))
 
 
+_PAYLOAD_DECODERS: dict[EmpiricalRecordType, Callable[[RecordEnvelope, Mapping[str, Any]], EmpiricalLoadEvidenceRecord]] = {
+    EmpiricalRecordType.SOURCE_CUSTODY: _source_custody_payload,
+    EmpiricalRecordType.LITERAL_LOAD_STATEMENT: _literal_load_statement_payload,
+    EmpiricalRecordType.PHYSICAL_LOAD_CONFIGURATION: _physical_load_configuration_payload,
+    EmpiricalRecordType.SHOT_OBSERVATION: _shot_observation_payload,
+    EmpiricalRecordType.LOAD_SERIES: _load_series_payload,
+    EmpiricalRecordType.PRESSURE_TRACE_METADATA: _pressure_trace_metadata_payload,
+    EmpiricalRecordType.CHRONOGRAPH_SERIES: _chronograph_series_payload,
+    EmpiricalRecordType.AGGREGATE_SUMMARY: _aggregate_summary_payload,
+}
+
+
+def _parse_payload(record_type: EmpiricalRecordType, envelope: RecordEnvelope, value: Any) -> EmpiricalLoadEvidenceRecord:
+    data = _object(value, f"{record_type.value} payload")
+    return _PAYLOAD_DECODERS[record_type](envelope, data)
+
+
 def empirical_load_record_from_dict(value: Mapping[str, Any]) -> EmpiricalLoadEvidenceRecord:
     """Parse one strict Phase 1 serialization object without coercion."""
 
+    if _INTERN_TABLES.get() is None:
+        with EmpiricalDecodingScope():
+            return _record_from_dict(value)
+    return _record_from_dict(value)
+
+
+def _record_from_dict(value: Mapping[str, Any]) -> EmpiricalLoadEvidenceRecord:
     data = _object(value, "empirical-load record")
     _keys(data, _TOP_FIELDS, "empirical-load record")
     if data["schema"] != EMPIRICAL_LOAD_EVIDENCE_SCHEMA_ID:
@@ -62,11 +62,32 @@ def _derived(record_id: str, quantity: Quantity, method_id: str, inputs: tuple[s
     )
 
 
+def circle_area_si(diameter):
+    """Return circle area from an SI diameter; floats or NumPy arrays, unvalidated."""
+    return pi * (diameter / 2.0) ** 2
+
+
+def frustum_volume_si(height, large, small):
+    """Return conical-frustum volume from SI lengths; floats or arrays, unvalidated."""
+    return pi * height * (large**2 + large * small + small**2) / 12.0
+
+
+def partial_boat_tail_volume_si(shank, base, height, seated):
+    """Return the volume of a boat tail seated ``seated`` deep; SI, unvalidated."""
+    top = base + (shank - base) * seated / height
+    return pi * seated * (base**2 + base * top + top**2) / 12.0
+
+
+def full_boat_tail_volume_si(shank, base, height, seated):
+    """Return the volume of a whole seated boat tail plus shank; SI, unvalidated."""
+    return frustum_volume_si(height, shank, base) + circle_area_si(shank) * (seated - height)
+
+
 def circle_area(diameter: PhysicalValue, convention: DiameterConvention, *, result_id: str) -> PhysicalValue:
     """Return circle area for a diameter whose convention is explicit."""
     require_positive(diameter.quantity, Dimension.LENGTH, "diameter")
     convention = DiameterConvention(convention)
-    area = pi * (diameter.quantity.si_value / 2.0) ** 2
+    area = circle_area_si(diameter.quantity.si_value)
     return _derived(result_id, Quantity(area, Unit.SQUARE_METRE), METHOD_CIRCLE_AREA, (diameter.record_id,), f"diameter_convention={convention.value}")
 
 
@@ -74,7 +95,7 @@ def cylinder_volume(diameter: PhysicalValue, length: PhysicalValue, *, result_id
     """Return the Euclidean volume of a right circular cylinder."""
     require_positive(diameter.quantity, Dimension.LENGTH, "diameter")
     require_positive(length.quantity, Dimension.LENGTH, "length")
-    volume = pi * (diameter.quantity.si_value / 2.0) ** 2 * length.quantity.si_value
+    volume = circle_area_si(diameter.quantity.si_value) * length.quantity.si_value
     return _derived(result_id, Quantity(volume, Unit.CUBIC_METRE), METHOD_CYLINDER_VOLUME, (diameter.record_id, length.record_id))
 
 
@@ -87,7 +108,7 @@ def conical_frustum_volume(height: PhysicalValue, large_diameter: PhysicalValue,
     small = small_diameter.quantity.si_value
     if small > large:
         raise ValueError("small frustum diameter cannot exceed large diameter")
-    volume = pi * height.quantity.si_value * (large**2 + large * small + small**2) / 12.0
+    volume = frustum_volume_si(height.quantity.si_value, large, small)
     return _derived(result_id, Quantity(volume, Unit.CUBIC_METRE), METHOD_FRUSTUM_VOLUME, (height.record_id, large_diameter.record_id, small_diameter.record_id))
 
 
@@ -108,13 +129,10 @@ def boat_tail_seated_displacement(shank_diameter: PhysicalValue, base_diameter:
     if base > shank:
         raise ValueError("boat-tail base diameter cannot exceed shank diameter")
     if seated <= height:
-        top = base + (shank - base) * seated / height
-        volume = pi * seated * (base**2 + base * top + top**2) / 12.0
+        volume = partial_boat_tail_volume_si(shank, base, height, seated)
         domain = "partial boat-tail frustum"
     else:
-        tail_volume = pi * height * (shank**2 + shank * base + base**2) / 12.0
-        shank_volume = pi * (shank / 2.0) ** 2 * (seated - height)
-        volume = tail_volume + shank_volume
+        volume = full_boat_tail_volume_si(shank, base, height, seated)
         domain = "full boat-tail frustum plus cylindrical shank"
     return _derived(result_id, Quantity(volume, Unit.CUBIC_METRE), METHOD_BOAT_TAIL_DISPLACEMENT, (shank_diameter.record_id, base_diameter.record_id, tail_length.record_id, intrusion.record_id), domain)
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, replace
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Mapping
 
 from .input_requirements import (
@@ -13,6 +16,7 @@ from .input_requirements import (
     InputRequirement,
     RequirementKind,
     RequirementSet,
+    production_requirement_sets,
 )
 from .missing_values import MissingState
 from .provenance import EvidenceClass, ModelMaturity, Provenance, ValueOrigin
@@ -191,10 +195,102 @@ def _details(requirement: InputRequirement, candidates: tuple[InputCandidate, ..
     )
 
 
-def _active_branch(requirement_set: RequirementSet, bundle: InputBundle) -> tuple[str | None, CompletenessStatus | None, str]:
+CandidateIndex = Mapping[str, tuple[InputCandidate, ...]]
+
+
+def _index_candidates(bundle: InputBundle) -> dict[str, tuple[InputCandidate, ...]]:
+    """Group candidates by semantic input, keeping their order within the bundle."""
+
+    grouped: dict[str, list[InputCandidate]] = {}
+    for item in bundle.candidates:
+        grouped.setdefault(item.semantic_input_id, []).append(item)
+    return {name: tuple(items) for name, items in grouped.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class _RequirementStep:
+    requirement: InputRequirement
+    accepted_kinds: frozenset[InputCandidateKind]
+    allowed_categories: frozenset[str]
+    multiple_status: CompletenessStatus
+    category_status: CompletenessStatus
+
+
+@dataclass(frozen=True, slots=True)
+class RequirementSetPlan:
+    """Immutable lookup tables compiled once from one requirement set.
+
+    ``inactive_by_branch`` holds, per declared branch, the positions of the
+    conditional requirements belonging to other branches. The consistency-rule
+    positions are ``None`` when the set declares no such rule.
+    """
+
+    requirement_set: RequirementSet
+    steps: tuple[_RequirementStep, ...]
+    branch_by_selector_value: Mapping[str, str]
+    inactive_by_branch: Mapping[str, frozenset[int]]
+    primer_correction_position: int | None
+    boat_tail_positions: Mapping[str, tuple[int, int]]
+
+
+_PLAN_CACHE_SIZE = 64
+_PLANS: OrderedDict[tuple[str, int], RequirementSetPlan] = OrderedDict()
+
+
+def _compile(requirement_set: RequirementSet) -> RequirementSetPlan:
+    selector = requirement_set.branch_selector_input_id
+    steps = tuple(
+        _RequirementStep(
+            item, frozenset(item.accepted_candidate_kinds), frozenset(item.allowed_categories),
+            CompletenessStatus.MUTUALLY_INCONSISTENT if item.semantic_input_id == selector else CompletenessStatus.CONFLICTING_SUPPLIED_VALUES,
+            CompletenessStatus.UNSUPPORTED_ALTERNATIVE if item.semantic_input_id == selector else CompletenessStatus.WRONG_CONTROLLED_CATEGORY,
+        )
+        for item in requirement_set.requirements
+    )
+    positions = {item.requirement_id: index for index, item in enumerate(requirement_set.requirements)}
+    conditional = [(index, item.conditional_branch_id) for index, item in enumerate(requirement_set.requirements) if item.kind is RequirementKind.CONDITIONAL]
+    inactive = {branch.branch_id: frozenset(index for index, owner in conditional if owner != branch.branch_id) for branch in requirement_set.branches}
+    primer = positions.get("primer_pocket_correction") if requirement_set.requirement_set_id == "geometric_usable_powder_space" else None
+    boat_tail: dict[str, tuple[int, int]] = {}
+    if requirement_set.requirement_set_id == "seated_projectile_displacement":
+        for branch, prefix in (("partial_boat_tail", "partial"), ("full_boat_tail", "full")):
+            intrusion, tail_base = positions.get(f"{prefix}_intrusion"), positions.get(f"{prefix}_tail_base_diameter")
+            if intrusion is not None and tail_base is not None:
+                boat_tail[branch] = (intrusion, tail_base)
+    return RequirementSetPlan(
+        requirement_set, steps,
+        MappingProxyType({item.selector_value: item.branch_id for item in requirement_set.branches}),
+        MappingProxyType(inactive), primer, MappingProxyType(boat_tail),
+    )
+
+
+def compile_requirement_set(requirement_set: RequirementSet) -> RequirementSetPlan:
+    """Return the cached plan for this requirement-set object.
+
+    Plans are cached under ``(requirement_set_id, version)`` for the most
+    recently used ``_PLAN_CACHE_SIZE`` sets and reused only for the very set
+    object they were compiled from; any other set, even an equal one, is
+    compiled afresh and replaces the entry. ``production_requirement_sets``
+    returns the same objects on every call, so production plans stay cached.
+    """
+
+    key = (requirement_set.requirement_set_id, requirement_set.version)
+    plan = _PLANS.get(key)
+    if plan is not None and plan.requirement_set is requirement_set:
+        _PLANS.move_to_end(key)
+        return plan
+    plan = _PLANS[key] = _compile(requirement_set)
+    _PLANS.move_to_end(key)
+    if len(_PLANS) > _PLAN_CACHE_SIZE:
+        _PLANS.popitem(last=False)
+    return plan
+
+
+def _active_branch(plan: RequirementSetPlan, by_input: CandidateIndex) -> tuple[str | None, CompletenessStatus | None, str]:
+    requirement_set = plan.requirement_set
     if not requirement_set.branches:
         return None, None, "requirement set has no conditional branch"
-    candidates = tuple(item for item in bundle.candidates if item.semantic_input_id == requirement_set.branch_selector_input_id)
+    candidates = by_input.get(requirement_set.branch_selector_input_id, ())
     if not candidates:
         return None, CompletenessStatus.CONDITIONAL_CONTEXT_MISSING, "explicit branch selector is missing"
     if len(candidates) > 1:
@@ -204,24 +300,25 @@ def _active_branch(requirement_set: RequirementSet, bundle: InputBundle) -> tupl
         return None, CompletenessStatus.CONDITIONAL_CONTEXT_MISSING, "geometry branch is explicitly unavailable"
     if candidate.category is None:
         return None, CompletenessStatus.WRONG_CONTROLLED_CATEGORY, "branch selector is not a controlled category"
-    matches = [item.branch_id for item in requirement_set.branches if item.selector_value == candidate.category]
-    if not matches:
+    branch_id = plan.branch_by_selector_value.get(candidate.category)
+    if branch_id is None:
         return None, CompletenessStatus.UNSUPPORTED_ALTERNATIVE, f"unsupported explicit geometry branch {candidate.category!r}"
-    return matches[0], None, "explicit branch selected"
-
+    return branch_id, None, "explicit branch selected"
 
-def evaluate_input_completeness(requirement_set: RequirementSet, bundle: InputBundle, *, record_id: str) -> CompletenessEvaluation:
-    """Inspect explicit candidates against one requirement set without inference."""
 
-    selected_branch, branch_error, branch_explanation = _active_branch(requirement_set, bundle)
+def _evaluate(plan: RequirementSetPlan, bundle: InputBundle, by_input: CandidateIndex, record_id: str) -> CompletenessEvaluation:
+    requirement_set = plan.requirement_set
+    selected_branch, branch_error, branch_explanation = _active_branch(plan, by_input)
+    inactive = plan.inactive_by_branch.get(selected_branch, frozenset()) if selected_branch is not None else frozenset()
     diagnostics: list[CompletenessDiagnostic] = []
-    for requirement in requirement_set.requirements:
-        candidates = tuple(item for item in bundle.candidates if item.semantic_input_id == requirement.semantic_input_id)
+    for index, step in enumerate(plan.steps):
+        requirement = step.requirement
+        candidates = by_input.get(requirement.semantic_input_id, ())
         if requirement.kind is RequirementKind.CONDITIONAL:
             if branch_error is not None:
                 diagnostics.append(_details(requirement, candidates, CompletenessStatus.CONDITIONAL_CONTEXT_MISSING, branch_explanation))
                 continue
-            if requirement.conditional_branch_id != selected_branch:
+            if index in inactive:
                 diagnostics.append(_details(requirement, candidates, CompletenessStatus.NOT_APPLICABLE, "requirement belongs to an inactive explicit branch"))
                 continue
         if not candidates:
@@ -229,14 +326,13 @@ def evaluate_input_completeness(requirement_set: RequirementSet, bundle: InputBu
             diagnostics.append(_details(requirement, (), status, "optional input was not supplied" if status is CompletenessStatus.NOT_APPLICABLE else "required explicit input was not supplied"))
             continue
         if len(candidates) > 1 and not requirement.allow_multiple:
-            status = CompletenessStatus.MUTUALLY_INCONSISTENT if requirement.semantic_input_id == requirement_set.branch_selector_input_id else CompletenessStatus.CONFLICTING_SUPPLIED_VALUES
-            diagnostics.append(_details(requirement, candidates, status, "multiple supplied candidates cannot satisfy this single-valued requirement"))
+            diagnostics.append(_details(requirement, candidates, step.multiple_status, "multiple supplied candidates cannot satisfy this single-valued requirement"))
             continue
         candidate = candidates[0]
         if candidate.missing_state is not None:
             diagnostics.append(_details(requirement, candidates, CompletenessStatus.EXPLICITLY_UNAVAILABLE, candidate.explanation, missing_state=candidate.missing_state))
             continue
-        if candidate.candidate_kind not in requirement.accepted_candidate_kinds:
+        if candidate.candidate_kind not in step.accepted_kinds:
             diagnostics.append(_details(requirement, candidates, CompletenessStatus.WRONG_RECORD_TYPE, "supplied record kind cannot substitute for the required kind"))
             continue
         if requirement.expected_dimension is not None:
@@ -246,18 +342,16 @@ def evaluate_input_completeness(requirement_set: RequirementSet, bundle: InputBu
             if requirement.require_positive_quantity and candidate.quantity.si_value <= 0:
                 diagnostics.append(_details(requirement, candidates, CompletenessStatus.INVALID_VALUE_DOMAIN, "existing M01 operation requires a positive quantity"))
                 continue
-        if requirement.allowed_categories:
-            if candidate.category not in requirement.allowed_categories:
-                status = CompletenessStatus.UNSUPPORTED_ALTERNATIVE if requirement.semantic_input_id == requirement_set.branch_selector_input_id else CompletenessStatus.WRONG_CONTROLLED_CATEGORY
-                diagnostics.append(_details(requirement, candidates, status, "literal controlled category is not admitted by this requirement"))
-                continue
+        if step.allowed_categories and candidate.category not in step.allowed_categories:
+            diagnostics.append(_details(requirement, candidates, step.category_status, "literal controlled category is not admitted by this requirement"))
+            continue
         diagnostics.append(_details(requirement, candidates, CompletenessStatus.SATISFIED, "explicit supplied input satisfies the declared requirement"))
 
-    if requirement_set.requirement_set_id == "geometric_usable_powder_space":
-        gross = tuple(item for item in bundle.candidates if item.semantic_input_id == "gross_primer_pocket_treatment")
-        target = tuple(item for item in bundle.candidates if item.semantic_input_id == "target_primer_pocket_treatment")
-        correction = tuple(item for item in bundle.candidates if item.semantic_input_id == "primer_pocket_correction")
-        correction_index = next(index for index, item in enumerate(diagnostics) if item.requirement_id == "primer_pocket_correction")
+    if plan.primer_correction_position is not None:
+        gross = by_input.get("gross_primer_pocket_treatment", ())
+        target = by_input.get("target_primer_pocket_treatment", ())
+        correction = by_input.get("primer_pocket_correction", ())
+        correction_index = plan.primer_correction_position
         current = diagnostics[correction_index]
         if len(gross) == len(target) == 1 and gross[0].category is not None and target[0].category is not None:
             if "unknown" in {gross[0].category, target[0].category}:
@@ -269,11 +363,13 @@ def evaluate_input_completeness(requirement_set: RequirementSet, bundle: InputBu
             elif gross[0].category != target[0].category and current.status is CompletenessStatus.SATISFIED:
                 diagnostics[correction_index] = replace(current, explanation=f"explicit correction accompanies primer-pocket basis mismatch ({gross[0].category} versus {target[0].category})")
 
-    if requirement_set.requirement_set_id == "seated_projectile_displacement" and selected_branch in {"partial_boat_tail", "full_boat_tail"}:
+    boat_tail = plan.boat_tail_positions.get(selected_branch) if selected_branch is not None else None
+    if boat_tail is not None:
         def one_quantity(name: str):
-            values = tuple(item for item in bundle.candidates if item.semantic_input_id == name and item.quantity is not None)
+            values = tuple(item for item in by_input.get(name, ()) if item.quantity is not None)
             return values[0].quantity if len(values) == 1 else None
 
+        intrusion_index, tail_base_index = boat_tail
         intrusion = one_quantity("seated_intrusion")
         tail_length = one_quantity("boat_tail_axial_length")
         shank = one_quantity("shank_diameter")
@@ -281,13 +377,9 @@ def evaluate_input_completeness(requirement_set: RequirementSet, bundle: InputBu
         if intrusion is not None and tail_length is not None and intrusion.dimension is tail_length.dimension:
             inconsistent = (selected_branch == "partial_boat_tail" and intrusion.si_value > tail_length.si_value) or (selected_branch == "full_boat_tail" and intrusion.si_value < tail_length.si_value)
             if inconsistent:
-                requirement_id = "partial_intrusion" if selected_branch == "partial_boat_tail" else "full_intrusion"
-                index = next(index for index, item in enumerate(diagnostics) if item.requirement_id == requirement_id)
-                diagnostics[index] = replace(diagnostics[index], status=CompletenessStatus.MUTUALLY_INCONSISTENT, explanation="explicit intrusion and tail length contradict the selected partial/full boat-tail branch")
+                diagnostics[intrusion_index] = replace(diagnostics[intrusion_index], status=CompletenessStatus.MUTUALLY_INCONSISTENT, explanation="explicit intrusion and tail length contradict the selected partial/full boat-tail branch")
         if shank is not None and tail_base is not None and shank.dimension is tail_base.dimension and tail_base.si_value > shank.si_value:
-            requirement_id = "partial_tail_base_diameter" if selected_branch == "partial_boat_tail" else "full_tail_base_diameter"
-            index = next(index for index, item in enumerate(diagnostics) if item.requirement_id == requirement_id)
-            diagnostics[index] = replace(diagnostics[index], status=CompletenessStatus.INVALID_VALUE_DOMAIN, explanation="existing M01 boat-tail geometry rejects a tail-base diameter larger than the shank diameter")
+            diagnostics[tail_base_index] = replace(diagnostics[tail_base_index], status=CompletenessStatus.INVALID_VALUE_DOMAIN, explanation="existing M01 boat-tail geometry rejects a tail-base diameter larger than the shank diameter")
     passed = all(item.status in {CompletenessStatus.SATISFIED, CompletenessStatus.NOT_APPLICABLE} for item in diagnostics)
     provenance = Provenance(
         EvidenceClass.DERIVED_QUANTITY, ValueOrigin.DERIVED, "SRC-M03-DESIGN",
@@ -296,3 +388,33 @@ def evaluate_input_completeness(requirement_set: RequirementSet, bundle: InputBu
         "Diagnostic completeness only; no physical-validity or readiness claim.",
     )
     return CompletenessEvaluation(record_id, requirement_set.requirement_set_id, requirement_set.version, bundle.record_id, selected_branch, passed, tuple(diagnostics), provenance)
+
+
+def evaluate_input_completeness(requirement_set: RequirementSet, bundle: InputBundle, *, record_id: str) -> CompletenessEvaluation:
+    """Inspect explicit candidates against one requirement set without inference."""
+
+    return _evaluate(compile_requirement_set(requirement_set), bundle, _index_candidates(bundle), record_id)
+
+
+def _default_record_id(requirement_set: RequirementSet, bundle: InputBundle) -> str:
+    return f"{bundle.record_id}:{requirement_set.requirement_set_id}:v{requirement_set.version}"
+
+
+def evaluate_input_completeness_batch(
+    bundles: Iterable[InputBundle],
+    requirement_sets: Iterable[RequirementSet] | None = None,
+    *,
+    record_id: Callable[[RequirementSet, InputBundle], str] = _default_record_id,
+) -> Iterator[CompletenessEvaluation]:
+    """Lazily evaluate every bundle against every requirement set, bundle by bundle.
+
+    Each bundle's candidates are grouped by semantic input once and shared by
+    all sets, so results equal ``evaluate_input_completeness`` called per pair.
+    ``requirement_sets`` defaults to ``production_requirement_sets()``.
+    """
+
+    plans = tuple(compile_requirement_set(item) for item in (production_requirement_sets() if requirement_sets is None else requirement_sets))
+    for bundle in bundles:
+        by_input = _index_candidates(bundle)
+        for plan in plans:
+            yield _evaluate(plan, bundle, by_input, record_id(plan.requirement_set, bundle))
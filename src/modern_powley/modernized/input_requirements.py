@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Mapping
 
 from .missing_values import MissingState
@@ -318,8 +319,12 @@ def _req(requirement_id: str, semantic_input_id: str, dimension: Dimension, *, k
     return InputRequirement(requirement_id, semantic_input_id, kind, f"Explicit {semantic_input_id} required by the existing M01 operation", candidate_kinds, dimension, (), branch, True)
 
 
+@lru_cache(maxsize=1)
 def production_requirement_sets() -> tuple[RequirementSet, ...]:
-    """Return only requirement sets for existing M01 geometry and ratio operations."""
+    """Return only requirement sets for existing M01 geometry and ratio operations.
+
+    The sets are immutable, so the same tuple is returned on every call.
+    """
 
     provenance = m03_design_provenance()
     promoted = ModelMaturity.PROMOTED_MODERN
@@ -0,0 +1,209 @@
+"""Streaming JSON Lines archives of tagged M01-M05 and empirical-load records.
+
+Each non-blank line holds one complete record in the strict tagged form of its
+milestone serializer. Lines are decoded one at a time, so an archive is never
+held in memory, and a malformed line is reported with its line number rather
+than aborting the remainder of the file.
+
+Reading is strict by default. A ``ValidatedRecordCache`` may be supplied to
+reuse records that already passed full decoding in this process. Entries are
+keyed by the SHA-256 of the record's canonical JSON and
+``RECORD_VALIDATOR_VERSION``, and every miss falls back to full validation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import IO, Any, Mapping, TypeAlias
+
+from .charge_regions import M05_SCHEMA_ID, ChargeRegionRecord
+from .empirical_load_records import EMPIRICAL_LOAD_EVIDENCE_SCHEMA_ID, EmpiricalLoadEvidenceRecord
+from .empirical_load_serialization import EmpiricalDecodingScope, empirical_load_record_from_dict, empirical_load_record_to_dict, loads_empirical_load_record
+from .input_requirements import M03_SCHEMA_ID
+from .m02_serialization import M02Record, loads_m02_record, m02_record_from_dict, m02_record_to_dict
+from .m03_serialization import M03Record, loads_m03_record, m03_record_from_dict, m03_record_to_dict
+from .m04_serialization import M04Record, loads_m04_record, m04_record_from_dict, m04_record_to_dict
+from .m05_serialization import loads_m05_record, m05_record_from_dict, m05_record_to_dict
+from .powder_identity import M02_SCHEMA_ID
+from .records import SCHEMA_ID
+from .screening_criteria import M04_SCHEMA_ID
+from .serialization import M01Record, loads_record, record_from_dict, record_to_dict
+
+# Bump whenever any milestone decoder changes what it accepts.
+RECORD_VALIDATOR_VERSION = 1
+
+TaggedRecord: TypeAlias = M01Record | M02Record | M03Record | M04Record | ChargeRegionRecord | EmpiricalLoadEvidenceRecord
+
+# Each milestone's dictionary decoder and its own strict ``loads_*`` function.
+_DECODERS: dict[str, tuple[Callable[[Mapping[str, Any]], TaggedRecord], Callable[[str], TaggedRecord]]] = {
+    SCHEMA_ID: (record_from_dict, loads_record),
+    M02_SCHEMA_ID: (m02_record_from_dict, loads_m02_record),
+    M03_SCHEMA_ID: (m03_record_from_dict, loads_m03_record),
+    M04_SCHEMA_ID: (m04_record_from_dict, loads_m04_record),
+    M05_SCHEMA_ID: (m05_record_from_dict, loads_m05_record),
+    EMPIRICAL_LOAD_EVIDENCE_SCHEMA_ID: (empirical_load_record_from_dict, loads_empirical_load_record),
+}
+
+_ENCODERS: tuple[tuple[object, Callable[[Any], dict[str, object]]], ...] = (
+    (M01Record, record_to_dict),
+    (M02Record, m02_record_to_dict),
+    (M03Record, m03_record_to_dict),
+    (M04Record, m04_record_to_dict),
+    (ChargeRegionRecord, m05_record_to_dict),
+    (EmpiricalLoadEvidenceRecord, empirical_load_record_to_dict),
+)
+
+
+# Encoded trees come fresh from ``to_dict`` and cannot be cyclic.
+_LINE_ENCODER = json.JSONEncoder(allow_nan=False, check_circular=False, separators=(",", ":"), sort_keys=True)
+
+
+@dataclass(frozen=True, slots=True)
+class JsonlLine:
+    """One decoded archive line: a record, or the reason it was rejected."""
+
+    line_number: int
+    record: TaggedRecord | None = None
+    error: str | None = None
+
+    def __post_init__(self) -> None:
+        if isinstance(self.line_number, bool) or not isinstance(self.line_number, int) or self.line_number < 1:
+            raise ValueError("line_number must be a positive integer")
+        if (self.record is None) == (self.error is None):
+            raise ValueError("a JSONL line carries exactly one of record or error")
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _reject_constant(value: str) -> None:
+    raise ValueError(f"non-finite JSON number is prohibited: {value}")
+
+
+def _reject_duplicates(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for key, value in pairs:
+        if key in result:
+            raise ValueError(f"duplicate JSON object key: {key}")
+        result[key] = value
+    return result
+
+
+def _milestone(schema: object) -> tuple[Callable[[Mapping[str, Any]], TaggedRecord], Callable[[str], TaggedRecord]]:
+    try:
+        return _DECODERS[schema]
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"unsupported schema: {schema!r}") from error
+
+
+def tagged_record_from_dict(data: Mapping[str, Any]) -> TaggedRecord:
+    """Parse one tagged record with the serializer named by its ``schema``."""
+    if not isinstance(data, Mapping):
+        raise ValueError("tagged record must be an object")
+    if "schema" not in data:
+        raise ValueError("tagged record is missing schema")
+    return _milestone(data["schema"])[0](data)
+
+
+def tagged_record_loader(schema: object) -> Callable[[str], TaggedRecord]:
+    """Return the ``loads_*`` function of the milestone named by ``schema``."""
+    return _milestone(schema)[1]
+
+
+def tagged_record_to_dict(record: TaggedRecord) -> dict[str, object]:
+    """Serialize one record with the serializer of its milestone."""
+    for record_types, encoder in _ENCODERS:
+        if isinstance(record, record_types):
+            return encoder(record)
+    raise TypeError(f"unsupported record type: {type(record).__name__}")
+
+
+def _parse_json(text: str | bytes) -> Any:
+    try:
+        return json.loads(text, parse_constant=_reject_constant, object_pairs_hook=_reject_duplicates)
+    except (json.JSONDecodeError, UnicodeDecodeError) as error:
+        raise ValueError("invalid JSON") from error
+
+
+def canonical_record_digest(data: Mapping[str, Any]) -> str:
+    """SHA-256 of a parsed record's canonical JSON under the current validator."""
+    canonical = json.dumps(data, allow_nan=False, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(f"{RECORD_VALIDATOR_VERSION}\n{canonical}".encode()).hexdigest()
+
+
+class ValidatedRecordCache:
+    """Records that passed full strict decoding, keyed by content digest.
+
+    Records are immutable, so a line whose canonical JSON matches an earlier
+    validated line is answered with that record instead of being decoded and
+    validated again; whitespace and key order do not matter. The least
+    recently used entry is dropped once ``maxsize`` is reached. Nothing is
+    kept on disk: a record is only trusted without validation if it was
+    decoded and validated in this process.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        if isinstance(maxsize, bool) or not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._records: OrderedDict[str, TaggedRecord] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def loads(self, payload: str | bytes) -> TaggedRecord:
+        """Decode one JSON record, validating it fully unless already cached."""
+        data = _parse_json(payload)
+        key = canonical_record_digest(data)
+        record = self._records.get(key)
+        if record is not None:
+            self._records.move_to_end(key)
+            self.hits += 1
+            return record
+        self.misses += 1
+        record = self._records[key] = tagged_record_from_dict(data)
+        if len(self._records) > self.maxsize:
+            self._records.popitem(last=False)
+        return record
+
+    def clear(self) -> None:
+        self._records.clear()
+
+
+def iter_jsonl_records(stream: IO[str] | IO[bytes], *, cache: ValidatedRecordCache | None = None) -> Iterator[JsonlLine]:
+    """Lazily decode a JSONL archive, one result per non-blank line.
+
+    Lines that fail to decode yield a ``JsonlLine`` carrying the error message
+    and 1-based line number; decoding continues with the next line.
+    Empirical-load records decoded from one stream share one
+    ``EmpiricalDecodingScope``.
+    """
+    scope = EmpiricalDecodingScope()
+    for line_number, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            with scope:
+                record = tagged_record_from_dict(_parse_json(text)) if cache is None else cache.loads(text)
+        except (ValueError, TypeError, KeyError) as error:
+            yield JsonlLine(line_number, error=str(error) or type(error).__name__)
+        else:
+            yield JsonlLine(line_number, record=record)
+
+
+def write_jsonl_records(stream: IO[str], records: Iterable[TaggedRecord]) -> int:
+    """Write records as compact deterministic JSON lines and return the count."""
+    encode = _LINE_ENCODER.encode
+    count = 0
+    for record in records:
+        stream.write(encode(tagged_record_to_dict(record)))
+        stream.write("\n")
+        count += 1
+    return count
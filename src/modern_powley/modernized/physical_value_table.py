@@ -0,0 +1,121 @@
+"""Columnar M01 physical values with interned provenance and uncertainty."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Hashable, Iterable, Sequence, TypeVar
+
+import numpy as np
+
+from .provenance import Provenance
+from .records import PhysicalValue, UncertaintyTreatment
+from .uncertainty import Uncertainty
+from .units import Quantity, QuantityArray, Unit
+
+_T = TypeVar("_T", bound=Hashable)
+
+
+def _intern(items: Iterable[_T]) -> tuple[tuple[_T, ...], np.ndarray]:
+    pool: dict[_T, int] = {}
+    codes = np.fromiter((pool.setdefault(item, len(pool)) for item in items), dtype=np.int32)
+    return tuple(pool), codes
+
+
+def _codes(codes: Sequence[int] | np.ndarray, pool: tuple[object, ...], size: int, name: str) -> np.ndarray:
+    array = np.array(codes, dtype=np.int32)
+    if array.shape != (size,):
+        raise ValueError(f"{name} codes must have one entry per value")
+    if size and (array.min() < 0 or array.max() >= len(pool)):
+        raise ValueError(f"{name} codes must reference the {name} pool")
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PhysicalValueTable:
+    """Dictionary-encoded physical values; each row is one ``PhysicalValue``.
+
+    Units, provenance, uncertainty, treatment, and notes are stored once per
+    distinct value in a pool and referenced from each row by code.
+    """
+
+    record_ids: tuple[str, ...]
+    values: np.ndarray
+    unit_codes: np.ndarray
+    units: tuple[Unit, ...]
+    provenance_codes: np.ndarray
+    provenances: tuple[Provenance, ...]
+    uncertainty_codes: np.ndarray
+    uncertainties: tuple[Uncertainty, ...]
+    treatment_codes: np.ndarray
+    treatments: tuple[UncertaintyTreatment, ...]
+    notes_codes: np.ndarray
+    notes: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        size = len(self.record_ids)
+        if any(not record_id.strip() for record_id in self.record_ids):
+            raise ValueError("physical value record_id is required")
+        object.__setattr__(self, "units", tuple(Unit(unit) for unit in self.units))
+        object.__setattr__(self, "treatments", tuple(UncertaintyTreatment(item) for item in self.treatments))
+        values = QuantityArray(self.values, Unit.ONE).values
+        if values.shape != (size,):
+            raise ValueError("values must have one entry per record_id")
+        object.__setattr__(self, "values", values)
+        for name, pool in (("unit", self.units), ("provenance", self.provenances), ("uncertainty", self.uncertainties), ("treatment", self.treatments), ("notes", self.notes)):
+            object.__setattr__(self, f"{name}_codes", _codes(getattr(self, f"{name}_codes"), pool, size, name))
+        pairs = set(zip(self.unit_codes.tolist(), self.uncertainty_codes.tolist()))
+        for unit_code, uncertainty_code in pairs:
+            self.uncertainties[uncertainty_code].validate_for(Quantity(1.0, self.units[unit_code]))
+
+    @classmethod
+    def from_values(cls, values: Iterable[PhysicalValue]) -> PhysicalValueTable:
+        """Build a table, interning identical metadata across values."""
+        rows = tuple(values)
+        units, unit_codes = _intern(value.quantity.unit for value in rows)
+        provenances, provenance_codes = _intern(value.provenance for value in rows)
+        uncertainties, uncertainty_codes = _intern(value.uncertainty for value in rows)
+        treatments, treatment_codes = _intern(value.uncertainty_treatment for value in rows)
+        notes, notes_codes = _intern(value.notes for value in rows)
+        return cls(
+            tuple(value.record_id for value in rows),
+            np.fromiter((value.quantity.value for value in rows), np.float64, len(rows)),
+            unit_codes,
+            units,
+            provenance_codes,
+            provenances,
+            uncertainty_codes,
+            uncertainties,
+            treatment_codes,
+            treatments,
+            notes_codes,
+            notes,
+        )
+
+    def __len__(self) -> int:
+        return len(self.record_ids)
+
+    def __getitem__(self, index: int) -> PhysicalValue:
+        return PhysicalValue(
+            self.record_ids[index],
+            Quantity._trusted(float(self.values[index]), self.units[self.unit_codes[index]]),
+            self.provenances[self.provenance_codes[index]],
+            self.uncertainties[self.uncertainty_codes[index]],
+            self.treatments[self.treatment_codes[index]],
+            self.notes[self.notes_codes[index]],
+        )
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+    def to_values(self) -> tuple[PhysicalValue, ...]:
+        return tuple(self)
+
+    def quantities(self, unit: Unit) -> QuantityArray:
+        """Return every value converted to one unit of a shared dimension."""
+        target = Unit(unit)
+        converted = np.empty(len(self), dtype=np.float64)
+        for code, source in enumerate(self.units):
+            rows = self.unit_codes == code
+            converted[rows] = QuantityArray(self.values[rows], source).to(target).values
+        return QuantityArray(converted, target)
@@ -0,0 +1,190 @@
+"""Parallel strict validation of a directory tree of single-record JSON files.
+
+Each ``*.json`` file is read whole and passed to the ``loads_*`` function of
+the milestone named by its ``schema``, looked up in the JSON Lines reader's
+dispatch table; nothing here re-implements a decoder or its JSON rules. Files
+are sharded across a ``ProcessPoolExecutor`` and every file yields one
+``FileValidation``; a file that cannot be read is reported ``INVALID`` rather
+than aborting the run. A manifest of previously valid files, stamped with
+``RECORD_VALIDATOR_VERSION``, lets a run skip files whose modification time or
+SHA-256 has not changed; an unreadable manifest means every file is validated.
+
+Run as ``python -m modern_powley.modernized.record_validation ROOT``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from .jsonl import RECORD_VALIDATOR_VERSION, tagged_record_loader
+
+
+class FileStatus(str, Enum):
+    VALID = "valid"
+    INVALID = "invalid"
+    UNCHANGED = "unchanged"
+
+
+class ChangeDetection(str, Enum):
+    MTIME = "mtime"
+    HASH = "hash"
+
+
+@dataclass(frozen=True, slots=True)
+class FileValidation:
+    """Outcome for one file; ``path`` is relative to the validated root."""
+
+    path: str
+    status: FileStatus
+    schema: str | None
+    record_type: str | None
+    error: str | None
+    sha256: str | None
+    mtime_ns: int
+    size: int
+
+    def to_dict(self) -> dict[str, object]:
+        return asdict(self) | {"status": self.status.value}
+
+
+def _tag(data: Any, name: str) -> str | None:
+    value = data.get(name) if isinstance(data, dict) else None
+    return value if isinstance(value, str) else None
+
+
+def validate_record_file(root: str | os.PathLike[str], relative: str) -> FileValidation:
+    """Strictly load one record file with its schema's ``loads_*`` function."""
+    path = Path(root) / relative
+    mtime_ns = size = 0
+    try:
+        stat = path.stat()
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        payload = path.read_bytes()
+    except OSError as error:
+        return FileValidation(relative, FileStatus.INVALID, None, None, f"unreadable record file: {error.strerror or error}", None, mtime_ns, size)
+    digest = hashlib.sha256(payload).hexdigest()
+    schema = record_type = None
+    try:
+        text = payload.decode("utf-8")
+        data = json.loads(text)
+        schema, record_type = _tag(data, "schema"), _tag(data, "record_type")
+        tagged_record_loader(data.get("schema") if isinstance(data, dict) else None)(text)
+    except (ValueError, TypeError, KeyError) as error:
+        return FileValidation(relative, FileStatus.INVALID, schema, record_type, str(error) or type(error).__name__, digest, mtime_ns, size)
+    return FileValidation(relative, FileStatus.VALID, schema, record_type, None, digest, mtime_ns, size)
+
+
+def _validate_shard(root: str, paths: Sequence[str]) -> list[FileValidation]:
+    return [validate_record_file(root, path) for path in paths]
+
+
+def load_manifest(path: str | os.PathLike[str]) -> dict[str, FileValidation]:
+    """Read valid-file entries.
+
+    A missing, unreadable, corrupt, or partial manifest, or one stamped with
+    another validator version, yields none, so every file is validated again.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("validator_version") != RECORD_VALIDATOR_VERSION:
+            return {}
+        return {item["path"]: FileValidation(**(item | {"status": FileStatus.VALID})) for item in data["files"]}
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
+
+
+def write_manifest(path: str | os.PathLike[str], results: Iterable[FileValidation]) -> None:
+    """Record every valid or unchanged file for a later changed-only run."""
+    files = [item.to_dict() | {"status": FileStatus.VALID.value} for item in results if item.status is not FileStatus.INVALID]
+    Path(path).write_text(json.dumps({"validator_version": RECORD_VALIDATOR_VERSION, "files": files}, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _unchanged(root: Path, relative: str, previous: FileValidation | None, detection: ChangeDetection) -> FileValidation | None:
+    if previous is None:
+        return None
+    path = root / relative
+    try:
+        stat = path.stat()
+        if detection is ChangeDetection.MTIME:
+            same = (stat.st_mtime_ns, stat.st_size) == (previous.mtime_ns, previous.size)
+        else:
+            same = stat.st_size == previous.size and hashlib.sha256(path.read_bytes()).hexdigest() == previous.sha256
+    except OSError:
+        return None
+    if not same:
+        return None
+    return FileValidation(relative, FileStatus.UNCHANGED, previous.schema, previous.record_type, None, previous.sha256, stat.st_mtime_ns, stat.st_size)
+
+
+def validate_record_tree(
+    root: str | os.PathLike[str],
+    *,
+    workers: int | None = None,
+    manifest: Mapping[str, FileValidation] | None = None,
+    changed_only: ChangeDetection | None = None,
+    shard_size: int = 64,
+) -> tuple[FileValidation, ...]:
+    """Validate every ``*.json`` file below ``root`` in sorted path order.
+
+    ``workers=1`` validates in this process. With ``changed_only`` set, files
+    whose manifest entry still matches are reported ``UNCHANGED`` unread (for
+    ``MTIME``) or unparsed (for ``HASH``).
+    """
+    if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int) or workers < 1):
+        raise ValueError("workers must be a positive integer")
+    if isinstance(shard_size, bool) or not isinstance(shard_size, int) or shard_size < 1:
+        raise ValueError("shard_size must be a positive integer")
+    base = Path(root)
+    if not base.is_dir():
+        raise ValueError(f"record root is not a directory: {base}")
+    detection = None if changed_only is None else ChangeDetection(changed_only)
+    results: dict[str, FileValidation] = {}
+    pending: list[str] = []
+    for path in sorted(base.rglob("*.json")):
+        relative = path.relative_to(base).as_posix()
+        skipped = None if detection is None else _unchanged(base, relative, (manifest or {}).get(relative), detection)
+        if skipped is None:
+            pending.append(relative)
+        else:
+            results[relative] = skipped
+    shards = [pending[start : start + shard_size] for start in range(0, len(pending), shard_size)]
+    if workers == 1 or len(shards) <= 1:
+        validated = [_validate_shard(str(base), shard) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            validated = list(pool.map(_validate_shard, [str(base)] * len(shards), shards))
+    for shard in validated:
+        results.update((item.path, item) for item in shard)
+    return tuple(results[path] for path in sorted(results))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Strictly validate every JSON record file below a directory.")
+    parser.add_argument("root", type=Path)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--manifest", type=Path, help="valid-file manifest to read and rewrite")
+    parser.add_argument("--changed-only", choices=[item.value for item in ChangeDetection], help="skip files unchanged since the manifest")
+    arguments = parser.parse_args(argv)
+    if arguments.changed_only and arguments.manifest is None:
+        parser.error("--changed-only requires --manifest")
+    previous = {} if arguments.manifest is None else load_manifest(arguments.manifest)
+    results = validate_record_tree(arguments.root, workers=arguments.workers, manifest=previous, changed_only=arguments.changed_only)
+    for item in results:
+        sys.stdout.write(json.dumps(item.to_dict(), sort_keys=True) + "\n")
+    if arguments.manifest is not None:
+        write_manifest(arguments.manifest, results)
+    return int(any(item.status is FileStatus.INVALID for item in results))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,7 +6,9 @@ from dataclasses import dataclass
 from enum import Enum
 from math import isfinite
 from numbers import Real
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
+
+import numpy as np
 
 
 class Dimension(str, Enum):
@@ -101,6 +103,30 @@ _TO_SI_FACTOR = {
     Unit.ONE: 1.0,
 }
 
+# Linear conversions keep the two-step value * source factor / target factor
+# product so converted values are unchanged; only the lookups are hoisted.
+_CONVERSION_FACTORS = {
+    (source, target): (_TO_SI_FACTOR[source], _TO_SI_FACTOR[target])
+    for source in Unit
+    for target in Unit
+    if _UNIT_DIMENSION[source] is _UNIT_DIMENSION[target] and Unit.DEGREE_CELSIUS not in {source, target}
+}
+_AFFINE_CONVERSIONS = {
+    (Unit.DEGREE_CELSIUS, Unit.KELVIN): lambda value: value + 273.15,
+    (Unit.KELVIN, Unit.DEGREE_CELSIUS): lambda value: value * 1.0 - 273.15,
+    (Unit.DEGREE_CELSIUS, Unit.DEGREE_CELSIUS): lambda value: value + 273.15 - 273.15,
+}
+
+
+def _convert(value: Any, source: Unit, target: Unit) -> Any:
+    factors = _CONVERSION_FACTORS.get((source, target))
+    if factors is not None:
+        return value * factors[0] / factors[1]
+    affine = _AFFINE_CONVERSIONS.get((source, target))
+    if affine is None:
+        raise ValueError(f"cannot convert {_UNIT_DIMENSION[source].value} to {_UNIT_DIMENSION[target].value}")
+    return affine(value)
+
 
 def _strict_keys(data: Mapping[str, Any], required: set[str]) -> None:
     if set(data) != required:
@@ -135,14 +161,18 @@ class Quantity:
         return self.value * _TO_SI_FACTOR[self.unit]
 
     def to(self, unit: Unit) -> Quantity:
-        target = Unit(unit)
-        if _UNIT_DIMENSION[target] is not self.dimension:
-            raise ValueError(f"cannot convert {self.dimension.value} to {_UNIT_DIMENSION[target].value}")
-        if target is Unit.DEGREE_CELSIUS:
-            value = self.si_value - 273.15
-        else:
-            value = self.si_value / _TO_SI_FACTOR[target]
-        return Quantity(value, target)
+        target = unit if isinstance(unit, Unit) else Unit(unit)
+        return Quantity._trusted(_convert(self.value, self.unit, target), target)
+
+    @classmethod
+    def _trusted(cls, value: float, unit: Unit) -> Quantity:
+        """Build a quantity from a float derived from an already valid one."""
+        if not isfinite(value):
+            raise ValueError("quantity value must be finite")
+        quantity = object.__new__(cls)
+        object.__setattr__(quantity, "value", value)
+        object.__setattr__(quantity, "unit", unit)
+        return quantity
 
     def to_dict(self) -> dict[str, object]:
         return {"value": self.value, "unit": self.unit.value}
@@ -153,7 +183,84 @@ class Quantity:
         return cls(data["value"], Unit(str(data["unit"])))
 
 
-def require_dimension(quantity: Quantity, dimension: Dimension, name: str) -> Quantity:
+@dataclass(frozen=True, slots=True, eq=False)
+class QuantityArray:
+    """Supplied values sharing one unit, held as a read-only float64 buffer."""
+
+    values: np.ndarray
+    unit: Unit
+
+    def __post_init__(self) -> None:
+        values = np.asarray(self.values)
+        if values.dtype.kind not in "iuf":
+            raise TypeError("quantity values must be real JSON-compatible numbers")
+        values = np.array(values, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError("quantity values must be one-dimensional")
+        if not np.isfinite(values).all():
+            raise ValueError("quantity values must be finite")
+        values.setflags(write=False)
+        object.__setattr__(self, "values", values)
+        if not isinstance(self.unit, Unit):
+            object.__setattr__(self, "unit", Unit(self.unit))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Quantity:
+        return Quantity._trusted(float(self.values[index]), self.unit)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, QuantityArray):
+            return NotImplemented
+        return self.unit is other.unit and np.array_equal(self.values, other.values)
+
+    __hash__ = None
+
+    @property
+    def dimension(self) -> Dimension:
+        return _UNIT_DIMENSION[self.unit]
+
+    @property
+    def si_value(self) -> np.ndarray:
+        if self.unit is Unit.DEGREE_CELSIUS:
+            return self.values + 273.15
+        return self.values * _TO_SI_FACTOR[self.unit]
+
+    def to(self, unit: Unit) -> QuantityArray:
+        return QuantityArray(_convert(self.values, self.unit, Unit(unit)), unit)
+
+    @classmethod
+    def from_quantities(cls, quantities: tuple[Quantity, ...] | list[Quantity], unit: Unit | None = None) -> QuantityArray:
+        """Collect quantities already expressed in one unit, without conversion."""
+        target = Unit(unit) if unit is not None else quantities[0].unit if quantities else None
+        if target is None:
+            raise ValueError("an empty quantity array requires an explicit unit")
+        if any(quantity.unit is not target for quantity in quantities):
+            raise ValueError("quantity array values must share one unit")
+        return cls(np.fromiter((quantity.value for quantity in quantities), np.float64, len(quantities)), target)
+
+    def to_quantities(self) -> tuple[Quantity, ...]:
+        return tuple(Quantity._trusted(value, self.unit) for value in self.values.tolist())
+
+    def to_dict(self) -> dict[str, object]:
+        return {"values": self.values.tolist(), "unit": self.unit.value}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> QuantityArray:
+        _strict_keys(data, {"values", "unit"})
+        if not isinstance(data["values"], list) or any(isinstance(value, bool) or not isinstance(value, Real) for value in data["values"]):
+            raise TypeError("quantity values must be a list of real JSON-compatible numbers")
+        return cls(np.array(data["values"], dtype=np.float64), Unit(str(data["unit"])))
+
+
+def convert_many(quantities: Iterable[Quantity], unit: Unit) -> tuple[Quantity, ...]:
+    """Convert each quantity to one target unit through the precomputed table."""
+    target = Unit(unit)
+    return tuple(Quantity._trusted(_convert(quantity.value, quantity.unit, target), target) for quantity in quantities)
+
+
+def require_dimension(quantity: Quantity | QuantityArray, dimension: Dimension, name: str) -> Quantity | QuantityArray:
     if quantity.dimension is not dimension:
         raise ValueError(f"{name} must have dimension {dimension.value}")
     return quantity
@@ -171,3 +278,15 @@ def require_nonnegative(quantity: Quantity, dimension: Dimension, name: str) ->
     if quantity.si_value < 0:
         raise ValueError(f"{name} must be non-negative")
     return quantity
+
+
+def positive_mask(quantities: QuantityArray, dimension: Dimension, name: str) -> np.ndarray:
+    """Check the dimension once and mark the values that are greater than zero."""
+    require_dimension(quantities, dimension, name)
+    return quantities.si_value > 0
+
+
+def nonnegative_mask(quantities: QuantityArray, dimension: Dimension, name: str) -> np.ndarray:
+    """Check the dimension once and mark the values that are non-negative."""
+    require_dimension(quantities, dimension, name)
+    return quantities.si_value >= 0
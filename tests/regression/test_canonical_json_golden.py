@@ -0,0 +1,73 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from modern_powley.modernized import dumps_m02_record, dumps_m03_record, dumps_m04_record, dumps_m05_record, dumps_record
+from modern_powley.modernized.canonical_json import canonical_dumps, iter_canonical_dumps
+from modern_powley.modernized.empirical_load_serialization import dumps_empirical_load_record
+from modern_powley.modernized.jsonl import iter_jsonl_records, tagged_record_to_dict, write_jsonl_records
+from modern_powley.modernized.units import Unit
+from tests.unit.test_empirical_load_evidence_records import all_records
+from tests.unit.test_jsonl import mixed_records
+from tests.unit.test_m03_input_completeness import bundle, candidate, requirement_set
+from tests.unit.test_m04_screening_records import context, criterion, criterion_set
+
+GOLDEN = Path(__file__).with_name("canonical_json")
+DUMPS = {
+    "m01": dumps_record,
+    "m02": dumps_m02_record,
+    "m03": dumps_m03_record,
+    "m04": dumps_m04_record,
+    "m05": dumps_m05_record,
+    "empirical_load_evidence": dumps_empirical_load_record,
+}
+
+
+def golden_records():
+    cartridge, identity, observation, region, *_ = mixed_records()
+    records = [
+        ("m01", cartridge),
+        ("m02", identity),
+        ("m02", observation),
+        ("m03", requirement_set("circle_area")),
+        ("m03", bundle(candidate("diameter", 0.308, Unit.INCH))),
+        ("m04", criterion()),
+        ("m04", criterion_set()),
+        ("m04", context()),
+        ("m05", region),
+        *(("empirical_load_evidence", record) for record in all_records()),
+    ]
+    return [(f"{index:02d}-{milestone}-{tagged_record_to_dict(record)['record_type']}.json", milestone, record) for index, (milestone, record) in enumerate(records)]
+
+
+def test_golden_files_cover_every_case_and_nothing_else():
+    assert sorted(path.name for path in GOLDEN.glob("*.json")) == [name for name, _, _ in golden_records()]
+
+
+@pytest.mark.parametrize(("name", "milestone", "record"), golden_records(), ids=lambda value: value if isinstance(value, str) else None)
+def test_canonical_encoder_matches_dumps_and_golden_bytes(name, milestone, record):
+    golden = (GOLDEN / name).read_text(encoding="utf-8")
+    assert DUMPS[milestone](record) == golden
+    assert canonical_dumps(record) == golden
+    for indent in (None, 0, 4):
+        assert canonical_dumps(record, indent=indent) == DUMPS[milestone](record, indent=indent)
+
+
+def test_bulk_encoding_matches_per_record_output():
+    records = [record for _, _, record in golden_records()]
+    assert list(iter_canonical_dumps(records, indent=None)) == [canonical_dumps(record, indent=None) for record in records]
+    with pytest.raises(ValueError, match="indent"):
+        canonical_dumps(records[0], indent=True)
+
+
+def test_jsonl_writer_emits_one_canonical_line_per_record_that_round_trips():
+    records = [record for _, _, record in golden_records()]
+    stream = io.StringIO()
+    assert write_jsonl_records(stream, records) == len(records)
+    assert stream.getvalue() == "".join(json.dumps(tagged_record_to_dict(record), allow_nan=False, separators=(",", ":"), sort_keys=True) + "\n" for record in records)
+    stream.seek(0)
+    lines = list(iter_jsonl_records(stream))
+    assert [line.line_number for line in lines] == list(range(1, len(records) + 1))
+    assert [line.record for line in lines] == records
@@ -0,0 +1,45 @@
+import math
+
+import numpy as np
+import pytest
+
+from modern_powley.later._bands import compile_bands, compile_partition
+from modern_powley.later.davis import TRANSCRIBED_BAND_INDEX, TRANSCRIBED_BANDS, matching_transcribed_bands
+from modern_powley.later.emulator import POWDER_BAND_INDEX, POWDER_BANDS, PowderBand, select_powder_band
+
+
+def _probe_values():
+    endpoints = sorted({bound for band in POWDER_BANDS for bound in (band.lower, band.upper) if bound is not None})
+    values = [0.5, 1.0, 1000.0, *np.random.default_rng(9).uniform(1.0, 250.0, 500)]
+    for endpoint in endpoints:
+        values += [math.nextafter(endpoint, -math.inf), endpoint, math.nextafter(endpoint, math.inf)]
+    return values
+
+
+def test_compiled_partition_matches_linear_predicate_filter():
+    values = _probe_values()
+    for value in values:
+        assert select_powder_band(value) == [band for band in POWDER_BANDS if band.includes(value)][0]
+    assert [POWDER_BANDS[position] for position in POWDER_BAND_INDEX.position_batch(values)] == [select_powder_band(value) for value in values]
+
+
+def test_transcribed_bands_keep_overlapping_endpoints():
+    values = _probe_values()
+    for value in values:
+        assert matching_transcribed_bands(value) == tuple(band for band in TRANSCRIBED_BANDS if band.includes(value))
+    membership = TRANSCRIBED_BAND_INDEX.membership_batch(values)
+    assert membership.shape == (len(values), len(TRANSCRIBED_BANDS))
+    assert [tuple(np.flatnonzero(row)) for row in membership] == [TRANSCRIBED_BAND_INDEX.positions(value) for value in values]
+    assert not TRANSCRIBED_BAND_INDEX.is_partition()
+
+
+def test_partition_check_runs_once_at_build_time():
+    gap = (PowderBand(None, False, 10.0, False, "", "low"), PowderBand(10.0, False, None, False, "", "high"))
+    overlap = (PowderBand(None, False, 10.0, True, "", "low"), PowderBand(10.0, True, None, False, "", "high"))
+    for bands in (gap, overlap):
+        with pytest.raises(RuntimeError, match="not a partition"):
+            compile_partition(bands, "bands are not a partition")
+        assert not compile_bands(bands).is_partition()
+    closed = (PowderBand(None, False, 10.0, True, "", "low"), PowderBand(10.0, False, None, False, "", "high"))
+    index = compile_partition(closed, "bands are not a partition")
+    assert index.position_batch([9.0, 10.0, math.nextafter(10.0, math.inf)]).tolist() == [0, 0, 1]
@@ -0,0 +1,91 @@
+import io
+import json
+import struct
+
+import pytest
+
+from modern_powley.modernized.binary_records import BINARY_FORMAT_VERSION, dumps_binary_records, iter_binary_records, loads_binary_records
+from modern_powley.modernized.jsonl import tagged_record_to_dict, write_jsonl_records
+from tests.unit.test_empirical_load_decoding import shot_corpus
+from tests.unit.test_jsonl import mixed_records
+
+
+def canonical(record):
+    return json.dumps(tagged_record_to_dict(record), allow_nan=False, indent=2, sort_keys=True)
+
+
+def test_archive_round_trips_every_milestone_to_identical_canonical_json():
+    records = mixed_records()
+    decoded = loads_binary_records(dumps_binary_records(records))
+    assert decoded == tuple(records)
+    assert [canonical(item) for item in decoded] == [canonical(item) for item in records]
+    assert [type(item) for item in decoded] == [type(item) for item in records]
+    assert loads_binary_records(dumps_binary_records([])) == ()
+
+
+def test_shot_archive_is_much_smaller_than_compact_jsonl():
+    records = shot_corpus(500)
+    payload = dumps_binary_records(records)
+    text = io.StringIO()
+    write_jsonl_records(text, records)
+    assert loads_binary_records(payload) == tuple(records)
+    assert len(payload) * 5 < len(text.getvalue().encode())
+
+
+def test_values_keep_their_exact_json_types():
+    records = mixed_records()
+    data = [tagged_record_to_dict(item) for item in records]
+    decoded = [tagged_record_to_dict(item) for item in loads_binary_records(dumps_binary_records(records))]
+    assert json.dumps(decoded, sort_keys=True) == json.dumps(data, sort_keys=True)
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda payload: payload[:-1],
+        lambda payload: payload + b"\x00",
+        lambda payload: b"NOTREC" + payload[6:],
+        lambda payload: payload[:6] + bytes([BINARY_FORMAT_VERSION + 1]) + payload[7:],
+        lambda payload: b"",
+    ],
+)
+def test_structural_damage_is_rejected(damage):
+    payload = dumps_binary_records(mixed_records()[:2])
+    with pytest.raises(ValueError, match="invalid binary record archive"):
+        loads_binary_records(damage(payload))
+
+
+def test_non_finite_and_invalid_records_are_rejected():
+    payload = dumps_binary_records(mixed_records()[:1])
+    nan = struct.pack("<d", float("nan"))
+    header = b"MPREC\x00" + bytes([BINARY_FORMAT_VERSION])
+    with pytest.raises(ValueError, match="invalid binary record archive"):
+        loads_binary_records(header + b"\x00\x00\x01" + bytes([9, 4]) + nan)
+    with pytest.raises(ValueError, match="unsupported schema"):
+        loads_binary_records(payload.replace(b"modern_powley.m01.v1", b"modern_powley.m09.v1"))
+    with pytest.raises(TypeError, match="bytes"):
+        loads_binary_records("MPREC")
+
+
+def test_deeply_nested_bodies_are_structural_damage():
+    header = b"MPREC\x00" + bytes([BINARY_FORMAT_VERSION]) + b"\x00\x00\x01"
+    depth = 100_000
+    body = b"\x06\x01" * depth + b"\x00"
+    length = bytearray()
+    value = len(body)
+    while value > 0x7F:
+        length.append((value & 0x7F) | 0x80)
+        value >>= 7
+    length.append(value)
+    with pytest.raises(ValueError, match="invalid binary record archive"):
+        loads_binary_records(header + bytes(length) + body)
+
+
+def test_records_are_decoded_lazily_in_one_interning_scope():
+    records = shot_corpus(20)
+    decoded = iter_binary_records(dumps_binary_records(records) + b"\x00")
+    first, second = next(decoded), next(decoded)
+    assert (first, second) == tuple(records[:2])
+    assert first.load_configuration_reference is second.load_configuration_reference
+    with pytest.raises(ValueError, match="invalid binary record archive"):
+        list(decoded)
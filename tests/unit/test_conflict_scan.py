@@ -0,0 +1,142 @@
+import io
+import json
+import random
+from concurrent.futures import Future
+from dataclasses import replace
+from itertools import combinations
+
+import pytest
+
+from modern_powley.modernized import (
+    NumericComparison,
+    PowderPropertyObservation,
+    PropertyDefinition,
+    PropertyId,
+    PropertyValueKind,
+    SourceScalarPropertyValue,
+    Unit,
+    compare_property_observations,
+)
+from modern_powley.modernized import conflict_scan
+from modern_powley.modernized.conflict_scan import iter_conflict_comparisons, main, observation_blocks, write_conflict_comparisons
+from modern_powley.modernized.jsonl import iter_jsonl_records, write_jsonl_records
+from tests.unit.test_m02_identity_properties_and_missing import bulk_observation
+
+SCALAR = PropertyDefinition(
+    PropertyId.SOURCE_SPECIFIC_COEFFICIENT, "Synthetic C",
+    "Synthetic source-specific coefficient C", PropertyValueKind.SOURCE_SPECIFIC,
+    None, True, "SYNTHETIC-METHOD:C",
+)
+
+
+def observation_corpus(size=120, seed=24):
+    rng = random.Random(seed)
+    observations = []
+    for index in range(size):
+        item = replace(bulk_observation(f"SYNTHETIC-M02-SCAN-{index}", rng.choice((0.80, 0.82, 0.85)), rng.choice((Unit.GRAM_PER_CUBIC_CENTIMETRE, Unit.KILOGRAM_PER_CUBIC_METRE))), powder_identity_id=f"SYNTHETIC-M02-POWDER-{rng.randrange(6)}")
+        if rng.random() < 0.3:
+            item = replace(item, property_definition=SCALAR, value=SourceScalarPropertyValue(rng.choice((1, 2)), "unit-A", "method-C", SCALAR.definition, "synthetic scalar"))
+        observations.append(item)
+    return observations
+
+
+def all_pairs_within_blocks(observations, prefix="CONFLICT"):
+    return [
+        compare_property_observations(left, right, result_id=f"{prefix}:{left.record_id}:{right.record_id}")
+        for left, right in combinations(observations, 2)
+        if (left.powder_identity_id, left.property_definition) == (right.powder_identity_id, right.property_definition)
+    ]
+
+
+def test_blocked_scan_equals_filtered_all_pairs_scan_serially_and_in_parallel():
+    observations = observation_corpus()
+    expected = sorted(all_pairs_within_blocks(observations), key=lambda item: item.record_id)
+    serial = list(iter_conflict_comparisons(observations, workers=1))
+    parallel = list(iter_conflict_comparisons(observations, workers=2, pairs_per_task=7))
+    assert serial == parallel
+    assert sorted(serial, key=lambda item: item.record_id) == expected
+    assert len(observation_blocks(observations)) == 12
+    assert {item.numeric_comparison for item in serial} >= {NumericComparison.EQUAL_REPORTED_VALUES, NumericComparison.NUMERICALLY_DIFFERENT}
+
+
+def test_numeric_outcome_filter_and_jsonl_output_round_trip():
+    observations = observation_corpus()
+    stream = io.StringIO()
+    count = write_conflict_comparisons(stream, observations, workers=1, numeric_comparisons=[NumericComparison.NUMERICALLY_DIFFERENT], result_id_prefix="SYNTHETIC-SCAN")
+    decoded = [line.record for line in iter_jsonl_records(io.StringIO(stream.getvalue()))]
+    assert count == len(decoded) > 0
+    assert all(item.numeric_comparison is NumericComparison.NUMERICALLY_DIFFERENT for item in decoded)
+    assert all(item.record_id.startswith("SYNTHETIC-SCAN:") for item in decoded)
+    expected = [item for item in all_pairs_within_blocks(observations, "SYNTHETIC-SCAN") if item.numeric_comparison is NumericComparison.NUMERICALLY_DIFFERENT]
+    assert sorted(decoded, key=lambda item: item.record_id) == sorted(expected, key=lambda item: item.record_id)
+    with pytest.raises(ValueError, match="workers"):
+        list(iter_conflict_comparisons(observations, workers=0))
+
+
+def test_command_reads_an_archive_and_writes_comparisons(tmp_path, capsys):
+    observations = observation_corpus(30)
+    archive = tmp_path / "observations.jsonl"
+    with archive.open("w", encoding="utf-8") as stream:
+        write_jsonl_records(stream, observations)
+    output = tmp_path / "conflicts.jsonl"
+    assert main([str(archive), "--workers", "1", "--output", str(output)]) == 0
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == len(all_pairs_within_blocks(observations))
+    assert {line["record_type"] for line in lines} == {"conflict_comparison"}
+    with archive.open("a", encoding="utf-8") as stream:
+        stream.write("{not json}\n")
+    assert main([str(archive), "--workers", "1", "--numeric", "equal_reported_values"]) == 1
+    captured = capsys.readouterr()
+    assert ":31: invalid JSON" in captured.err
+    assert {json.loads(line)["numeric_comparison"] for line in captured.out.splitlines()} == {"equal_reported_values"}
+
+
+class InlineExecutor:
+    """Runs tasks in this process and records what each would have shipped."""
+
+    submitted = []
+    installed = []
+
+    def __init__(self, max_workers, initializer, initargs):
+        InlineExecutor.installed.append(initargs)
+        initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def submit(self, function, *arguments):
+        InlineExecutor.submitted.append(arguments)
+        future = Future()
+        future.set_result(function(*arguments))
+        return future
+
+
+def test_one_large_block_is_shipped_once_and_split_into_bounded_streamed_tasks(monkeypatch):
+    observations = [replace(item, powder_identity_id="SYNTHETIC-M02-POWDER-0", property_definition=SCALAR, value=SourceScalarPropertyValue(1, "unit-A", "method-C", SCALAR.definition, "synthetic scalar")) for item in observation_corpus(60)]
+    expected = all_pairs_within_blocks(observations)
+    assert len(observation_blocks(observations)) == 1 and len(expected) == 1770
+    tasks = list(conflict_scan._tasks(tuple(observation_blocks(observations).values()), 100))
+    pairs = [sum(len(observations) - 1 - index for index in range(start, stop)) for _, start, stop in tasks]
+    assert len(tasks) > 20 and tasks[-1][2] - tasks[-1][1] > 1
+    assert sum(pairs) == len(expected)
+    assert all(count <= 100 or stop - start == 1 for count, (_, start, stop) in zip(pairs, tasks))
+    monkeypatch.setattr(conflict_scan, "ProcessPoolExecutor", InlineExecutor)
+    monkeypatch.setattr(conflict_scan, "_WORKER_BLOCKS", ())
+    monkeypatch.setattr(InlineExecutor, "submitted", [])
+    monkeypatch.setattr(InlineExecutor, "installed", [])
+    scan = iter_conflict_comparisons(observations, workers=2, pairs_per_task=100)
+    assert next(scan) == expected[0]
+    assert len(InlineExecutor.submitted) == 4
+    assert [expected[0], *scan] == expected
+    assert InlineExecutor.installed == [((tuple(observations),),)]
+    assert [arguments[:3] for arguments in InlineExecutor.submitted] == tasks
+    assert not any(isinstance(value, (tuple, PowderPropertyObservation)) for arguments in InlineExecutor.submitted for value in arguments)
+    serial = iter_conflict_comparisons(observations, workers=1)
+    calls = []
+    monkeypatch.setattr(conflict_scan, "compare_property_observations", lambda *arguments, **options: calls.append(arguments) or expected[len(calls) - 1])
+    assert next(serial) == expected[0] and len(calls) == 1
+    with pytest.raises(ValueError, match="pairs_per_task"):
+        list(iter_conflict_comparisons(observations, pairs_per_task=0))
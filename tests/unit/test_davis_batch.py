@@ -0,0 +1,158 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modern_powley.later import davis
+from modern_powley.later.davis_batch import (
+    PRESSURE_COLUMNS,
+    VELOCITY_COLUMNS,
+    compiled_table4,
+    lookup_table4_f2_batch,
+    run_davis_batch,
+)
+
+
+def _scalar_chain(row, *, table4_f2=None, table4_lookup=False):
+    depth = davis.seating_depth_inches(row["case_length_inches"], row["bullet_length_inches"], row["cartridge_oal_inches"])
+    displacement = davis.flat_base_displacement_water_grains(depth, row["bullet_diameter_inches"])
+    correction = 0.0
+    if not (math.isnan(row["boat_tail_height_inches"]) and math.isnan(row["boat_tail_small_diameter_inches"])):
+        correction = davis.boat_tail_correction_water_grains(row["boat_tail_height_inches"], row["bullet_diameter_inches"], row["boat_tail_small_diameter_inches"], depth)
+    capacity = davis.loaded_powder_space_capacity_water_grains(row["gross_case_capacity_water_grains"], displacement, correction)
+    travel = davis.bullet_travel_inches(row["barrel_length_from_bolt_face_inches"], depth, row["case_length_inches"])
+    chamber = davis.powder_chamber_volume_cubic_inches(capacity)
+    bore = davis.effective_bore_volume_cubic_inches(travel, row["bullet_diameter_inches"])
+    ratio = davis.expansion_ratio(bore, chamber)
+    charge = davis.initial_charge_weight_grains(capacity, row["powder_designation"])
+    mass_ratio = davis.mass_ratio(charge, row["bullet_weight_grains"])
+    sd = davis.sectional_density(row["bullet_weight_grains"], row["bullet_diameter_inches"])
+    index = davis.powder_selection_index(sd, mass_ratio)
+    m_value = davis.velocity_fraction_m(ratio)
+    n_value = davis.velocity_fraction_n(m_value)
+    moving = davis.effective_moving_weight_grains(row["bullet_weight_grains"], charge)
+    velocity = davis.muzzle_velocity_fps(charge, n_value, moving)
+    values = [depth, displacement, correction, capacity, travel, chamber, bore, ratio, charge, mass_ratio, sd, index, m_value, n_value, moving, velocity]
+    if table4_lookup:
+        table4_f2 = davis.lookup_table4_f2(mass_ratio, ratio)
+    if table4_f2 is not None:
+        terms = davis.pressure_terms(charge, table4_f2, velocity, row["bullet_weight_grains"], capacity, ratio)
+        pressure = davis.historical_crusher_pressure(charge, velocity, row["bullet_weight_grains"], capacity, ratio, table4_f2)
+        values += [table4_f2, terms.k1, terms.k2, terms.k3, pressure]
+    return values
+
+
+def _catalogue(size):
+    rng = np.random.default_rng(1981)
+    boat_tail = rng.random(size) < 0.5
+    return pd.DataFrame(
+        {
+            "case_length_inches": rng.uniform(1.5, 2.9, size),
+            "bullet_length_inches": rng.uniform(0.6, 1.5, size),
+            "cartridge_oal_inches": rng.uniform(2.1, 3.6, size),
+            "gross_case_capacity_water_grains": rng.uniform(20.0, 100.0, size),
+            "bullet_diameter_inches": rng.uniform(0.22, 0.36, size),
+            "bullet_weight_grains": rng.uniform(45.0, 250.0, size),
+            "barrel_length_from_bolt_face_inches": rng.uniform(16.0, 28.0, size),
+            "powder_designation": rng.choice([*davis.DAVIS_RELATIVE_QUICKNESS, "IMR 7828"], size),
+            "boat_tail_height_inches": np.where(boat_tail, rng.uniform(0.05, 0.3, size), np.nan),
+            "boat_tail_small_diameter_inches": np.where(boat_tail, rng.uniform(0.18, 0.34, size), np.nan),
+        }
+    )
+
+
+@pytest.mark.parametrize("table4_lookup", [False, True])
+def test_batch_columns_match_scalar_chain_bit_for_bit_with_first_scalar_error(table4_lookup):
+    table = _catalogue(1500)
+    batch = run_davis_batch(table, table4_lookup=table4_lookup)
+    names = VELOCITY_COLUMNS + (PRESSURE_COLUMNS if table4_lookup else ())
+    assert tuple(batch.columns) == names
+    reasons = batch.reasons
+    accepted = 0
+    for position, row in enumerate(table.to_dict("records")):
+        try:
+            expected = _scalar_chain(row, table4_lookup=table4_lookup)
+        except ValueError as exc:
+            assert reasons[position] == str(exc)
+            assert all(math.isnan(batch.columns[name][position]) for name in names)
+            continue
+        accepted += 1
+        assert reasons[position] == ""
+        assert [batch.columns[name][position] for name in names] == expected
+    assert 0 < accepted < len(table)
+
+
+def test_supplied_f2_column_drives_pressure_and_rejected_values_are_reported():
+    table = {
+        "case_length_inches": [2.494, 2.494],
+        "bullet_length_inches": [1.2, 1.2],
+        "cartridge_oal_inches": [3.34, 3.34],
+        "gross_case_capacity_water_grains": [69.0, 69.0],
+        "bullet_diameter_inches": [0.308, 0.308],
+        "bullet_weight_grains": [150.0, 150.0],
+        "barrel_length_from_bolt_face_inches": [24.0, 24.0],
+        "powder_designation": ["IMR 4064", "IMR 4064"],
+        "table4_f2": [2.1, -1.0],
+    }
+    batch = run_davis_batch(table)
+    row = {**{name: values[0] for name, values in table.items()}, "boat_tail_height_inches": math.nan, "boat_tail_small_diameter_inches": math.nan}
+    assert [batch.columns[name][0] for name in VELOCITY_COLUMNS + PRESSURE_COLUMNS] == _scalar_chain(row, table4_f2=2.1)
+    assert batch.reasons.tolist() == ["", "table4_f2 must be positive"]
+    frame = batch.to_frame()
+    assert frame["failure_reason"].tolist() == ["", "table4_f2 must be positive"]
+    assert math.isnan(frame["historical_crusher_pressure"][1])
+
+
+def test_missing_input_column_is_rejected():
+    with pytest.raises(ValueError, match="missing column powder_designation"):
+        run_davis_batch({"case_length_inches": [2.0]})
+
+
+def _linear_bracket(value, grid, name):
+    if value < grid[0] or value > grid[-1]:
+        raise ValueError(f"{name} is outside Davis Table 4")
+    for index, grid_value in enumerate(grid):
+        if abs(value - grid_value) < 1e-12:
+            return index, index, 0.0
+        if value < grid_value:
+            return index - 1, index, (value - grid[index - 1]) / (grid_value - grid[index - 1])
+    return len(grid) - 1, len(grid) - 1, 0.0
+
+
+def _table4_probe_values(grid, rng):
+    nudged = [value + offset for value in grid for offset in (-5e-13, 0.0, 5e-13, 1e-9)]
+    return [*nudged, *rng.uniform(grid[0] - 0.05, grid[-1] + 0.05, 400).tolist()]
+
+
+def test_bisection_bracket_matches_the_linear_scan_it_replaced():
+    rng = np.random.default_rng(4)
+    table = davis.load_table4()
+    for grid, name in ((table.mass_ratios, "mass_ratio"), (table.expansion_ratios, "expansion_ratio")):
+        for value in _table4_probe_values(grid, rng):
+            try:
+                expected = _linear_bracket(value, grid, name)
+            except ValueError as exc:
+                with pytest.raises(ValueError, match=str(exc)):
+                    davis._bracket(value, grid, name)
+            else:
+                assert davis._bracket(value, grid, name) == expected
+
+
+def test_vectorized_table4_lookup_is_identical_to_scalar_lookup():
+    rng = np.random.default_rng(84)
+    table = davis.load_table4()
+    mass_ratios = np.array(_table4_probe_values(table.mass_ratios, rng))
+    expansion_ratios = np.array(_table4_probe_values(table.expansion_ratios, rng))
+    a_values, r_values = (grid.ravel() for grid in np.meshgrid(mass_ratios, expansion_ratios))
+    result = lookup_table4_f2_batch(a_values, r_values)
+    for position, (a_value, r_value) in enumerate(zip(a_values.tolist(), r_values.tolist())):
+        try:
+            expected = davis.lookup_table4_f2(a_value, r_value)
+        except ValueError as exc:
+            assert [message for message, mask in result.errors.items() if mask[position]] == [str(exc)]
+            assert math.isnan(result.values[position])
+        else:
+            assert result.values[position] == expected
+    assert not result.invalid.all()
+    assert compiled_table4() is compiled_table4()
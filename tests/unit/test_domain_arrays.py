@@ -0,0 +1,97 @@
+import itertools
+import random
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from modern_powley.modernized import (
+    DIAGNOSTIC_STATUSES,
+    MEMBERSHIP_STATUSES,
+    BoundKind,
+    DomainBoundsTable,
+    DomainDiagnosticStatus,
+    DomainMembershipStatus,
+    DomainQueryKind,
+    DomainQueryValue,
+    QueryInterval,
+    Quantity,
+    QuantityArray,
+    SourceScalarDomainValue,
+    Unit,
+    diagnose_observation_applicability,
+    test_domain_membership as domain_membership,
+)
+from tests.unit.test_m03_domain_diagnostics import query
+from tests.unit.test_m03_domain_index import corpus
+
+GRID = np.arange(5.0, 35.5, 2.5)
+
+
+def test_status_tables_cover_every_enum_member_in_order():
+    assert MEMBERSHIP_STATUSES == tuple(DomainMembershipStatus)
+    assert DIAGNOSTIC_STATUSES == tuple(DomainDiagnosticStatus)
+
+
+@pytest.mark.parametrize("unit", [Unit.DEGREE_CELSIUS, Unit.KELVIN, Unit.MILLIMETRE])
+def test_point_grid_codes_equal_scalar_membership_for_every_domain(unit):
+    domains = [item.applicability_domain for item in corpus(150)]
+    table = DomainBoundsTable(domains)
+    points = QuantityArray(GRID + (273.15 if unit is Unit.KELVIN else 0), unit)
+    seen = set()
+    for categorical, scalar in itertools.product(({}, {"apparatus": "VESSEL-A"}, {"apparatus": "vessel-A"}), ({}, {"source_index": SourceScalarDomainValue(3, "index-unit", "index-convention")})):
+        result = table.membership_codes(numeric_values={"temperature": points}, categorical_values=categorical, source_scalar_values=scalar)
+        assert result.codes.shape == (len(domains), len(GRID))
+        for position, domain in enumerate(domains):
+            for index, point in enumerate(points.to_quantities()):
+                expected = domain_membership(domain, numeric_values={"temperature": point}, categorical_values=categorical, source_scalar_values=scalar).status
+                assert result.status(position, index) is expected
+                seen.add(expected)
+    assert DomainMembershipStatus.INDETERMINATE_MISSING_INPUT in seen
+    if unit is Unit.MILLIMETRE:
+        assert DomainMembershipStatus.INCOMPATIBLE_DIMENSION in seen
+    else:
+        assert {DomainMembershipStatus.WITHIN_DECLARED_DOMAIN, DomainMembershipStatus.OUTSIDE_DECLARED_DOMAIN} <= seen
+
+
+def test_boundary_outcomes_respect_inclusive_and_exclusive_endpoints():
+    domain = next(item.applicability_domain for item in corpus(150) if item.applicability_domain.numeric_constraints and not item.applicability_domain.categorical_constraints and not item.applicability_domain.source_scalar_constraints)
+    constraint = domain.numeric_constraints[0]
+    result = DomainBoundsTable([domain]).membership_codes(numeric_values={"temperature": QuantityArray(GRID, Unit.DEGREE_CELSIUS)}, categorical_values={})
+    si = GRID + 273.15
+    if constraint.lower.value is not None:
+        bound = constraint.lower.value.quantity.si_value
+        expected = (si < bound) | ((si == bound) & (constraint.lower.kind is BoundKind.EXCLUSIVE))
+        assert np.array_equal(result.below_lower["temperature"][0], expected)
+    if constraint.upper.value is not None:
+        bound = constraint.upper.value.quantity.si_value
+        expected = (si > bound) | ((si == bound) & (constraint.upper.kind is BoundKind.EXCLUSIVE))
+        assert np.array_equal(result.above_upper["temperature"][0], expected)
+
+
+@pytest.mark.parametrize("definition", ["synthetic test temperature", "other synthetic temperature"])
+def test_interval_codes_equal_per_constraint_diagnostics(definition):
+    observations = corpus(60)
+    table = DomainBoundsTable(item.applicability_domain for item in observations)
+    pairs = [(low, high) for low, high in itertools.combinations_with_replacement(GRID[::2], 2)]
+    for lower_kind, upper_kind in itertools.product((BoundKind.INCLUSIVE, BoundKind.EXCLUSIVE), repeat=2):
+        usable = [(low, high) for low, high in pairs if low < high or lower_kind is upper_kind is BoundKind.INCLUSIVE]
+        lower = QuantityArray(np.array([low for low, _ in usable]), Unit.DEGREE_CELSIUS)
+        upper = QuantityArray(np.array([high for _, high in usable]), Unit.DEGREE_CELSIUS)
+        codes = table.interval_codes("temperature", lower, lower_kind, upper, upper_kind, definition=definition)
+        for index, (low, high) in enumerate(usable):
+            value = DomainQueryValue("temperature", definition, DomainQueryKind.NUMERIC_INTERVAL, numeric_interval=QueryInterval(Quantity(low, Unit.DEGREE_CELSIUS), lower_kind, Quantity(high, Unit.DEGREE_CELSIUS), upper_kind))
+            for position, observation in enumerate(observations):
+                result = diagnose_observation_applicability(observation, replace(query(value), observation_id=observation.record_id), record_id="SYNTHETIC-M03-ARRAY")
+                expected = next(item.status for item in result.diagnostics if item.constraint_id in {"temperature", "applicability_domain"})
+                assert DIAGNOSTIC_STATUSES[codes[position, index]] is expected
+
+
+def test_invalid_query_arrays_are_rejected():
+    table = DomainBoundsTable(item.applicability_domain for item in corpus(5))
+    with pytest.raises(ValueError, match="one length"):
+        table.membership_codes(numeric_values={"a": QuantityArray([1.0], Unit.KELVIN), "b": QuantityArray([1.0, 2.0], Unit.KELVIN)}, categorical_values={})
+    with pytest.raises(ValueError, match="ordered"):
+        table.interval_codes("temperature", QuantityArray([2.0], Unit.KELVIN), BoundKind.INCLUSIVE, QuantityArray([1.0], Unit.KELVIN), BoundKind.INCLUSIVE)
+    with pytest.raises(ValueError, match="zero-width"):
+        table.interval_codes("temperature", Quantity(1.0, Unit.KELVIN), BoundKind.EXCLUSIVE, QuantityArray([1.0], Unit.KELVIN), BoundKind.INCLUSIVE)
@@ -0,0 +1,78 @@
+import io
+import json
+import timeit
+from dataclasses import replace
+
+import pytest
+
+import modern_powley.modernized.empirical_load_serialization as serialization
+from modern_powley.modernized.empirical_load_serialization import EmpiricalDecodingScope, empirical_load_record_from_dict, empirical_load_record_to_dict
+from modern_powley.modernized.jsonl import iter_jsonl_records, write_jsonl_records
+from tests.unit.test_empirical_load_evidence_records import all_records, shot_record
+
+def shot_corpus(size):
+    base = shot_record()
+    return [replace(base, envelope=replace(base.envelope, record_id=f"SYN-ELE-SHOT-{index}"), acquisition_sequence=index + 1) for index in range(size)]
+
+
+def test_interned_decoders_return_equal_records_for_every_family():
+    for record in all_records() * 2:
+        assert empirical_load_record_from_dict(empirical_load_record_to_dict(record)) == record
+    records = shot_corpus(50)
+    payloads = [json.loads(json.dumps(empirical_load_record_to_dict(record))) for record in records]
+    separate = [empirical_load_record_from_dict(item) for item in payloads]
+    assert separate == records
+    assert separate[0].load_configuration_reference is not separate[1].load_configuration_reference
+    with EmpiricalDecodingScope() as scope:
+        shared = [empirical_load_record_from_dict(item) for item in payloads]
+    assert shared == records
+    assert shared[0].load_configuration_reference is shared[1].load_configuration_reference
+    assert not serialization._INTERN_TABLES.get() and scope._tables
+
+
+def test_streams_share_one_scope_and_release_it_between_lines():
+    stream = io.StringIO()
+    write_jsonl_records(stream, shot_corpus(3))
+    lines = iter_jsonl_records(io.StringIO(stream.getvalue()))
+    first = next(lines).record
+    assert serialization._INTERN_TABLES.get() is None
+    rest = [line.record for line in lines]
+    assert all(item.load_configuration_reference is first.load_configuration_reference for item in rest)
+
+
+@pytest.mark.parametrize(
+    ("path", "bad", "error", "message"),
+    [
+        (("load_configuration_reference", "version"), True, TypeError, "reference version must be an integer"),
+        (("load_configuration_reference", "role"), "not-a-role", ValueError, "not-a-role"),
+        (("acquisition_timestamp", "extra"), None, ValueError, "malformed identity qualifier fields"),
+        (("exclusion", "reason", "value"), 1, TypeError, "identity value must be a string"),
+        (("underlying_test_reference", "reference", "record_id"), "", ValueError, "record_id"),
+    ],
+)
+def test_primed_cache_keeps_strict_errors(path, bad, error, message):
+    data = empirical_load_record_to_dict(shot_record())
+    empirical_load_record_from_dict(data)
+    target = data["payload"]
+    for key in path[:-1]:
+        target = target[key]
+    target[path[-1]] = bad
+    with pytest.raises(error, match=message):
+        empirical_load_record_from_dict(data)
+
+
+@pytest.mark.benchmark
+def test_benchmark_scoped_interning_against_per_field_walk_on_shot_corpus():
+    corpus = [empirical_load_record_to_dict(record) for record in shot_corpus(2000)]
+
+    def decode_all():
+        with EmpiricalDecodingScope():
+            return [empirical_load_record_from_dict(item) for item in corpus]
+
+    interned = min(timeit.repeat(decode_all, number=1, repeat=3))
+    expected = decode_all()
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(serialization, "_cache_key", lambda value: None)
+        walked = min(timeit.repeat(decode_all, number=1, repeat=3))
+    assert decode_all() == expected
+    print(f"scoped interning {interned:.3f}s, per-field walk {walked:.3f}s")
@@ -0,0 +1,160 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modern_powley.later import emulator
+from modern_powley.later.emulator import POWDER_BANDS
+from modern_powley.later.emulator_batch import (
+    LOAD_RECORD_DTYPE,
+    cup_to_claimed_psi_batch,
+    emulator_chain_batch,
+    load_from_net_capacity_batch,
+    load_from_net_capacity_into,
+    net_capacity_from_gross_batch,
+    powder_band_index_batch,
+    pressure_cup_batch,
+    sectional_density_batch,
+    total_expansion_ratio_from_geometry_batch,
+    velocity_fps_batch,
+    velocity_for_target_cup_batch,
+)
+
+
+def _scalar_chain(gross, case, bullet_length, cartridge, barrel, bullet, diameter):
+    depth = emulator.seating_depth_inches(case, bullet_length, cartridge)
+    net = emulator.net_capacity_from_gross(gross, depth, diameter)
+    travel = emulator.bullet_travel_inches(barrel, case, depth)
+    ratio = emulator.total_expansion_ratio_from_geometry(net, diameter, travel)
+    load = emulator.load_from_net_capacity(net, bullet, diameter)
+    velocity = emulator.velocity_fps(load.charge_weight_grains, bullet, ratio)
+    density = load.charge_weight_grains / net
+    cup = emulator.pressure_cup(velocity, density, ratio, load.mass_ratio)
+    return (depth, net, travel, ratio, load.charge_weight_grains, load.mass_ratio, load.powder_index, POWDER_BANDS.index(load.powder_band), velocity, density, cup, emulator.cup_to_claimed_psi(cup))
+
+
+def _inputs(size):
+    rng = np.random.default_rng(20240228)
+    return (
+        rng.uniform(15.0, 110.0, size),
+        rng.uniform(1.4, 2.9, size),
+        rng.uniform(0.6, 1.6, size),
+        rng.uniform(2.0, 3.7, size),
+        rng.uniform(16.0, 30.0, size),
+        rng.uniform(40.0, 250.0, size),
+        rng.uniform(0.17, 0.46, size),
+    )
+
+
+def test_batch_chain_is_bit_identical_to_scalar_chain_and_reports_first_scalar_error():
+    inputs = _inputs(4000)
+    batch = emulator_chain_batch(*inputs)
+    columns = ("seating_depth_inches", "net_capacity_water_grains", "travel_inches", "total_expansion_ratio", "charge_weight_grains", "mass_ratio", "powder_index", "band_index", "velocity_fps", "loading_density", "pressure_cup", "claimed_psi")
+    failures = 0
+    for row, values in enumerate(zip(*(column.tolist() for column in inputs))):
+        try:
+            expected = _scalar_chain(*values)
+        except ValueError as exc:
+            failures += 1
+            assert batch.invalid[row]
+            assert [message for message, mask in batch.errors.items() if mask[row]] == [str(exc)]
+            continue
+        assert not batch.invalid[row]
+        for name, value in zip(columns, expected, strict=True):
+            assert getattr(batch, name)[row] == value, name
+    assert 0 < failures < len(inputs[0])
+    assert int(batch.invalid.sum()) == failures
+
+
+@pytest.mark.parametrize(
+    ("function", "scalar", "columns"),
+    [
+        (sectional_density_batch, emulator.sectional_density, ([150.0, -1.0, 55.0], [0.308, 0.308, math.nan])),
+        (net_capacity_from_gross_batch, emulator.net_capacity_from_gross, ([51.5, 5.0, 51.5], [0.5, 0.5, -0.1], [0.308, 0.308, 0.308])),
+        (total_expansion_ratio_from_geometry_batch, emulator.total_expansion_ratio_from_geometry, ([50.0, 0.0, 50.0], [0.308, 0.308, 0.308], [21.0, 21.0, math.inf])),
+        (velocity_fps_batch, emulator.velocity_fps, ([44.3, 44.3, 44.3], [150.0, 150.0, 150.0], [9.0, 1.0, 0.5])),
+        (pressure_cup_batch, emulator.pressure_cup, ([2730.0, 2730.0, 2730.0], [0.86, 0.86, 0.0], [9.0, 1.0, 9.0], [0.295, 0.295, 0.295])),
+        (cup_to_claimed_psi_batch, emulator.cup_to_claimed_psi, ([44664.541138433924, -5.0, 52000.0],)),
+    ],
+)
+def test_each_batch_function_matches_scalar_values_and_messages(function, scalar, columns):
+    result = function(*columns)
+    for row, values in enumerate(zip(*columns)):
+        try:
+            expected = scalar(*values)
+        except ValueError as exc:
+            assert math.isnan(result.values[row])
+            assert [message for message, mask in result.errors.items() if mask[row]] == [str(exc)]
+        else:
+            assert result.values[row] == expected
+            assert not result.invalid[row]
+
+
+def test_batch_load_keeps_non_recomputed_index_and_accepts_pandas_columns():
+    frame = pd.DataFrame({"net": [20.0, 50.0, -3.0], "bullet": [100.0, 150.0, 150.0], "diameter": [0.308, 0.308, 0.308]})
+    batch = load_from_net_capacity_batch(frame["net"], frame["bullet"], frame["diameter"])
+    scalar = emulator.load_from_net_capacity(20, 100, 0.308)
+    assert batch.charge_weight_grains[0] == scalar.charge_weight_grains == 16
+    assert batch.mass_ratio[0] == scalar.mass_ratio
+    assert batch.powder_index[0] == scalar.powder_index > 145
+    assert POWDER_BANDS[batch.band_index[0]] == scalar.powder_band
+    assert batch.invalid.tolist() == [False, False, True]
+    assert batch.errors["net_capacity_water_grains must be finite and greater than zero"].tolist() == [False, False, True]
+
+
+def test_fused_load_fills_structured_array_bit_identically_to_scalar_load():
+    rng = np.random.default_rng(86)
+    net = np.concatenate([rng.uniform(5.0, 120.0, 5000), [-1.0, np.nan, 40.0]])
+    bullet = np.concatenate([rng.uniform(30.0, 300.0, 5000), [150.0, 150.0, 0.0]])
+    diameter = np.concatenate([rng.uniform(0.17, 0.5, 5000), [0.308, 0.308, 0.308]])
+    out = np.empty(net.shape, dtype=LOAD_RECORD_DTYPE)
+    errors = load_from_net_capacity_into(out, net, bullet, diameter)
+    batch = load_from_net_capacity_batch(net, bullet, diameter)
+    for name in LOAD_RECORD_DTYPE.names:
+        np.testing.assert_array_equal(out[name], getattr(batch, name))
+    assert errors.keys() == batch.errors.keys()
+    for row in range(5000):
+        scalar = emulator.load_from_net_capacity(net[row], bullet[row], diameter[row])
+        assert out[row].tolist() == (scalar.charge_weight_grains, scalar.mass_ratio, scalar.powder_index, POWDER_BANDS.index(scalar.powder_band))
+    assert out["band_index"][-3:].tolist() == [-1, -1, -1]
+    with pytest.raises(OverflowError):
+        emulator.load_from_net_capacity(50.0, 150.0, 1e200)
+    with pytest.raises(ZeroDivisionError):
+        emulator.load_from_net_capacity(50.0, 150.0, 1e-200)
+    extreme = np.empty(3, dtype=LOAD_RECORD_DTYPE)
+    errors = load_from_net_capacity_into(extreme, 50.0, 150.0, [1e200, 1e-200, 0.308])
+    assert {message: mask.tolist() for message, mask in errors.items()} == {
+        "numerical result out of range": [True, False, False],
+        "float division by zero": [False, True, False],
+    }
+    assert extreme["band_index"].tolist()[:2] == [-1, -1] and np.isnan(extreme["powder_index"][:2]).all()
+    assert extreme["powder_index"][2] == emulator.load_from_net_capacity(50.0, 150.0, 0.308).powder_index
+    with pytest.raises(ValueError, match="shape"):
+        load_from_net_capacity_into(np.empty(2, dtype=LOAD_RECORD_DTYPE), net, bullet, diameter)
+
+
+@pytest.mark.parametrize("transition", [81.0, 91.0, 110.0, 125.0, 145.0, 165.0, 180.0])
+def test_batch_band_index_matches_scalar_selection_at_boundaries(transition):
+    values = [math.nextafter(transition, -math.inf), transition, math.nextafter(transition, math.inf)]
+    result = powder_band_index_batch(values)
+    assert [POWDER_BANDS[index] for index in result.values] == [emulator.select_powder_band(value) for value in values]
+    assert powder_band_index_batch([0.0]).values.tolist() == [-1]
+
+
+def test_batch_overflow_is_reported_per_row_where_scalar_raises():
+    with pytest.raises(OverflowError):
+        emulator.cup_to_claimed_psi(1e200)
+    result = cup_to_claimed_psi_batch([1e200, 44664.541138433924])
+    assert result.invalid.tolist() == [True, False]
+    assert result.values[1] == emulator.cup_to_claimed_psi(44664.541138433924)
+
+
+def test_batch_target_velocity_reports_zero_miller_f2_where_scalar_divides_by_zero():
+    with pytest.raises(ZeroDivisionError) as exc:
+        emulator.velocity_for_target_cup(44000.0, 9.0, 9.3)
+    result = velocity_for_target_cup_batch([44000.0, 44000.0], [9.0, 9.0], [9.3, 0.295])
+    assert result.invalid.tolist() == [True, False]
+    assert [message for message, mask in result.errors.items() if mask[0]] == [str(exc.value)]
+    assert math.isnan(result.values[0])
+    assert result.values[1] == emulator.velocity_for_target_cup(44000.0, 9.0, 0.295)
@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+import pytest
+
+from modern_powley.later import davis, emulator, inverse
+from modern_powley.later.emulator_batch import velocity_for_target_cup_batch
+from modern_powley.later.inverse import (
+    charge_for_target_cup_batch,
+    charge_for_target_velocity_batch,
+    loading_density_for_target_pressure_batch,
+)
+
+
+def test_batch_velocity_for_target_cup_is_identical_to_scalar():
+    cups = np.linspace(30000.0, 56000.0, 27)
+    ratios = np.linspace(6.0, 11.0, 27)
+    result = velocity_for_target_cup_batch(cups, ratios, 0.295)
+    assert result.values.tolist() == [emulator.velocity_for_target_cup(c, r, 0.295) for c, r in zip(cups.tolist(), ratios.tolist())]
+    rejected = velocity_for_target_cup_batch([44000.0, 44000.0], [0.5, 9.0], [0.3, 10.0])
+    assert rejected.invalid.tolist() == [True, True]
+    with pytest.raises(ValueError, match="math domain error"):
+        emulator.velocity_for_target_cup(44000.0, 9.0, 10.0)
+    assert rejected.errors["math domain error"].tolist() == [False, True]
+
+
+def test_closed_form_charge_reproduces_target_velocity_and_rejects_the_asymptote():
+    rng = np.random.default_rng(6)
+    targets = rng.uniform(1800.0, 3300.0, 2000)
+    bullets = rng.uniform(80.0, 220.0, 2000)
+    ratios = rng.uniform(6.0, 12.0, 2000)
+    result = charge_for_target_velocity_batch(targets, bullets, ratios)
+    assert result.converged.all() and not result.iterations.any()
+    for charge, target, bullet, ratio in zip(result.values.tolist(), targets.tolist(), bullets.tolist(), ratios.tolist()):
+        assert emulator.velocity_fps(charge, bullet, ratio) == pytest.approx(target, rel=1e-12)
+    asymptote = 8000.0 * math.sqrt(3.0 * (1.0 - 9.0**-0.25))
+    unattainable = charge_for_target_velocity_batch([asymptote * 1.01], 150.0, 9.0)
+    assert unattainable.reasons.tolist() == ["target_velocity_fps is unattainable at this expansion ratio"]
+    assert not unattainable.converged[0]
+
+
+def test_bisection_charge_reaches_target_cup_per_element():
+    rng = np.random.default_rng(61)
+    nets = rng.uniform(40.0, 80.0, 500)
+    bullets = rng.uniform(110.0, 200.0, 500)
+    ratios = rng.uniform(6.0, 11.0, 500)
+    targets = rng.uniform(30000.0, 50000.0, 500)
+    result = charge_for_target_cup_batch(targets, bullets, ratios, nets)
+    assert result.converged.any()
+    for position in np.flatnonzero(result.converged):
+        charge = result.values[position]
+        velocity = emulator.velocity_fps(charge, bullets[position], ratios[position])
+        cup = emulator.pressure_cup(velocity, charge / nets[position], ratios[position], charge / bullets[position])
+        assert cup == pytest.approx(targets[position], rel=1e-9)
+        assert 0 < result.iterations[position] <= 200
+    assert set(result.reasons[~result.converged]) <= {"target_cup is outside the CUP range of the charge bracket"}
+
+
+def test_charge_search_reports_unbracketed_and_unconverged_targets():
+    result = charge_for_target_cup_batch([1e7, 40000.0, 40000.0], 150.0, 9.0, 55.0, max_iterations=3)
+    assert result.reasons.tolist() == [
+        "target_cup is outside the CUP range of the charge bracket",
+        "charge search did not converge within max_iterations",
+        "charge search did not converge within max_iterations",
+    ]
+    assert result.iterations.tolist() == [0, 3, 3]
+    with pytest.raises(ValueError, match="xtol"):
+        charge_for_target_cup_batch(40000.0, 150.0, 9.0, 55.0, xtol=0.0)
+
+
+def test_charge_search_fails_rows_whose_forward_cup_is_not_finite(monkeypatch):
+    expected = charge_for_target_cup_batch(40000.0, 150.0, 9.0, 55.0).values
+    forward = inverse._cup_for_charge
+    calls = []
+
+    def nan_inside_bracket(charge, bullet, ratio, net):
+        values, errors = forward(charge, bullet, ratio, net)
+        calls.append(charge)
+        if len(calls) > 2:
+            values = np.where(np.arange(values.size) == 0, np.nan, values)
+        return values, errors
+
+    monkeypatch.setattr(inverse, "_cup_for_charge", nan_inside_bracket)
+    result = charge_for_target_cup_batch([40000.0, 40000.0], 150.0, 9.0, 55.0)
+    assert result.reasons.tolist() == [inverse.NONFINITE_CUP_MESSAGE, ""]
+    assert result.converged.tolist() == [False, True]
+    assert math.isnan(result.values[0]) and result.iterations[0] == 0
+    assert result.values[1] == expected
+
+
+def test_loading_density_inverse_round_trips_davis_scaling_rule():
+    targets = np.array([38000.0, 45000.0, 52000.0])
+    result = loading_density_for_target_pressure_batch(targets, 44664.5, 0.86)
+    for density, target in zip(result.values.tolist(), targets.tolist()):
+        assert davis.loading_density_pressure_scale(44664.5, 0.86, density) == pytest.approx(target, rel=1e-14)
+    rejected = loading_density_for_target_pressure_batch([40000.0, math.inf], [-1.0, 44000.0], 0.86)
+    assert rejected.reasons.tolist() == ["initial_historical_crusher_pressure must be positive", "target_historical_crusher_pressure must be finite"]
@@ -0,0 +1,116 @@
+import io
+import json
+
+import pytest
+
+from modern_powley.modernized.jsonl import (
+    JsonlLine,
+    ValidatedRecordCache,
+    canonical_record_digest,
+    iter_jsonl_records,
+    tagged_record_from_dict,
+    tagged_record_to_dict,
+    write_jsonl_records,
+)
+from modern_powley.modernized.records import CartridgeIdentity
+from tests.provenance.test_m01_provenance_and_serialization import provenance
+from tests.unit.test_empirical_load_evidence_records import all_records
+from tests.unit.test_m02_identity_properties_and_missing import bulk_observation, synthetic_identity
+from tests.unit.test_m05_charge_regions import record
+
+
+def mixed_records():
+    return [
+        CartridgeIdentity("CARTRIDGE-308", ".308 Winchester", provenance(), ("7.62x51 family context only",)),
+        synthetic_identity(),
+        bulk_observation(),
+        record(),
+        *all_records(),
+    ]
+
+
+def test_archive_round_trips_every_milestone_in_order():
+    records = mixed_records()
+    buffer = io.StringIO()
+    assert write_jsonl_records(buffer, records) == len(records)
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == len(records) and all("\n" not in line for line in lines)
+    decoded = list(iter_jsonl_records(io.StringIO(buffer.getvalue())))
+    assert all(item.ok for item in decoded)
+    assert [item.record for item in decoded] == records
+    assert [item.line_number for item in decoded] == list(range(1, len(records) + 1))
+    assert [item.record for item in iter_jsonl_records(io.BytesIO(buffer.getvalue().encode()))] == records
+
+
+def test_bad_lines_are_reported_with_line_numbers_and_reading_continues():
+    good = json.dumps(tagged_record_to_dict(record()))
+    duplicated = good[:-1] + ', "schema": "modern_powley.m05.v1"}'
+    text = "\n".join([good, "", "{not json", '{"schema": "modern_powley.m99.v1"}', good.replace("charge_region_record", "charge_region"), '{"value": NaN, "schema": "modern_powley.m01.v1"}', duplicated, "[]", good]) + "\n"
+    results = list(iter_jsonl_records(io.StringIO(text)))
+    assert [(item.line_number, item.ok) for item in results] == [(1, True), (3, False), (4, False), (5, False), (6, False), (7, False), (8, False), (9, True)]
+    errors = {item.line_number: item.error for item in results if not item.ok}
+    assert errors[3] == "invalid JSON"
+    assert "unsupported schema" in errors[4]
+    assert "record_type" in errors[5]
+    assert "non-finite" in errors[6]
+    assert "duplicate JSON object key" in errors[7]
+    assert errors[8] == "tagged record must be an object"
+
+
+def test_reading_is_lazy():
+    def lines():
+        yield json.dumps(tagged_record_to_dict(record())) + "\n"
+        raise AssertionError("reader consumed past the first line")
+
+    assert next(iter_jsonl_records(lines())).record == record()
+
+
+def test_dispatch_rejects_unknown_records_and_inconsistent_results():
+    with pytest.raises(TypeError, match="unsupported record type"):
+        tagged_record_to_dict(object())
+    with pytest.raises(ValueError, match="missing schema"):
+        tagged_record_from_dict({"record_type": "projectile"})
+    with pytest.raises(ValueError, match="unsupported schema"):
+        tagged_record_from_dict({"schema": ["modern_powley.m01.v1"]})
+    with pytest.raises(ValueError, match="exactly one"):
+        JsonlLine(1)
+    with pytest.raises(ValueError, match="positive"):
+        JsonlLine(0, error="bad")
+
+
+def test_validated_cache_reuses_records_and_falls_back_to_full_validation(monkeypatch):
+    import modern_powley.modernized.jsonl as jsonl
+
+    lines = [json.dumps(tagged_record_to_dict(item)) for item in mixed_records()]
+    calls = []
+    strict = jsonl.tagged_record_from_dict
+    monkeypatch.setattr(jsonl, "tagged_record_from_dict", lambda data: calls.append(data) or strict(data))
+    cache = ValidatedRecordCache()
+    first = [item.record for item in iter_jsonl_records(io.StringIO("\n".join(lines)), cache=cache)]
+    assert len(calls) == len(lines) and cache.misses == len(lines)
+    second = [item.record for item in iter_jsonl_records(io.StringIO("\r\n".join(lines) + "\r\n"), cache=cache)]
+    assert second == first and all(a is b for a, b in zip(first, second))
+    assert len(calls) == len(lines) and cache.hits == len(lines)
+
+    reordered = json.dumps(dict(reversed(json.loads(lines[0]).items())), indent=2).replace("\n", "")
+    assert cache.loads(reordered) is first[0] and cache.misses == len(lines)
+    broken = lines[0].replace("CARTRIDGE-308", "")
+    assert not next(iter_jsonl_records(io.StringIO(broken), cache=cache)).ok
+    list(iter_jsonl_records(io.StringIO("\n".join(lines))))
+    assert len(calls) == 2 * len(lines) + 1
+
+
+def test_canonical_digest_ignores_layout_and_memory_is_bounded(monkeypatch):
+    import modern_powley.modernized.jsonl as jsonl
+
+    assert canonical_record_digest(json.loads('{"a": 1, "b": "\\u00e9"}')) == canonical_record_digest({"b": "\u00e9", "a": 1})
+    assert len({canonical_record_digest(json.loads(text)) for text in ('{"a":1}', '{"a":1.0}', '{"a":true}', '{"a":-0.0}', '{"a":0.0}')}) == 5
+    digest = canonical_record_digest({"a": 1})
+    monkeypatch.setattr(jsonl, "RECORD_VALIDATOR_VERSION", 2)
+    assert canonical_record_digest({"a": 1}) != digest
+    cache = ValidatedRecordCache(maxsize=2)
+    for item in mixed_records()[:3]:
+        cache.loads(json.dumps(tagged_record_to_dict(item)))
+    assert len(cache) == 2
+    with pytest.raises(ValueError, match="maxsize"):
+        ValidatedRecordCache(maxsize=0)
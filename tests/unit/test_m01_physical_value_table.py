@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from modern_powley.modernized import PhysicalValueTable
+from modern_powley.modernized.provenance import EvidenceClass, ModelMaturity, Provenance, ValueOrigin, derived_provenance
+from modern_powley.modernized.records import PhysicalValue, UncertaintyTreatment
+from modern_powley.modernized.uncertainty import Uncertainty, UncertaintyKind
+from modern_powley.modernized.units import Quantity, Unit
+
+
+def corpus(size=1000):
+    measured = Provenance(EvidenceClass.USER_MEASUREMENT, ValueOrigin.MEASURED, "MEAS-TABLE-001", ModelMaturity.RETAINED_CANDIDATE)
+    derived = derived_provenance("M01-GEO-CYLINDER-VOLUME", ("PV-A", "PV-B"))
+    resolution = Uncertainty(UncertaintyKind.INSTRUMENT_RESOLUTION, magnitude=Quantity(0.01, Unit.MILLIMETRE))
+    values = []
+    for index in range(size):
+        if index % 3 == 0:
+            values.append(PhysicalValue(f"PV-{index}", Quantity(index * 0.5, Unit.INCH), measured, resolution, notes="caliper"))
+        elif index % 3 == 1:
+            values.append(PhysicalValue(f"PV-{index}", Quantity(-0.0 if index == 1 else index, Unit.MILLIMETRE), measured, Uncertainty.unknown()))
+        else:
+            values.append(PhysicalValue(f"PV-{index}", Quantity(index, Unit.CENTIMETRE), derived, Uncertainty.unknown(), UncertaintyTreatment.UNRESOLVED))
+    return values
+
+
+def test_table_round_trips_every_value_losslessly_and_interns_metadata():
+    values = corpus()
+    table = PhysicalValueTable.from_values(values)
+    assert len(table) == len(values)
+    assert table.to_values() == tuple(values)
+    assert [value.to_dict() for value in table] == [value.to_dict() for value in values]
+    assert np.signbit(table[1].quantity.value)
+    assert len(table.provenances) == 2 and len(table.uncertainties) == 2
+    assert len(table.units) == 3 and table.notes == ("caliper", "")
+    assert table[0].provenance is table[3].provenance
+
+
+def test_table_converts_mixed_units_in_bulk():
+    values = corpus(30)
+    table = PhysicalValueTable.from_values(values)
+    converted = table.quantities(Unit.METRE)
+    assert converted.values.tolist() == [value.quantity.to(Unit.METRE).value for value in values]
+    with pytest.raises(ValueError, match="cannot convert"):
+        table.quantities(Unit.GRAIN)
+
+
+def test_table_validates_codes_values_and_uncertainty_dimensions():
+    table = PhysicalValueTable.from_values(corpus(6))
+    fields = {name: getattr(table, name) for name in PhysicalValueTable.__dataclass_fields__}
+    with pytest.raises(ValueError, match="provenance codes must reference"):
+        PhysicalValueTable(**(fields | {"provenance_codes": np.full(6, 7)}))
+    with pytest.raises(ValueError, match="one entry per record_id"):
+        PhysicalValueTable(**(fields | {"values": np.zeros(5)}))
+    with pytest.raises(ValueError, match="finite"):
+        PhysicalValueTable(**(fields | {"values": np.full(6, np.nan)}))
+    with pytest.raises(ValueError, match="uncertainty"):
+        PhysicalValueTable(**(fields | {"units": (Unit.GRAIN, Unit.MILLIMETRE, Unit.CENTIMETRE)}))
+    assert len(PhysicalValueTable.from_values([])) == 0
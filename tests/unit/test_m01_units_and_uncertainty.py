@@ -1,5 +1,6 @@
 import math
 
+import numpy as np
 import pytest
 
 from modern_powley.modernized.provenance import EvidenceClass, ModelMaturity, Provenance, ValueOrigin
@@ -9,9 +10,15 @@ from modern_powley.modernized.units import (
     Dimension,
     GRAIN_TO_KILOGRAM_EXACT,
     INCH_TO_METRE_EXACT,
+    _TO_SI_FACTOR,
+    _UNIT_DIMENSION,
     POUND_TO_KILOGRAM_EXACT,
     Quantity,
+    QuantityArray,
     Unit,
+    convert_many,
+    nonnegative_mask,
+    positive_mask,
 )
 
 
@@ -95,3 +102,72 @@ def test_quantity_serialization_is_strict():
         Quantity.from_dict({"value": "1.0", "unit": "in"})
     with pytest.raises(TypeError, match="real"):
         Quantity.from_dict({"value": True, "unit": "in"})
+
+
+@pytest.mark.parametrize("unit,target", [(Unit.INCH, Unit.MILLIMETRE), (Unit.GRAIN, Unit.GRAM), (Unit.CUBIC_INCH, Unit.CUBIC_CENTIMETRE), (Unit.DEGREE_CELSIUS, Unit.KELVIN), (Unit.KELVIN, Unit.DEGREE_CELSIUS)])
+def test_quantity_array_converts_exactly_like_each_quantity(unit, target):
+    values = np.random.default_rng(12).uniform(-50.0, 400.0, 1000)
+    array = QuantityArray(values, unit)
+    converted = array.to(target)
+    assert converted.unit is target and converted.dimension is array.dimension
+    assert converted.values.tolist() == [Quantity(value, unit).to(target).value for value in values.tolist()]
+    assert array.si_value.tolist() == [Quantity(value, unit).si_value for value in values.tolist()]
+    with pytest.raises(ValueError, match="cannot convert"):
+        array.to(Unit.ONE)
+
+
+def test_quantity_array_is_validated_read_only_and_round_trips():
+    array = QuantityArray([1, 2.5, 0.0], "cm")
+    assert array.unit is Unit.CENTIMETRE and array.values.dtype == np.float64
+    with pytest.raises(ValueError):
+        array.values[0] = 3.0
+    assert QuantityArray.from_dict(array.to_dict()) == array
+    assert array[1] == Quantity(2.5, Unit.CENTIMETRE)
+    assert QuantityArray.from_quantities(array.to_quantities()) == array
+    for values in ([1.0, math.inf], [[1.0]]):
+        with pytest.raises(ValueError):
+            QuantityArray(values, Unit.METRE)
+    with pytest.raises(TypeError):
+        QuantityArray([True, False], Unit.METRE)
+    with pytest.raises(TypeError):
+        QuantityArray.from_dict({"values": [1.0, "2"], "unit": "m"})
+    with pytest.raises(ValueError, match="expected fields"):
+        QuantityArray.from_dict({"values": [1.0], "unit": "m", "extra": 1})
+    with pytest.raises(ValueError, match="share one unit"):
+        QuantityArray.from_quantities([Quantity(1, Unit.METRE), Quantity(1, Unit.INCH)])
+
+
+def test_quantity_array_masks_check_dimension_once():
+    array = QuantityArray([-1.0, 0.0, 2.0], Unit.MILLIMETRE)
+    assert positive_mask(array, Dimension.LENGTH, "diameter").tolist() == [False, False, True]
+    assert nonnegative_mask(array, Dimension.LENGTH, "depth").tolist() == [False, True, True]
+    with pytest.raises(ValueError, match="diameter must have dimension mass"):
+        positive_mask(array, Dimension.MASS, "diameter")
+
+
+def test_precomputed_conversions_match_two_step_si_arithmetic_for_every_pair():
+    values = [0.0, -0.0, 1.0, -40.0, 0.1, 1234.5678, 2.5e-7]
+    for source in Unit:
+        for target in Unit:
+            if _UNIT_DIMENSION[source] is not _UNIT_DIMENSION[target]:
+                with pytest.raises(ValueError, match="cannot convert"):
+                    Quantity(1.0, source).to(target)
+                continue
+            for value in values:
+                si = value + 273.15 if source is Unit.DEGREE_CELSIUS else value * _TO_SI_FACTOR[source]
+                expected = si - 273.15 if target is Unit.DEGREE_CELSIUS else si / _TO_SI_FACTOR[target]
+                converted = Quantity(value, source).to(target.value)
+                assert converted.unit is target
+                assert math.copysign(1.0, converted.value) == math.copysign(1.0, expected) and converted.value == expected
+
+
+def test_convert_many_and_trusted_results_equal_validated_quantities():
+    quantities = [Quantity(1.0, Unit.INCH), Quantity(2.0, Unit.CENTIMETRE), Quantity(3, Unit.MILLIMETRE)]
+    converted = convert_many(quantities, "m")
+    assert converted == tuple(quantity.to(Unit.METRE) for quantity in quantities)
+    assert converted[0] == Quantity(INCH_TO_METRE_EXACT, Unit.METRE)
+    assert convert_many([], Unit.METRE) == ()
+    with pytest.raises(ValueError, match="cannot convert"):
+        convert_many([Quantity(1.0, Unit.GRAIN)], Unit.METRE)
+    with pytest.raises(ValueError, match="finite"):
+        Quantity(1e308, Unit.METRE).to(Unit.MILLIMETRE)
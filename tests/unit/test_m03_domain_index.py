@@ -0,0 +1,159 @@
+import random
+from dataclasses import replace
+
+from modern_powley.modernized import (
+    ApplicabilityDomain,
+    ApplicabilityDomainIndex,
+    ApplicabilitySummary,
+    BoundKind,
+    CategoricalDomainConstraint,
+    DomainBound,
+    DomainMembershipStatus,
+    DomainQueryKind,
+    DomainQueryValue,
+    DomainStatus,
+    MissingState,
+    NumericDomainConstraint,
+    ObservationDomainIndex,
+    QueryInterval,
+    Quantity,
+    SourceScalarDomainBound,
+    SourceScalarDomainConstraint,
+    SourceScalarDomainValue,
+    Unit,
+    diagnose_observation_applicability,
+    test_domain_membership as domain_membership,
+)
+from tests.unit.test_m02_domains_and_conflicts import physical
+from tests.unit.test_m02_identity_properties_and_missing import bulk_observation
+from tests.unit.test_m03_domain_diagnostics import category, query, source
+
+GRID = (10, 15, 20, 25, 30)
+BOUNDED = (BoundKind.INCLUSIVE, BoundKind.EXCLUSIVE)
+
+
+def random_bounds(rng, low, high, kinds):
+    lower = rng.choice((BoundKind.UNBOUNDED, *kinds, *kinds))
+    upper = rng.choice(kinds) if lower is BoundKind.UNBOUNDED else rng.choice((BoundKind.UNBOUNDED, *kinds, *kinds))
+    return (lower, None if lower is BoundKind.UNBOUNDED else low), (upper, None if upper is BoundKind.UNBOUNDED else high)
+
+
+def random_domain(rng, index):
+    if rng.random() < 0.1:
+        return ApplicabilityDomain.unspecified("synthetic corpus domain is unspecified")
+    while True:
+        numeric, categorical, scalar = [], [], []
+        if rng.random() < 0.8:
+            low, high = sorted(rng.sample(GRID, 2))
+            (lower_kind, lower), (upper_kind, upper) = random_bounds(rng, low, high, BOUNDED)
+            unit = rng.choice((Unit.DEGREE_CELSIUS, Unit.KELVIN))
+            offset = 273.15 if unit is Unit.KELVIN else 0
+            numeric.append(NumericDomainConstraint(
+                "temperature", "synthetic test temperature",
+                DomainBound(lower_kind, None if lower is None else physical(f"SYNTHETIC-M03-IDX-{index}-LOW", lower + offset, unit)),
+                DomainBound(upper_kind, None if upper is None else physical(f"SYNTHETIC-M03-IDX-{index}-HIGH", upper + offset, unit)),
+            ))
+        if rng.random() < 0.5:
+            values = tuple(rng.sample(("VESSEL-A", "VESSEL-B", "vessel-a", "VESSEL-C"), rng.randint(1, 2)))
+            categorical.append(CategoricalDomainConstraint("apparatus", "synthetic apparatus identifier", values, rng.random() < 0.5))
+        if rng.random() < 0.4:
+            (lower_kind, lower), (upper_kind, upper) = random_bounds(rng, 1, 3, BOUNDED)
+            convention = rng.choice(("index-convention", "other-convention"))
+            scalar.append(SourceScalarDomainConstraint(
+                "source_index", "synthetic source index", "index-unit", convention,
+                SourceScalarDomainBound(lower_kind, lower), SourceScalarDomainBound(upper_kind, upper),
+            ))
+        if numeric or categorical or scalar:
+            return ApplicabilityDomain(DomainStatus.DECLARED, tuple(numeric), tuple(categorical), "synthetic corpus domain", tuple(scalar))
+
+
+def corpus(size=400, seed=23):
+    rng = random.Random(seed)
+    return [replace(bulk_observation(f"SYNTHETIC-M03-IDX-OBS-{index}"), applicability_domain=random_domain(rng, index)) for index in range(size)]
+
+
+def temperature_query(rng):
+    if rng.random() < 0.3:
+        low, high = sorted(rng.sample(GRID, 2))
+        interval = QueryInterval(Quantity(low, Unit.DEGREE_CELSIUS), rng.choice(BOUNDED), Quantity(high, Unit.DEGREE_CELSIUS), rng.choice(BOUNDED))
+        return DomainQueryValue("temperature", "synthetic test temperature", DomainQueryKind.NUMERIC_INTERVAL, numeric_interval=interval)
+    unit = rng.choice((Unit.DEGREE_CELSIUS, Unit.KELVIN, Unit.MILLIMETRE))
+    value = rng.choice(GRID) + (273.15 if unit is Unit.KELVIN else 0)
+    return DomainQueryValue("temperature", "synthetic test temperature", DomainQueryKind.NUMERIC_POINT, numeric_point=Quantity(value, unit))
+
+
+def random_contexts(count=60, seed=5):
+    rng = random.Random(seed)
+    contexts = []
+    for index in range(count):
+        values = []
+        if rng.random() < 0.9:
+            values.append(temperature_query(rng))
+        if rng.random() < 0.8:
+            values.append(category("apparatus", "synthetic apparatus identifier", rng.choice(("VESSEL-A", "vessel-A", "VESSEL-B", "VESSEL-D"))))
+        if rng.random() < 0.6:
+            values.append(source(rng.choice((1, 2, 3)), convention=rng.choice(("index-convention", "other-convention"))))
+        if rng.random() < 0.1:
+            values.append(DomainQueryValue("source_index", "synthetic source index", DomainQueryKind.EXPLICITLY_UNAVAILABLE, missing_state=MissingState.NOT_MEASURED, explanation="synthetic query value not measured") if not any(item.variable_id == "source_index" for item in values) else category("extra", "synthetic extra query", "X"))
+        property_id = "bulk_density" if rng.random() < 0.8 else "gravimetric_density"
+        contexts.append(replace(query(*values, property_id=property_id), record_id=f"SYNTHETIC-M03-IDX-QUERY-{index}"))
+    return contexts
+
+
+def test_indexed_lookup_matches_full_diagnostic_scan():
+    observations = corpus()
+    index = ObservationDomainIndex(observations)
+    matched = 0
+    for context in random_contexts():
+        expected = []
+        for observation in observations:
+            evaluation = diagnose_observation_applicability(observation, replace(context, observation_id=observation.record_id), record_id=f"{context.record_id}:{observation.record_id}")
+            if evaluation.summary is ApplicabilitySummary.ALL_DECLARED_CONSTRAINTS_SATISFIED:
+                expected.append(evaluation)
+        assert index.diagnose_containing(context) == tuple(expected)
+        assert len(index.candidates(context)) == len(expected)
+        matched += len(expected)
+    assert matched
+
+
+def test_domain_positions_match_literal_membership_scan():
+    domains = [item.applicability_domain for item in corpus()]
+    index = ApplicabilityDomainIndex(domains)
+    rng = random.Random(11)
+    matched = 0
+    for _ in range(80):
+        unit = rng.choice((Unit.DEGREE_CELSIUS, Unit.KELVIN))
+        numeric = {"temperature": Quantity(rng.choice(GRID) + (273.15 if unit is Unit.KELVIN else 0), unit)} if rng.random() < 0.9 else {}
+        categorical = {"apparatus": rng.choice(("VESSEL-A", "vessel-A", "VESSEL-C"))} if rng.random() < 0.8 else {}
+        scalar = {"source_index": SourceScalarDomainValue(rng.choice((1, 2, 3)), "index-unit", "index-convention")} if rng.random() < 0.6 else {}
+        expected = tuple(
+            position for position, domain in enumerate(domains)
+            if domain_membership(domain, numeric_values=numeric, categorical_values=categorical, source_scalar_values=scalar).status is DomainMembershipStatus.WITHIN_DECLARED_DOMAIN
+        )
+        assert index.containing(numeric_values=numeric, categorical_values=categorical, source_scalar_values=scalar) == expected
+        matched += len(expected)
+    assert matched
+    assert len(index) == len(domains)
+
+
+def test_interval_tree_matches_brute_force_and_stays_shallow_for_staggered_ranges():
+    from modern_powley.modernized import domain_index
+
+    rng = random.Random(31)
+    entries = []
+    for position in range(600):
+        low, high = sorted(rng.sample(range(40), 2))
+        entries.append((position, None if rng.random() < 0.1 else (low, rng.randint(0, 1)), None if rng.random() < 0.1 else (high, rng.randint(0, 1))))
+    tree = domain_index._IntervalTree(entries)
+    keys = [(value, tie) for value in range(-1, 42) for tie in (-1, 0, 1, 2)]
+    for _ in range(400):
+        low, high = rng.choice(keys), rng.choice(keys)
+        expected = {position for position, lower, upper in entries if (lower is None or lower < low) and (upper is None or upper > high)}
+        assert tree.containing(low, high) == expected
+    staggered = domain_index._IntervalTree((position, (position, 0), (position + 1, 1)) for position in range(50_000))
+    depth, level = 0, [staggered._root]
+    while level:
+        depth += 1
+        level = [child for node in level for child in (node.left, node.right) if child is not None]
+    assert depth <= 20
+    assert staggered.containing(*domain_index._point_keys(25_000.5)) == {25_000}
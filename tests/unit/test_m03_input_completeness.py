@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import pytest
 
 from modern_powley.modernized import (
@@ -7,12 +9,16 @@ from modern_powley.modernized import (
     InputCandidate,
     InputCandidateKind,
     MissingState,
+    RequirementKind,
+    RequirementSet,
     ModelMaturity,
     Provenance,
     Quantity,
     Unit,
     ValueOrigin,
+    compile_requirement_set,
     evaluate_input_completeness,
+    evaluate_input_completeness_batch,
     production_requirement_sets,
 )
 
@@ -209,3 +215,104 @@ def test_partial_full_branch_and_tail_diameter_inconsistencies_are_literal():
 @pytest.mark.parametrize("name", ["circle_area", "cylinder_volume", "conical_frustum_volume", "barrel_swept_volume", "barrel_volume_ratio", "total_expansion_ratio", "capacity_comparison", "geometric_usable_powder_space", "seated_projectile_displacement"])
 def test_production_requirement_set_ids_are_stable_and_unique(name):
     assert requirement_set(name).record_id.startswith("M03-RS-")
+
+
+def bundle_corpus():
+    shared = (
+        candidate("diameter", 7.62, Unit.MILLIMETRE),
+        candidate("axial_length", 12, Unit.MILLIMETRE),
+        candidate("gross_case_capacity", 3.5, Unit.CUBIC_CENTIMETRE, InputCandidateKind.GROSS_CASE_CAPACITY),
+        candidate("projectile_displacement", 0.5, Unit.CUBIC_CENTIMETRE),
+        candidate("shank_diameter", 7.62, Unit.MILLIMETRE),
+    )
+    variants = (
+        (),
+        (category("gross_primer_pocket_treatment", "included"), category("target_primer_pocket_treatment", "excluded")),
+        (category("gross_primer_pocket_treatment", "unknown"), category("target_primer_pocket_treatment", "excluded")),
+        (category("gross_primer_pocket_treatment", "excluded"), category("target_primer_pocket_treatment", "excluded"), candidate("primer_pocket_correction", 0.1, Unit.CUBIC_CENTIMETRE, InputCandidateKind.PRIMER_POCKET_CAPACITY)),
+        (category("base_geometry", "flat_base"), candidate("seated_intrusion", 5, Unit.MILLIMETRE)),
+        (category("base_geometry", "partial_boat_tail"), candidate("boat_tail_base_diameter", 8.0, Unit.MILLIMETRE), candidate("boat_tail_axial_length", 4, Unit.MILLIMETRE), candidate("seated_intrusion", 5, Unit.MILLIMETRE)),
+        (category("base_geometry", "full_boat_tail"), candidate("boat_tail_base_diameter", 6.2, Unit.MILLIMETRE), candidate("boat_tail_axial_length", 4, Unit.MILLIMETRE), candidate("seated_intrusion", 2, Unit.MILLIMETRE)),
+        (category("base_geometry", "complex_rebated_tail"),),
+        (InputCandidate("SYNTHETIC-M03-DIAMETER-2", "diameter", InputCandidateKind.PHYSICAL_VALUE, "SYNTHETIC-M03-RECORD-DIAMETER-2", provenance(), Quantity(7.6, Unit.MILLIMETRE)),),
+    )
+    return [
+        InputBundle(f"SYNTHETIC-M03-BUNDLE-{index}", shared[: index % (len(shared) + 1)] + extra, provenance(), "synthetic diagnostic fixture")
+        for index, extra in enumerate(variants)
+    ]
+
+
+def test_batch_evaluation_matches_pairwise_evaluation_for_every_production_set():
+    bundles = bundle_corpus()
+    sets = production_requirement_sets()
+    batch = list(evaluate_input_completeness_batch(bundles))
+    expected = [
+        evaluate_input_completeness(required, item, record_id=f"{item.record_id}:{required.requirement_set_id}:v{required.version}")
+        for item in bundles for required in sets
+    ]
+    assert batch == expected
+    assert {status for result in batch for status in statuses(result).values()} >= {
+        CompletenessStatus.SATISFIED, CompletenessStatus.MISSING, CompletenessStatus.INDETERMINATE,
+        CompletenessStatus.MUTUALLY_INCONSISTENT, CompletenessStatus.INVALID_VALUE_DOMAIN,
+        CompletenessStatus.CONFLICTING_SUPPLIED_VALUES, CompletenessStatus.UNSUPPORTED_ALTERNATIVE,
+    }
+
+
+def test_batch_evaluation_is_lazy_and_accepts_explicit_sets_and_record_ids():
+    required = (requirement_set("circle_area"),)
+    results = evaluate_input_completeness_batch(iter(bundle_corpus()), required, record_id=lambda rs, item: f"SYNTHETIC-M03-EVAL-{item.record_id}")
+    first = next(results)
+    assert first.record_id == "SYNTHETIC-M03-EVAL-SYNTHETIC-M03-BUNDLE-0"
+    assert first == evaluate_input_completeness(required[0], bundle_corpus()[0], record_id=first.record_id)
+    assert len(list(results)) == len(bundle_corpus()) - 1
+
+
+def test_compiled_plan_precomputes_branch_dispatch_and_rule_positions():
+    required = requirement_set("seated_projectile_displacement")
+    plan = compile_requirement_set(required)
+    ids = [item.requirement_id for item in required.requirements]
+    assert compile_requirement_set(requirement_set("seated_projectile_displacement")) is plan
+    assert dict(plan.branch_by_selector_value) == {item.selector_value: item.branch_id for item in required.branches}
+    active = {ids[index] for index, item in enumerate(required.requirements) if item.kind is RequirementKind.CONDITIONAL and index not in plan.inactive_by_branch["flat_base"]}
+    assert active == {"flat_shank_diameter", "flat_intrusion"}
+    assert {branch: (ids[a], ids[b]) for branch, (a, b) in plan.boat_tail_positions.items()} == {
+        "partial_boat_tail": ("partial_intrusion", "partial_tail_base_diameter"),
+        "full_boat_tail": ("full_intrusion", "full_tail_base_diameter"),
+    }
+    assert plan.primer_correction_position is None
+    primer = requirement_set("geometric_usable_powder_space")
+    assert primer.requirements[compile_requirement_set(primer).primer_correction_position].requirement_id == "primer_pocket_correction"
+    with pytest.raises(TypeError):
+        plan.inactive_by_branch["flat_base"] = frozenset()
+
+
+def test_changed_set_under_a_cached_identity_and_version_is_recompiled():
+    original = requirement_set("circle_area")
+    plan = compile_requirement_set(original)
+    widened = replace(original, requirements=(replace(original.requirements[0], accepted_candidate_kinds=(InputCandidateKind.PHYSICAL_VALUE, InputCandidateKind.PRIMER_POCKET_CAPACITY)),))
+    supplied = bundle(candidate("diameter", 7.62, Unit.MILLIMETRE, InputCandidateKind.PRIMER_POCKET_CAPACITY))
+    assert compile_requirement_set(widened) is not plan
+    assert evaluate_input_completeness(widened, supplied, record_id="SYNTHETIC-M03-EVAL-WIDENED").all_declared_conditions_satisfied
+    assert statuses(evaluate_input_completeness(original, supplied, record_id="SYNTHETIC-M03-EVAL-ORIGINAL"))["diameter"] is CompletenessStatus.WRONG_RECORD_TYPE
+
+
+def test_plan_cache_hits_by_identity_without_comparing_sets_and_stays_bounded(monkeypatch):
+    import modern_powley.modernized.input_completeness as completeness
+
+    original = requirement_set("circle_area")
+    assert production_requirement_sets() is production_requirement_sets()
+    plan = compile_requirement_set(original)
+
+    def refuse(self, other):
+        raise AssertionError("plan lookup compared requirement sets")
+
+    monkeypatch.setattr(RequirementSet, "__eq__", refuse)
+    assert compile_requirement_set(original) is plan
+    copy = replace(original)
+    assert compile_requirement_set(copy) is not plan
+    assert compile_requirement_set(copy) is compile_requirement_set(copy)
+    monkeypatch.undo()
+    for version in range(2, completeness._PLAN_CACHE_SIZE + 10):
+        compile_requirement_set(replace(original, version=version))
+    assert len(completeness._PLANS) == completeness._PLAN_CACHE_SIZE
+    assert ("circle_area", 2) not in completeness._PLANS
@@ -0,0 +1,48 @@
+import importlib
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+import modern_powley.modernized as modernized
+
+
+def run(code):
+    env = os.environ | {"PYTHONPATH": os.pathsep.join(("src", os.environ.get("PYTHONPATH", "")))}
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+
+
+def loaded_modules(code):
+    return set(run(f"{code}; import sys; print(*sys.modules)").stdout.split())
+
+
+def test_package_import_loads_no_submodule_or_numpy():
+    modules = loaded_modules("import modern_powley.modernized")
+    assert "modern_powley.modernized" in modules
+    assert not [name for name in modules if name.startswith("modern_powley.modernized.")]
+    assert not {"numpy", "pandas"} & modules
+
+
+def test_first_access_imports_only_the_defining_module_chain():
+    code = "import sys; from modern_powley.modernized import Provenance, loads_m02_record; print(*sys.modules)"
+    loaded = {name.removeprefix("modern_powley.modernized.") for name in run(code).stdout.split() if name.startswith("modern_powley.modernized.")}
+    assert {"provenance", "m02_serialization"} <= loaded
+    assert not loaded & {"charge_regions", "m05_serialization", "screening_criteria", "criterion_evaluation", "physical_value_table"}
+
+
+def test_lazy_surface_matches_defining_modules():
+    assert len(modernized.__all__) == len(set(modernized.__all__))
+    assert set(modernized.__all__) <= set(dir(modernized))
+    for name in modernized.__all__:
+        value = getattr(modernized, name)
+        if isinstance(value, types.ModuleType):
+            assert value is importlib.import_module(f"modern_powley.modernized.{name}")
+        else:
+            assert value is getattr(importlib.import_module(f"modern_powley.modernized.{modernized._ORIGINS[name]}"), name)
+    namespace = {}
+    exec("from modern_powley.modernized import *", namespace)
+    assert set(modernized.__all__) <= set(namespace)
+    with pytest.raises(AttributeError, match="no attribute 'EMPIRICAL_LOAD_EVIDENCE_SCHEMA_ID'"):
+        modernized.EMPIRICAL_LOAD_EVIDENCE_SCHEMA_ID
@@ -0,0 +1,128 @@
+import json
+import os
+
+import pytest
+
+from modern_powley.modernized.jsonl import tagged_record_to_dict
+from modern_powley.modernized.record_validation import (
+    ChangeDetection,
+    FileStatus,
+    load_manifest,
+    main,
+    validate_record_tree,
+    write_manifest,
+)
+from tests.unit.test_jsonl import mixed_records
+
+
+def record_tree(root):
+    records = mixed_records()
+    for index, record in enumerate(records):
+        folder = root / ("evidence" if index % 2 else "milestones")
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"record-{index:02d}.json").write_text(json.dumps(tagged_record_to_dict(record), indent=2, sort_keys=True), encoding="utf-8")
+    (root / "milestones" / "broken.json").write_text('{"schema": "modern_powley.m05.v1", "record_type": "charge_region_record"}', encoding="utf-8")
+    (root / "milestones" / "nan.json").write_text('{"schema": "modern_powley.m01.v1", "value": NaN}', encoding="utf-8")
+    (root / "notes.txt").write_text("not a record", encoding="utf-8")
+    return records
+
+
+def test_tree_results_match_strict_loaders_serially_and_in_parallel(tmp_path):
+    records = record_tree(tmp_path)
+    serial = validate_record_tree(tmp_path, workers=1)
+    parallel = validate_record_tree(tmp_path, workers=2, shard_size=3)
+    assert serial == parallel
+    assert [item.path for item in serial] == sorted(item.path for item in serial)
+    invalid = {item.path: item for item in serial if item.status is FileStatus.INVALID}
+    assert set(invalid) == {"milestones/broken.json", "milestones/nan.json"}
+    assert invalid["milestones/broken.json"].schema == "modern_powley.m05.v1"
+    assert invalid["milestones/broken.json"].record_type == "charge_region_record"
+    assert "non-finite" in invalid["milestones/nan.json"].error
+    valid = [item for item in serial if item.status is FileStatus.VALID]
+    assert len(valid) == len(records)
+    assert {item.record_type for item in valid} == {tagged_record_to_dict(record)["record_type"] for record in records}
+
+
+@pytest.mark.parametrize("detection", list(ChangeDetection))
+def test_changed_only_mode_skips_files_matching_the_manifest(tmp_path, detection):
+    record_tree(tmp_path / "tree")
+    manifest = tmp_path / "manifest.json"
+    write_manifest(manifest, validate_record_tree(tmp_path / "tree", workers=1))
+    edited = tmp_path / "tree" / "evidence" / "record-05.json"
+    text = edited.read_text(encoding="utf-8")
+    assert '"synthetic_fixture": true' in text
+    edited.write_text(text.replace('"synthetic_fixture": true', '"synthetic_fixture": 1'), encoding="utf-8")
+    os.utime(edited, ns=(1, 1))
+    rerun = {item.path: item for item in validate_record_tree(tmp_path / "tree", workers=1, manifest=load_manifest(manifest), changed_only=detection)}
+    assert rerun["evidence/record-05.json"].status is FileStatus.INVALID
+    assert rerun["milestones/broken.json"].status is FileStatus.INVALID
+    unchanged = [item for item in rerun.values() if item.status is FileStatus.UNCHANGED]
+    assert len(unchanged) == len(rerun) - 3 and all(item.schema for item in unchanged)
+
+
+def test_manifest_from_another_validator_version_is_ignored(tmp_path, monkeypatch):
+    import modern_powley.modernized.record_validation as validation
+
+    record_tree(tmp_path / "tree")
+    manifest = tmp_path / "manifest.json"
+    write_manifest(manifest, validate_record_tree(tmp_path / "tree", workers=1))
+    assert load_manifest(manifest)
+    monkeypatch.setattr(validation, "RECORD_VALIDATOR_VERSION", 2)
+    assert load_manifest(manifest) == {}
+    assert load_manifest(tmp_path / "missing.json") == {}
+
+
+def test_command_reports_json_lines_and_exit_status(tmp_path, capsys):
+    record_tree(tmp_path / "tree")
+    manifest = tmp_path / "manifest.json"
+    assert main([str(tmp_path / "tree"), "--workers", "1", "--manifest", str(manifest)]) == 1
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert {line["status"] for line in lines} == {"valid", "invalid"}
+    for name in ("broken.json", "nan.json"):
+        (tmp_path / "tree" / "milestones" / name).unlink()
+    assert main([str(tmp_path / "tree"), "--workers", "1", "--manifest", str(manifest), "--changed-only", "hash"]) == 0
+    assert {json.loads(line)["status"] for line in capsys.readouterr().out.splitlines()} == {"unchanged"}
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "tree"), "--changed-only", "mtime"])
+    with pytest.raises(ValueError, match="workers"):
+        validate_record_tree(tmp_path, workers=0)
+
+
+def test_unreadable_files_are_invalid_results_not_aborted_runs(tmp_path):
+    records = record_tree(tmp_path / "tree")
+    (tmp_path / "tree" / "evidence" / "folder.json").mkdir()
+    manifest = {item.path: item for item in validate_record_tree(tmp_path / "tree", workers=1) if item.path == "evidence/folder.json"}
+    for results in (validate_record_tree(tmp_path / "tree", workers=2, shard_size=2), validate_record_tree(tmp_path / "tree", workers=1, manifest=manifest, changed_only=ChangeDetection.HASH)):
+        outcome = {item.path: item for item in results}
+        assert outcome["evidence/folder.json"].status is FileStatus.INVALID
+        assert outcome["evidence/folder.json"].error.startswith("unreadable record file")
+        assert outcome["evidence/folder.json"].sha256 is None
+        assert sum(item.status is FileStatus.VALID for item in results) == len(records)
+
+
+@pytest.mark.parametrize("text", ["", "{", "[]", '{"validator_version": 1}', '{"validator_version": 1, "files": [{"path": "a.json"}]}', '{"validator_version": 1, "files": 3}'])
+def test_corrupt_or_partial_manifest_means_full_revalidation(tmp_path, text):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(text, encoding="utf-8")
+    assert load_manifest(manifest) == {}
+    assert load_manifest(tmp_path) == {}
+
+
+def test_verdicts_are_those_of_each_milestones_own_loader(tmp_path):
+    from modern_powley.modernized.empirical_load_serialization import loads_empirical_load_record
+    from modern_powley.modernized.jsonl import tagged_record_loader
+    from modern_powley.modernized.serialization import loads_record
+
+    records = mixed_records()
+    cartridge, evidence = records[0], records[-1]
+    for name, record in (("m01.json", cartridge), ("evidence.json", evidence)):
+        text = json.dumps(tagged_record_to_dict(record), sort_keys=True)
+        (tmp_path / name).write_text('{"schema": ' + json.dumps(tagged_record_to_dict(record)["schema"]) + ", " + text[1:], encoding="utf-8")
+    m01 = (tmp_path / "m01.json").read_text(encoding="utf-8")
+    assert loads_record(m01) == cartridge
+    with pytest.raises(ValueError, match="duplicate"):
+        loads_empirical_load_record((tmp_path / "evidence.json").read_text(encoding="utf-8"))
+    assert tagged_record_loader("modern_powley.m01.v1") is loads_record
+    outcome = {item.path: item for item in validate_record_tree(tmp_path, workers=1)}
+    assert outcome["m01.json"].status is FileStatus.VALID
+    assert outcome["evidence.json"].status is FileStatus.INVALID and "duplicate" in outcome["evidence.json"].error
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modern_powley.later import davis
+from modern_powley.later.davis_batch import compiled_table4, run_davis_batch
+from modern_powley.later.emulator_batch import emulator_chain_batch
+from modern_powley.later.sensitivity import (
+    DAVIS_SENSITIVITY_INPUTS,
+    EMULATOR_SENSITIVITY_INPUTS,
+    _table4_slopes,
+    davis_sensitivity,
+    emulator_sensitivity,
+)
+
+ROWS = {
+    "case_length_inches": [2.015, 2.494, 2.015],
+    "bullet_length_inches": [1.2, 1.35, 1.1],
+    "cartridge_oal_inches": [2.8, 3.3, 2.75],
+    "gross_case_capacity_water_grains": [56.0, 68.0, 54.0],
+    "bullet_diameter_inches": [0.308, 0.308, 0.308],
+    "bullet_weight_grains": [150.0, 180.0, 165.0],
+    "barrel_length_from_bolt_face_inches": [24.0, 26.0, 22.0],
+    "powder_designation": ["IMR 4064", "IMR 4350", "IMR 4895"],
+    "boat_tail_height_inches": [0.15, np.nan, 0.12],
+    "boat_tail_small_diameter_inches": [0.26, np.nan, 0.25],
+}
+GEOMETRY = ("gross_case_capacity_water_grains", "case_length_inches", "bullet_length_inches", "cartridge_oal_inches", "barrel_length_from_bolt_face_inches", "bullet_weight_grains", "bullet_diameter_inches")
+
+
+def _central_difference(output, name, step=1e-6):
+    base = pd.DataFrame(ROWS)
+    results = []
+    for sign in (1.0, -1.0):
+        shifted = base.copy()
+        shifted[name] = shifted[name] * (1.0 + sign * step)
+        results.append(run_davis_batch(shifted, table4_lookup=True).columns[output])
+    return (results[0] - results[1]) / (2.0 * step * base[name].to_numpy())
+
+
+@pytest.mark.parametrize("output", ["expansion_ratio", "muzzle_velocity_fps", "table4_f2", "historical_crusher_pressure"])
+@pytest.mark.parametrize("name", GEOMETRY)
+def test_davis_derivatives_match_central_differences(output, name):
+    report = davis_sensitivity(pd.DataFrame(ROWS), table4_lookup=True)
+    np.testing.assert_allclose(report.partial(output, name), _central_difference(output, name), rtol=1e-5, atol=1e-9)
+
+
+def test_davis_boat_tail_derivatives_vanish_for_flat_base_rows():
+    report = davis_sensitivity(pd.DataFrame(ROWS), table4_lookup=True)
+    assert report.partial("muzzle_velocity_fps", "boat_tail_height_inches")[1] == 0.0
+    assert report.partial("muzzle_velocity_fps", "boat_tail_height_inches")[0] > 0.0
+
+
+def test_davis_charge_partial_holds_geometry_fixed():
+    report = davis_sensitivity(pd.DataFrame(ROWS))
+    charge = report.input_values["charge_weight_grains"][0]
+    bullet = ROWS["bullet_weight_grains"][0]
+    n_value = davis.velocity_fraction_n(davis.velocity_fraction_m(report.outputs["expansion_ratio"][0]))
+    step = 1e-4
+    velocity = lambda grains: davis.muzzle_velocity_fps(grains, n_value, davis.effective_moving_weight_grains(bullet, grains))
+    expected = (velocity(charge + step) - velocity(charge - step)) / (2.0 * step)
+    assert report.partial("muzzle_velocity_fps", "charge_weight_grains")[0] == pytest.approx(expected, rel=1e-7)
+    assert "historical_crusher_pressure" not in report.outputs
+
+
+def test_davis_supplied_f2_is_held_fixed_and_rejected_rows_are_nan():
+    rows = dict(ROWS, table4_f2=[1.1, 1.2, 1.3], bullet_weight_grains=[150.0, -1.0, 165.0])
+    report = davis_sensitivity(rows)
+    assert np.all(report.derivatives["table4_f2"][[0, 2]] == 0.0)
+    assert np.isnan(report.derivatives["muzzle_velocity_fps"][1]).all()
+    assert report.errors
+
+
+def test_elasticity_table_is_one_row_per_catalogue_entry():
+    report = davis_sensitivity(pd.DataFrame(ROWS), table4_lookup=True)
+    frame = report.to_frame("historical_crusher_pressure")
+    assert list(frame.columns) == list(DAVIS_SENSITIVITY_INPUTS)
+    assert frame.shape == (3, len(DAVIS_SENSITIVITY_INPUTS))
+    expected = report.partial("historical_crusher_pressure", "barrel_length_from_bolt_face_inches") * np.array(ROWS["barrel_length_from_bolt_face_inches"]) / report.outputs["historical_crusher_pressure"]
+    np.testing.assert_allclose(frame["barrel_length_from_bolt_face_inches"], expected)
+
+
+def test_table4_slopes_are_piecewise_bilinear_inside_a_cell():
+    table = davis.load_table4()
+    a = (table.mass_ratios[2] + table.mass_ratios[3]) / 2.0
+    r = (table.expansion_ratios[4] + table.expansion_ratios[5]) / 2.0
+    by_a, by_r = _table4_slopes(np.array([a]), np.array([r]), compiled_table4())
+    step = 1e-6
+    assert by_a[0] == pytest.approx((davis.lookup_table4_f2(a + step, r) - davis.lookup_table4_f2(a - step, r)) / (2 * step), rel=1e-6)
+    assert by_r[0] == pytest.approx((davis.lookup_table4_f2(a, r + step) - davis.lookup_table4_f2(a, r - step)) / (2 * step), rel=1e-6)
+
+
+EMULATOR = (
+    np.array([56.0, 68.0]),
+    np.array([2.015, 2.494]),
+    np.array([1.2, 1.35]),
+    np.array([2.8, 3.3]),
+    np.array([24.0, 26.0]),
+    np.array([150.0, 180.0]),
+    np.array([0.308, 0.308]),
+)
+
+
+@pytest.mark.parametrize("output", ["total_expansion_ratio", "velocity_fps", "pressure_cup", "claimed_psi"])
+@pytest.mark.parametrize("position", range(7))
+def test_emulator_derivatives_match_central_differences(output, position):
+    report = emulator_sensitivity(*EMULATOR)
+    step = 1e-6
+    shifted = [list(EMULATOR), list(EMULATOR)]
+    shifted[0][position] = EMULATOR[position] * (1.0 + step)
+    shifted[1][position] = EMULATOR[position] * (1.0 - step)
+    upper, lower = (getattr(emulator_chain_batch(*inputs), output) for inputs in shifted)
+    expected = (upper - lower) / (2.0 * step * EMULATOR[position])
+    np.testing.assert_allclose(report.partial(output, EMULATOR_SENSITIVITY_INPUTS[position]), expected, rtol=1e-5, atol=1e-9)
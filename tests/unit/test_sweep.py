@@ -0,0 +1,97 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from modern_powley.later import emulator, emulator_batch
+from modern_powley.later.davis_batch import run_davis_batch
+from modern_powley.later.emulator_batch import emulator_chain_batch, velocity_fps_batch
+from modern_powley.later.sweep import sweep, sweep_davis
+
+EMULATOR_FIXED = {
+    "gross_capacity_water_grains": 69.0,
+    "case_length_inches": 2.49,
+    "bullet_length_inches": 1.07,
+    "bullet_weight_grains": 150.0,
+    "bullet_diameter_inches": 0.308,
+}
+
+
+def test_emulator_chain_sweep_matches_flattened_batch_cell_by_cell():
+    axes = {"barrel_length_inches": np.array([1.0, 18.0, 22.0, 26.0]), "cartridge_length_inches": np.array([3.0, 3.2, 3.4, 3.7])}
+    result = sweep(emulator_chain_batch, axes, EMULATOR_FIXED)
+    assert result.shape == (4, 4)
+    cells = list(itertools.product(*axes.values()))
+    flat = emulator_chain_batch(
+        EMULATOR_FIXED["gross_capacity_water_grains"],
+        EMULATOR_FIXED["case_length_inches"],
+        EMULATOR_FIXED["bullet_length_inches"],
+        [cartridge for _, cartridge in cells],
+        [barrel for barrel, _ in cells],
+        EMULATOR_FIXED["bullet_weight_grains"],
+        EMULATOR_FIXED["bullet_diameter_inches"],
+    )
+    for name, values in result.values.items():
+        assert np.array_equal(values.ravel(), getattr(flat, name), equal_nan=True), name
+    assert np.array_equal(result.invalid.ravel(), flat.invalid)
+    assert result.reasons[0, 0] == "emulator bullet travel must be positive"
+    assert result.reasons[1, 3] == "emulator seating depth is negative"
+    frame = result.to_frame()
+    assert frame.index.names == ["barrel_length_inches", "cartridge_length_inches"]
+    assert frame.loc[(22.0, 3.2), "velocity_fps"] == result.values["velocity_fps"][2, 1]
+
+
+def test_axis_independent_terms_are_evaluated_once(monkeypatch):
+    shapes = []
+    original = emulator_batch._sectional_density
+
+    def spy(rows, bullet_weight, diameter):
+        value = original(rows, bullet_weight, diameter)
+        shapes.append(np.shape(value))
+        return value
+
+    monkeypatch.setattr(emulator_batch, "_sectional_density", spy)
+    axes = {"barrel_length_inches": np.linspace(18.0, 30.0, 25), "cartridge_length_inches": np.linspace(3.0, 3.4, 9)}
+    result = sweep(emulator_chain_batch, axes, EMULATOR_FIXED)
+    assert shapes == [()]
+    assert result.values["powder_index"].shape == (25, 9)
+
+
+def test_charge_weight_sweep_of_scalar_velocity_function():
+    charges = np.arange(40.0, 50.0, 0.5)
+    ratios = np.array([0.9, 7.5, 9.0])
+    result = sweep(velocity_fps_batch, {"charge_weight_grains": charges, "total_expansion_ratio": ratios}, {"bullet_weight_grains": 150.0})
+    for (i, charge), (j, ratio) in itertools.product(enumerate(charges), enumerate(ratios)):
+        if ratio <= 1:
+            assert result.invalid[i, j]
+        else:
+            assert result.values["values"][i, j] == emulator.velocity_fps(charge, 150.0, ratio)
+
+
+def test_davis_sweep_over_powder_and_barrel_matches_flattened_batch():
+    fixed = {
+        "case_length_inches": 2.494,
+        "bullet_length_inches": 1.2,
+        "cartridge_oal_inches": 3.34,
+        "gross_case_capacity_water_grains": 69.0,
+        "bullet_diameter_inches": 0.308,
+        "bullet_weight_grains": 150.0,
+    }
+    axes = {"powder_designation": np.array(["IMR 4064", "IMR 4198", "IMR 7828"]), "barrel_length_from_bolt_face_inches": np.array([20.0, 24.0, 90.0])}
+    result = sweep_davis(axes, fixed, table4_lookup=True)
+    cells = list(itertools.product(*axes.values()))
+    flat = run_davis_batch({**fixed, "powder_designation": [powder for powder, _ in cells], "barrel_length_from_bolt_face_inches": [barrel for _, barrel in cells]}, table4_lookup=True)
+    for name, values in result.values.items():
+        assert np.array_equal(values.ravel(), flat.columns[name], equal_nan=True), name
+    assert result.reasons.ravel().tolist() == flat.reasons.tolist()
+    assert result.reasons[2, 0] == "powder_designation must be one of the evidenced Davis IMR powders"
+    assert result.reasons[0, 2] == "expansion_ratio is outside Davis Table 4"
+
+
+def test_sweep_rejects_ambiguous_inputs():
+    with pytest.raises(ValueError, match="both swept and fixed"):
+        sweep(velocity_fps_batch, {"charge_weight_grains": [40.0]}, {"charge_weight_grains": 40.0})
+    with pytest.raises(ValueError, match="must be a scalar"):
+        sweep(velocity_fps_batch, {"charge_weight_grains": [40.0]}, {"bullet_weight_grains": [150.0], "total_expansion_ratio": 9.0})
+    with pytest.raises(ValueError, match="one-dimensional"):
+        sweep(velocity_fps_batch, {"charge_weight_grains": [[40.0]]}, {"bullet_weight_grains": 150.0, "total_expansion_ratio": 9.0})
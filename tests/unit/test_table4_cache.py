@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from modern_powley.later import davis, table4_cache
+from modern_powley.later.davis_batch import compiled_table4, lookup_table4_f2_batch
+from modern_powley.later.table4_cache import load_table4_cache, table4_cache_path, write_table4_cache
+
+
+def test_cached_table4_is_memory_mapped_and_identical_to_validated_csv(tmp_path):
+    cached = load_table4_cache(tmp_path)
+    reference = compiled_table4()
+    assert isinstance(cached.f2, np.memmap)
+    assert cached.table == reference.table
+    for name in ("mass_ratios", "expansion_ratios", "f2", "f2_steps"):
+        assert np.array_equal(getattr(cached, name), getattr(reference, name))
+    a_values = np.linspace(0.2, 1.0, 97)
+    r_values = np.linspace(5.0, 13.0, 97)
+    assert np.array_equal(lookup_table4_f2_batch(a_values, r_values, table4=cached).values, lookup_table4_f2_batch(a_values, r_values).values)
+
+
+def test_matching_cache_skips_csv_validation(tmp_path, monkeypatch):
+    write_table4_cache(tmp_path)
+
+    def refuse():
+        raise AssertionError("validation must not rerun for a matching cache")
+
+    monkeypatch.setattr(davis, "load_table4", refuse)
+    monkeypatch.setattr(davis, "_parse_table4", refuse)
+    assert load_table4_cache(tmp_path).f2.shape == (34, 9)
+
+
+def test_cache_validates_the_hashed_bytes_not_the_process_cached_table(tmp_path, monkeypatch):
+    davis.load_table4()
+    altered = tmp_path / "table4.csv"
+    altered.write_bytes(davis.TABLE4_PATH.read_bytes().replace(b",medium,", b",high,", 1))
+    monkeypatch.setattr(davis, "TABLE4_PATH", altered)
+    with pytest.raises(ValueError, match="provenance"):
+        write_table4_cache(tmp_path / "cache")
+    with pytest.raises(ValueError, match="provenance"):
+        load_table4_cache(tmp_path / "cache")
+    assert not list((tmp_path / "cache").glob("*.bin"))
+
+
+def test_changed_csv_or_validator_version_rebuilds_under_a_new_key(tmp_path, monkeypatch):
+    original = write_table4_cache(tmp_path)
+    altered = tmp_path / "table4.csv"
+    altered.write_bytes(davis.TABLE4_PATH.read_bytes() + b"\n")
+    monkeypatch.setattr(davis, "TABLE4_PATH", altered)
+    davis.load_table4.cache_clear()
+    try:
+        rebuilt = table4_cache_path(tmp_path)
+        assert rebuilt != original and not rebuilt.exists()
+        load_table4_cache(tmp_path)
+        assert rebuilt.exists()
+        monkeypatch.setattr(davis, "TABLE4_VALIDATOR_VERSION", davis.TABLE4_VALIDATOR_VERSION + 1)
+        assert table4_cache_path(tmp_path) != rebuilt
+    finally:
+        davis.load_table4.cache_clear()
+
+
+@pytest.mark.parametrize("damage", ["payload", "truncate", "header"])
+def test_damaged_cache_falls_back_to_full_validation(tmp_path, damage):
+    path = write_table4_cache(tmp_path)
+    data = bytearray(path.read_bytes())
+    if damage == "payload":
+        data[-1] ^= 0xFF
+    elif damage == "truncate":
+        del data[-8:]
+    else:
+        data[:8] = b"NOTTABLE"
+    path.write_bytes(bytes(data))
+    assert table4_cache._read(path, table4_cache.table4_csv_sha256()) is None
+    assert np.array_equal(load_table4_cache(tmp_path).f2, compiled_table4().f2)
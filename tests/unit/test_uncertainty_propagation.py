@@ -0,0 +1,177 @@
+import time
+
+import numpy as np
+import pytest
+
+from modern_powley.later.uncertainty_propagation import (
+    DeclaredDistribution,
+    SamplingDistribution,
+    barrel_swept_volume_samples,
+    expansion_ratio_from_geometry_samples,
+    expansion_ratio_inputs,
+    propagate,
+    total_expansion_ratio_samples,
+    uncertainty_bounds,
+    usable_powder_space_inputs,
+    usable_powder_space_samples,
+)
+from modern_powley.modernized.geometry import (
+    barrel_swept_volume,
+    boat_tail_seated_displacement,
+    estimate_geometric_usable_powder_space,
+    flat_base_seated_displacement,
+    total_expansion_ratio,
+)
+from modern_powley.modernized.provenance import EvidenceClass, ModelMaturity, Provenance, ValueOrigin
+from modern_powley.modernized.records import (
+    CapacityFillBoundary,
+    CaseCondition,
+    DiameterConvention,
+    FirearmRecord,
+    GeometryAdequacy,
+    GrossCaseCapacity,
+    MeasurementConditions,
+    PhysicalValue,
+    PrimerPocketTreatment,
+    PrimerPocketVolume,
+    ProjectileRecord,
+    ProjectileTravel,
+    SeatingDepth,
+    SeatingDepthKind,
+)
+from modern_powley.modernized.uncertainty import Uncertainty, UncertaintyKind
+from modern_powley.modernized.units import Quantity, Unit
+
+UNIFORM = DeclaredDistribution(SamplingDistribution.UNIFORM, "rectangular over the instrument bound")
+
+
+def pv(record_id, value, unit, half_width=None):
+    uncertainty = Uncertainty.unknown() if half_width is None else Uncertainty(UncertaintyKind.SYMMETRIC_ABSOLUTE, magnitude=Quantity(half_width, unit))
+    return PhysicalValue(record_id, Quantity(value, unit), Provenance(EvidenceClass.USER_MEASUREMENT, ValueOrigin.MEASURED, "MEAS-1", ModelMaturity.RETAINED_CANDIDATE), uncertainty)
+
+
+def records(gross_half_width=0.01, boat_tail=False):
+    conditions = MeasurementConditions(CaseCondition.FIRED_UNSIZED, PrimerPocketTreatment.INCLUDED, CapacityFillBoundary.CASE_MOUTH, "water condition explicitly unknown")
+    gross = GrossCaseCapacity("GROSS-1", "CARTRIDGE-1", pv("PV-GROSS-MASS", 50, Unit.GRAIN), conditions, pv("PV-GROSS-VOL", 3.5, Unit.CUBIC_CENTIMETRE, gross_half_width), "CONV-SUPPLIED-DENSITY")
+    seating = SeatingDepth(pv("PV-SEATING", 0.8, Unit.CENTIMETRE, 0.005), SeatingDepthKind.DIRECT, "projectile base to case-mouth plane")
+    tail = {"boat_tail_length": pv("PV-TAIL", 0.5, Unit.CENTIMETRE, 0.002), "boat_tail_base_diameter": pv("PV-BASE", 0.6, Unit.CENTIMETRE, 0.002)} if boat_tail else {}
+    projectile = ProjectileRecord("PROJECTILE-1", "test", pv("PV-MASS", 150, Unit.GRAIN), pv("PV-DIA", 0.782, Unit.CENTIMETRE, 0.001), GeometryAdequacy.ADEQUATE_FOR_DECLARED_MODEL, seating_depth=seating, cylindrical_shank_diameter=pv("PV-SHANK", 0.782, Unit.CENTIMETRE, 0.001), **tail)
+    travel = ProjectileTravel(pv("PV-TRAVEL", 56.0, Unit.CENTIMETRE, 0.05), "seated projectile base", "muzzle")
+    firearm = FirearmRecord("FIREARM-1", "test rifle", pv("PV-BARREL", 61.0, Unit.CENTIMETRE), "bolt face to muzzle", bore_diameter=pv("PV-BORE", 0.762, Unit.CENTIMETRE, 0.001), projectile_travel=travel)
+    return gross, projectile, firearm
+
+
+def distributions(inputs, declared=UNIFORM):
+    return {value.record_id: declared for value in inputs.values()}
+
+
+def test_bounds_follow_each_declared_uncertainty_kind():
+    symmetric = pv("PV-S", 10.0, Unit.METRE, 0.5)
+    resolution = PhysicalValue("PV-R", Quantity(10.0, Unit.METRE), symmetric.provenance, Uncertainty(UncertaintyKind.INSTRUMENT_RESOLUTION, magnitude=Quantity(0.2, Unit.METRE)))
+    bounded = PhysicalValue("PV-B", Quantity(10.0, Unit.METRE), symmetric.provenance, Uncertainty(UncertaintyKind.BOUNDED_INTERVAL, lower=Quantity(9.0, Unit.METRE), upper=Quantity(10.5, Unit.METRE)))
+    assert uncertainty_bounds(symmetric) == (9.5, 10.5)
+    assert uncertainty_bounds(resolution) == (9.9, 10.1)
+    assert uncertainty_bounds(bounded) == (9.0, 10.5)
+    assert uncertainty_bounds(pv("PV-U", 10.0, Unit.METRE)) is None
+
+
+def test_declared_distribution_requires_justification():
+    with pytest.raises(ValueError, match="justification"):
+        DeclaredDistribution(SamplingDistribution.UNIFORM, " ")
+
+
+def test_kernels_match_scalar_geometry_at_nominal_values():
+    for boat_tail in (False, True):
+        gross, projectile, firearm = records(boat_tail=boat_tail)
+        inputs = expansion_ratio_inputs(gross, projectile, firearm, PrimerPocketTreatment.INCLUDED, DiameterConvention.BORE)
+        nominal = {name: np.array([value.quantity.si_value]) for name, value in inputs.items()}
+        estimate = estimate_geometric_usable_powder_space(gross, projectile, PrimerPocketTreatment.INCLUDED, result_id="EST", assumptions=("test",))
+        barrel = barrel_swept_volume(firearm.bore_diameter, firearm.projectile_travel.value, DiameterConvention.BORE, result_id="VB")
+        ratio = total_expansion_ratio(barrel, estimate.usable_volume, result_id="R")
+        usable = {name: value for name, value in nominal.items() if name not in {"diameter", "travel"}}
+        assert usable_powder_space_samples(**usable)[0] == pytest.approx(estimate.usable_volume.quantity.si_value, rel=1e-14)
+        assert expansion_ratio_from_geometry_samples(**nominal)[0] == pytest.approx(ratio.quantity.si_value, rel=1e-14)
+
+
+def test_kernels_equal_scalar_geometry_on_random_inputs():
+    rng = np.random.default_rng(7)
+    for shank, base, tail, seated, diameter, travel in rng.uniform((0.4, 0.2, 0.1, 0.05, 0.4, 20.0), (0.9, 0.9, 0.8, 1.5, 0.9, 80.0), (400, 6)).tolist():
+        base = min(base, shank)
+        values = {name: pv(f"PV-{name.upper()}", value, Unit.CENTIMETRE) for name, value in (("shank", shank), ("base", base), ("tail", tail), ("seated", seated), ("diameter", diameter), ("travel", travel))}
+        si = {name: np.array([value.quantity.si_value]) for name, value in values.items()}
+        flat = flat_base_seated_displacement(values["shank"], values["seated"], result_id="FLAT").quantity.si_value
+        tailed = boat_tail_seated_displacement(values["shank"], values["base"], values["tail"], values["seated"], result_id="TAIL").quantity.si_value
+        barrel = barrel_swept_volume(values["diameter"], values["travel"], DiameterConvention.BORE, result_id="VB").quantity.si_value
+        # A gross volume of exactly twice the displacement makes the subtraction exact.
+        assert usable_powder_space_samples(np.array([2.0 * flat]), si["shank"], si["seated"])[0] == flat
+        assert usable_powder_space_samples(np.array([2.0 * tailed]), si["shank"], si["seated"], si["base"], si["tail"])[0] == tailed
+        assert barrel_swept_volume_samples(si["diameter"], si["travel"])[0] == barrel
+
+
+def test_unknown_uncertainty_stays_unknown_and_is_never_sampled():
+    gross, projectile, firearm = records(gross_half_width=None)
+    inputs = expansion_ratio_inputs(gross, projectile, firearm, PrimerPocketTreatment.INCLUDED, DiameterConvention.BORE)
+    summary = propagate(expansion_ratio_from_geometry_samples, inputs, {}, draws=1000, seed=1)
+    assert summary.unknown_record_ids == ("PV-GROSS-VOL",)
+    assert not summary.resolved
+    assert summary.draws == 0 and summary.mean is None and summary.percentiles == {}
+    assert summary.interval() is None
+
+
+def test_sampled_records_require_a_declared_distribution():
+    gross, projectile, firearm = records()
+    inputs = expansion_ratio_inputs(gross, projectile, firearm, PrimerPocketTreatment.INCLUDED, DiameterConvention.BORE)
+    partial = distributions(inputs)
+    del partial["PV-TRAVEL"]
+    with pytest.raises(ValueError, match="PV-TRAVEL"):
+        propagate(expansion_ratio_from_geometry_samples, inputs, partial, draws=10, seed=1)
+
+
+def test_propagation_is_seedable_and_independent_of_batch_size():
+    gross, projectile, firearm = records(boat_tail=True)
+    inputs = expansion_ratio_inputs(gross, projectile, firearm, PrimerPocketTreatment.INCLUDED, DiameterConvention.BORE)
+    declared = distributions(inputs, DeclaredDistribution(SamplingDistribution.TRIANGULAR, "peaked at the recorded value"))
+    whole = propagate(expansion_ratio_from_geometry_samples, inputs, declared, draws=10_000, seed=7, keep_samples=True)
+    batched = propagate(expansion_ratio_from_geometry_samples, inputs, declared, draws=10_000, seed=7, batch_size=333, keep_samples=True)
+    other = propagate(expansion_ratio_from_geometry_samples, inputs, declared, draws=10_000, seed=8, keep_samples=True)
+    np.testing.assert_array_equal(whole.samples, batched.samples)
+    assert whole.percentiles == batched.percentiles
+    assert not np.array_equal(whole.samples, other.samples)
+    lower, upper = whole.interval()
+    assert lower < whole.percentiles[50.0] < upper
+    assert whole.out_of_domain_draws == 0
+
+
+def test_shared_record_identity_shares_draws():
+    volume = pv("PV-V", 2.0, Unit.CUBIC_CENTIMETRE, 0.5)
+    summary = propagate(total_expansion_ratio_samples, {"barrel_volume": volume, "usable_powder_space_volume": volume}, {"PV-V": UNIFORM}, draws=1000, seed=3)
+    assert summary.minimum == summary.maximum == 2.0
+
+
+def test_uniform_draws_span_the_declared_bound_and_out_of_domain_draws_are_counted():
+    barrel = pv("PV-VB", 10.0, Unit.CUBIC_CENTIMETRE, 1.0)
+    usable = pv("PV-V0", 0.5, Unit.CUBIC_CENTIMETRE, 1.0)
+    inputs = {"barrel_volume": barrel, "usable_powder_space_volume": usable}
+    summary = propagate(total_expansion_ratio_samples, inputs, distributions(inputs), draws=20_000, seed=5, keep_samples=True)
+    assert summary.out_of_domain_draws == pytest.approx(20_000 / 4, rel=0.05)
+    assert np.isnan(summary.samples).sum() == summary.out_of_domain_draws
+    assert summary.minimum > 1.0
+
+
+def test_primer_pocket_correction_is_mapped_by_source_basis():
+    gross, projectile, _ = records()
+    pocket = PrimerPocketVolume("POCKET-1", "CARTRIDGE-1", pv("PV-POCKET", 0.02, Unit.CUBIC_CENTIMETRE, 0.001), PrimerPocketTreatment.INCLUDED)
+    inputs = usable_powder_space_inputs(gross, projectile, PrimerPocketTreatment.EXCLUDED, primer_pocket_volume=pocket)
+    assert inputs["primer_pocket_removal"] is pocket.volume
+    with pytest.raises(ValueError, match="primer-pocket volume"):
+        usable_powder_space_inputs(gross, projectile, PrimerPocketTreatment.EXCLUDED)
+
+
+@pytest.mark.benchmark
+def test_benchmark_million_draw_run_finishes_in_seconds():
+    gross, projectile, firearm = records(boat_tail=True)
+    inputs = expansion_ratio_inputs(gross, projectile, firearm, PrimerPocketTreatment.INCLUDED, DiameterConvention.BORE)
+    started = time.perf_counter()
+    summary = propagate(expansion_ratio_from_geometry_samples, inputs, distributions(inputs), draws=1_000_000, seed=11)
+    assert time.perf_counter() - started < 10.0
+    assert summary.resolved and summary.draws == 1_000_000